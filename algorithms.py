@@ -1,7 +1,12 @@
 import sys
 import random
 import time
+from array import array
 from dataclasses import dataclass
+from functools import partial
+from itertools import accumulate
+
+from workloads import generate_workload
 
 # İstersen dursun, ama artık RecursionError yaşamayacağız çünkü QuickSort iteratif.
 sys.setrecursionlimit(100000)
@@ -15,54 +20,125 @@ class Counters:
     Algoritmaların yaptığı işlemleri saymak için kullanılan basit sayaç sınıfı.
     - comparisons: karşılaştırma sayısı (if, <= vb.)
     - assignments: atama / kopyalama / swap sayısı
+    - bucket_ops : kova (histogram) işlemleri; yalnızca radix / counting sort
     Bu sayıları daha sonra "enerji karmaşıklığı" için vekil (proxy) olarak kullanacağız.
     """
     comparisons: int = 0     # karşılaştırma sayısı
     assignments: int = 0     # atama / kopyalama / swap sayısı
+    max_stack_depth: int = 0  # iteratif QuickSort'ta açık yığının ulaştığı en büyük derinlik
+    bytes_moved: int = 0      # bellek trafiği modeli: geçişlerin okuduğu + yazdığı bayt
+    cache_misses: int = 0     # aynı modele göre tahmini önbellek satırı kaçırma sayısı
+    bucket_ops: int = 0       # sayım artırma, önek toplamı ve kova konumu ilerletme
 
     def reset(self):
         """Sayaçları sıfırlar."""
         self.comparisons = 0
         self.assignments = 0
+        self.max_stack_depth = 0
+        self.bytes_moved = 0
+        self.cache_misses = 0
+        self.bucket_ops = 0
+
+
+# --------------------------------------------------
+# Ölçüm (instrumentation) modları
+# --------------------------------------------------
+# - "counted"  : her işlemde counters.<alan> += ... (orijinal davranış)
+# - "batched"  : sayımlar yerel int'lerde toplanır, her merge/partition
+#                çağrısının sonunda Counters'a TEK SEFERDE yazılır.
+#                Toplamlar "counted" ile birebir aynıdır.
+# - "uncounted": hiç sayım yapılmaz; saf algoritma süresi ölçülür.
+INSTRUMENTATION_MODES = ("counted", "batched", "uncounted")
+
+
+def _batch_target(counters: Counters, instrumentation: str):
+    """
+    Hızlı (sayaçsız iç döngülü) yolların yazacağı Counters nesnesini döner.
+    "uncounted" modunda None döner; hızlı fonksiyonlar None görünce hiç yazmaz.
+    """
+    if instrumentation not in INSTRUMENTATION_MODES:
+        raise ValueError(f"Bilinmeyen instrumentation: {instrumentation}")
+    return None if instrumentation == "uncounted" else counters
+
+
+# --------------------------------------------------
+# Veri hareketi (bytes moved) ve tahmini cache miss modeli
+# --------------------------------------------------
+# comparisons / assignments işlem sayısıdır; büyük n'de süre ve enerjiyi
+# çoğunlukla belleğe giden trafik belirler. Basit model:
+#   - m elemanlık bir geçiş (merge / partition) m eleman okur ve m eleman
+#     yazar (kirli satırların geri yazımı dahil) -> 2 * m * ELEMENT_BYTES bayt
+#   - geçişin çalışma kümesi (aynı elemana iki dokunuş arasında dokunulan veri)
+#     CACHE_BYTES'a sığmıyorsa bu trafiğin her LINE_BYTES'lık satırı bir miss
+#     sayılır; sığıyorsa veri önceki geçişten önbellekte kalmıştır (miss yok)
+# Model kaba bir tahmindir (Python listesinde yalnızca işaretçiler taşınır),
+# ama geçiş sayısını azaltan motorlarla (kway, blocked) 2-yollu bottom-up
+# arasındaki farkı görünür kılar. Sayaçlar geçiş başına bir kez yazılır.
+ELEMENT_BYTES = 8                  # liste yuvası (işaretçi) / int64
+LINE_BYTES = 64                    # önbellek satırı
+CACHE_BYTES = 2 * 1024 * 1024      # son seviye önbellekten çekirdeğe düşen pay (kaba değer)
+
+
+def _record_traffic(counters, elements: int, working_set: int):
+    """elements elemanlık bir geçişin trafiğini yazar (counters None ise yazmaz)."""
+    if counters is None:
+        return
+    moved = 2 * elements * ELEMENT_BYTES
+    counters.bytes_moved += moved
+    if working_set * ELEMENT_BYTES > CACHE_BYTES:
+        counters.cache_misses += -(-moved // LINE_BYTES)
 
 
 # --------------------------------------------------
 # Veri üretici
 # --------------------------------------------------
-def generate_array(n: int, mode: str = "random"):
+def generate_array(n: int, mode: str = "random", backend: str = "list", seed: int = None):
     """
     Belirli senaryo için dizi üretir.
 
     Parametreler:
-        n   : dizi boyutu
-        mode: "random", "sorted" veya "reversed"
+        n      : dizi boyutu
+        mode   : workloads.WORKLOADS içindeki bir senaryo adı ("random", "sorted",
+                 "reversed", "nearly_sorted", "zipf", ...); parametreler
+                 "ad:anahtar=değer,..." biçiminde eklenebilir
+        backend: "list" (varsayılan) veya "numpy"
+        seed   : verilirse senaryo bu tohumla tekrarlanabilir üretilir
+                 (global random durumuna dokunulmaz)
 
     Dönüş:
-        Üretilen tamsayı listesi.
-    """
-    if mode == "random":
-        arr = [random.randint(0, 10_000_000) for _ in range(n)]
-    elif mode == "sorted":
-        arr = list(range(n))                # 0, 1, 2, ..., n-1
-    elif mode == "reversed":
-        arr = list(range(n, 0, -1))         # n, n-1, ..., 1
-    else:
-        raise ValueError(f"Bilinmeyen mode: {mode}")
-    return arr
+        Üretilen tamsayı listesi ("numpy" backend'de bitişik int64 NumPy dizisi).
+    """
+    if backend == "numpy":
+        # NumPy opsiyonel: yalnızca istenirse içe aktarılır
+        from numpy_backend import generate_array_np
+        return generate_array_np(n, mode, seed=seed)
+    if backend != "list":
+        raise ValueError(f"Bilinmeyen backend: {backend}")
+
+    return generate_workload(n, mode, seed=seed)
 
 
 # --------------------------------------------------
 # MergeSort (sayaçlı versiyon)
 # --------------------------------------------------
-def mergesort(arr, counters: Counters):
+def mergesort(arr, counters: Counters, instrumentation: str = "counted", key=None):
     """
     MergeSort algoritması (sayaçlı versiyon).
     Yeni bir sıralı liste döner, arr üzerinde çalışmaz (pure function gibi).
+    Kararlıdır: eşit elemanlar orijinal sıralarını korur.
 
     Parametre:
-        arr      : sıralanacak liste
-        counters : Counters nesnesi, işlemleri saymak için
+        arr             : sıralanacak liste
+        counters        : Counters nesnesi, işlemleri saymak için
+        instrumentation : "counted", "batched" veya "uncounted"
+        key             : verilirse kayıtlar key(kayıt)'a göre sort_by_key ile
+                          (anahtarlar bir kez çıkarılıp) sıralanır
     """
+    if key is not None:
+        return sort_by_key(arr, key, counters, mergesort, instrumentation)
+    if instrumentation != "counted":
+        return _mergesort_fast(arr, _batch_target(counters, instrumentation))
+
     # Base case: 0 veya 1 elemanlı listeler zaten sıralıdır
     if len(arr) <= 1:
         return arr
@@ -71,7 +147,8 @@ def mergesort(arr, counters: Counters):
     left = mergesort(arr[:mid], counters)
     right = mergesort(arr[mid:], counters)
 
-    # Merge aşaması
+    # Merge aşaması (girdi + çıktı listeleri çalışma kümesidir)
+    _record_traffic(counters, len(arr), 2 * len(arr))
     return merge(left, right, counters)
 
 
@@ -112,10 +189,418 @@ def merge(left, right, counters: Counters):
     return merged
 
 
+def _mergesort_fast(arr, counters):
+    """mergesort'un iç döngüsünde sayaç yazmayan sürümü (batched / uncounted)."""
+    if len(arr) <= 1:
+        return arr
+
+    mid = len(arr) // 2
+    left = _mergesort_fast(arr[:mid], counters)
+    right = _mergesort_fast(arr[mid:], counters)
+    _record_traffic(counters, len(arr), 2 * len(arr))
+    return _merge_fast(left, right, counters)
+
+
+def _merge_fast(left, right, counters):
+    """
+    merge ile aynı sonucu ve aynı sayaç toplamlarını üretir ama
+    döngü içinde Counters'a dokunmaz:
+        - comparisons = ana döngünün tur sayısı = çıkışta i + j
+        - assignments = len(left) + len(right)
+    counters None ise hiç yazılmaz.
+    """
+    i = j = 0
+    n_left, n_right = len(left), len(right)
+    merged = []
+    append = merged.append
+
+    while i < n_left and j < n_right:
+        if left[i] <= right[j]:
+            append(left[i])
+            i += 1
+        else:
+            append(right[j])
+            j += 1
+
+    comps = i + j
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += n_left + n_right
+    return merged
+
+
+# --------------------------------------------------
+# MergeSort (bottom-up, tek yardımcı tampon + sayaçlı)
+# --------------------------------------------------
+def mergesort_bottom_up(arr, counters: Counters, natural_runs: bool = False,
+                        instrumentation: str = "counted"):
+    """
+    İteratif (bottom-up) MergeSort.
+
+    Yukarıdaki mergesort her seviyede arr[:mid] / arr[mid:] dilimleri ve
+    yeni 'merged' listeleri üretir (toplamda O(n log n) geçici liste).
+    Bu sürüm ise yalnızca İKİ tampon kullanır: girdinin kopyası ve aynı
+    boyda tek bir yardımcı tampon. Her geçişte src -> dst birleştirilir,
+    sonra roller değişir (ping-pong).
+
+    Sayaç semantiği mergesort ile aynıdır:
+        - comparisons: src[i] ? src[j] karşılaştırmaları
+        - assignments: hedef tampona yazılan her eleman
+
+    Parametreler:
+        arr          : sıralanacak liste (değiştirilmez)
+        counters     : Counters nesnesi
+        natural_runs : True ise 1 uzunluklu parçalar yerine girdideki
+                       hazır artan diziler (run) ile başlanır. Run tespiti
+                       sırasındaki karşılaştırmalar da sayılır.
+        instrumentation : "counted", "batched" veya "uncounted"
+    """
+    if instrumentation == "counted":
+        merge_into = _merge_into
+    else:
+        merge_into = _merge_into_fast
+        counters = _batch_target(counters, instrumentation)
+
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    src = list(arr)
+    dst = [0] * n
+
+    if natural_runs:
+        bounds = _find_ascending_runs(src, counters)
+
+        # Komşu run'ları çiftler halinde birleştir, tek run kalana kadar
+        while len(bounds) > 2:
+            new_bounds = [0]
+            for k in range(0, len(bounds) - 1, 2):
+                lo = bounds[k]
+                if k + 2 < len(bounds):
+                    mid, hi = bounds[k + 1], bounds[k + 2]
+                    merge_into(src, dst, lo, mid, hi, counters)
+                else:
+                    # Eşi olmayan son run olduğu gibi kopyalanır
+                    hi = bounds[k + 1]
+                    dst[lo:hi] = src[lo:hi]
+                    if counters is not None:
+                        counters.assignments += hi - lo
+                new_bounds.append(hi)
+            _record_traffic(counters, n, 2 * n)   # her geçiş iki tamponun tamamını dolaşır
+            src, dst = dst, src
+            bounds = new_bounds
+        return src
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi:
+                merge_into(src, dst, lo, mid, hi, counters)
+            else:
+                dst[lo:hi] = src[lo:hi]
+                if counters is not None:
+                    counters.assignments += hi - lo
+        _record_traffic(counters, n, 2 * n)
+        src, dst = dst, src
+        width *= 2
+
+    return src
+
+
+def _merge_into(src, dst, lo: int, mid: int, hi: int, counters: Counters):
+    """
+    src[lo:mid] ve src[mid:hi] sıralı parçalarını dst[lo:hi] içine birleştirir.
+    Yeni liste oluşturmaz; sayaçlar merge() ile aynı şekilde artırılır.
+    """
+    i, j, k = lo, mid, lo
+
+    while i < mid and j < hi:
+        counters.comparisons += 1  # src[i] ? src[j]
+
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        counters.assignments += 1  # dst'ye eleman yazdık
+        k += 1
+
+    # Kalanlar (tek seferde dilim kopyası, eleman başına 1 atama)
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+        counters.assignments += mid - i
+    elif j < hi:
+        dst[k:hi] = src[j:hi]
+        counters.assignments += hi - j
+
+
+def _merge_into_fast(src, dst, lo: int, mid: int, hi: int, counters):
+    """_merge_into'nun batched / uncounted sürümü (bkz. _merge_fast)."""
+    i, j, k = lo, mid, lo
+
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+
+    comps = (i - lo) + (j - mid)
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    elif j < hi:
+        dst[k:hi] = src[j:hi]
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += hi - lo
+
+
+def _find_ascending_runs(arr, counters):
+    """
+    Dizideki azalmayan ardışık parçaların (run) sınırlarını döner.
+    Örn. [1, 2, 0, 5] -> [0, 2, 4]  (run'lar: [1, 2] ve [0, 5])
+    Her komşu çift bir kez karşılaştırılır: len(arr) - 1 karşılaştırma.
+    """
+    bounds = [0]
+    for k in range(1, len(arr)):
+        if arr[k - 1] > arr[k]:
+            bounds.append(k)
+    bounds.append(len(arr))
+
+    if counters is not None and len(arr) > 1:
+        counters.comparisons += len(arr) - 1  # arr[k-1] ? arr[k]
+    return bounds
+
+
+# --------------------------------------------------
+# k-yollu (loser tree) ve cache-blocked MergeSort
+# --------------------------------------------------
+# 2-yollu bottom-up her seviyede bütün diziyi bellekten geçirir: log2(n) geçiş.
+#   - kway   : her geçişte k komşu run loser tree (kaybedenler ağacı) ile
+#              birleştirilir -> log_k(n) geçiş. Eleman başına ~log2(k)
+#              karşılaştırma yapıldığından toplam karşılaştırma yaklaşık aynı
+#              kalır, bellek geçişleri ise log2(k) kat azalır.
+#   - blocked: dizi CACHE_BYTES'a (kaynak + hedef) sığan bloklara bölünür; her
+#              blok kendi içinde 2-yollu geçişlerle önbellekte sıralanır, sonra
+#              bloklar k-yollu geçişlerle birleştirilir.
+# Sayaçlar QuickSort ailesindeki gibi çağrı sonunda toplu yazılır.
+
+DEFAULT_KWAY = 4
+
+# blocked motorunda blok boyu (eleman): kaynak + hedef blok önbelleğe sığar
+BLOCK_ELEMENTS = CACHE_BYTES // (2 * ELEMENT_BYTES)
+
+
+def loser_tree_merge(src, dst, runs, out: int, counters):
+    """
+    src içindeki sıralı runs = [(lo, hi), ...] parçalarını dst[out:] içine
+    loser tree ile birleştirir.
+
+    Ağacın her iç düğümü o maçın KAYBEDENİNİ tutar, kazanan köke çıkar; kazanan
+    yazıldıktan sonra yalnızca onun yaprağından köke giden yol yeniden oynanır
+    (eleman başına ceil(log2(k)) karşılaştırma). Eşitlikte daha soldaki run
+    kazanır (kararlı). Biten run'larla yapılan maçlar karşılaştırma sayılmaz.
+    """
+    k = len(runs)
+    pos = [lo for lo, _ in runs]
+    end = [hi for _, hi in runs]
+    size = 1
+    while size < k:
+        size *= 2
+    comps = 0
+
+    def beats(a, b):
+        # a, b maçında a kazanır mı? (biten / boş yaprak her zaman kaybeder)
+        nonlocal comps
+        if a >= k or pos[a] >= end[a]:
+            return False
+        if b >= k or pos[b] >= end[b]:
+            return True
+        comps += 1
+        x, y = src[pos[a]], src[pos[b]]
+        return x <= y if a < b else x < y
+
+    # Kuruluş: yapraklardan köke kazananlar, iç düğümlere kaybedenler
+    tree = [0] * size
+    winners = [0] * size + list(range(size))
+    for node in range(size - 1, 0, -1):
+        a, b = winners[2 * node], winners[2 * node + 1]
+        if beats(a, b):
+            winners[node], tree[node] = a, b
+        else:
+            winners[node], tree[node] = b, a
+    winner = winners[1] if size > 1 else 0
+
+    total = sum(hi - lo for lo, hi in runs)
+    for _ in range(total):
+        dst[out] = src[pos[winner]]
+        out += 1
+        pos[winner] += 1
+        # Kazananın yolunu yeniden oyna
+        node = (winner + size) // 2
+        while node:
+            if beats(tree[node], winner):
+                tree[node], winner = winner, tree[node]
+            node //= 2
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += total
+
+
+def _kway_pass(src, dst, lo: int, hi: int, width: int, k: int, counters):
+    """src[lo:hi] içindeki width uzunluklu run'ları k'şar k'şar dst'ye birleştirir (tek geçiş)."""
+    for start in range(lo, hi, k * width):
+        runs = [(r, min(r + width, hi)) for r in range(start, min(start + k * width, hi), width)]
+        if len(runs) == 1:
+            # Eşi olmayan son run olduğu gibi kopyalanır
+            r_lo, r_hi = runs[0]
+            dst[r_lo:r_hi] = src[r_lo:r_hi]
+            if counters is not None:
+                counters.assignments += r_hi - r_lo
+        else:
+            loser_tree_merge(src, dst, runs, start, counters)
+
+
+def mergesort_kway(arr, counters: Counters, k: int = DEFAULT_KWAY, instrumentation: str = "counted"):
+    """
+    k-yollu bottom-up MergeSort (loser tree). Yeni sıralı liste döner.
+    Geçiş sayısı ceil(log_k(n)); sayaç semantiği mergesort_bottom_up ile aynıdır.
+    """
+    if k < 2:
+        raise ValueError("k en az 2 olmalı")
+    counters = _batch_target(counters, instrumentation)
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    src = list(arr)
+    dst = [0] * n
+    width = 1
+    while width < n:
+        _kway_pass(src, dst, 0, n, width, k, counters)
+        _record_traffic(counters, n, 2 * n)
+        src, dst = dst, src
+        width *= k
+    return src
+
+
+def mergesort_blocked(arr, counters: Counters, block: int = BLOCK_ELEMENTS, k: int = DEFAULT_KWAY,
+                      instrumentation: str = "counted"):
+    """
+    Cache-blocked MergeSort. Yeni sıralı liste döner.
+
+    1) Her block uzunluklu parça kendi içinde 2-yollu bottom-up geçişlerle
+       sıralanır; bir bloğun bütün geçişleri bitmeden sonrakine geçilmez, bu
+       yüzden blok (kaynak + hedef) önbellekte kalır.
+    2) Sıralı bloklar k-yollu loser tree geçişleriyle birleştirilir.
+    """
+    if k < 2:
+        raise ValueError("k en az 2 olmalı")
+    counters = _batch_target(counters, instrumentation)
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    block = max(2, min(block, n))
+    merge_into = _merge_into_fast
+    src = list(arr)
+    dst = [0] * n
+
+    # 1) Blok içi geçişler: her blok aynı sayıda geçiş yapar, bu yüzden bütün
+    #    bloklar aynı tamponda (src / dst) biter
+    passes = (block - 1).bit_length()
+    for lo in range(0, n, block):
+        hi = min(lo + block, n)
+        a, b = src, dst
+        width = 1
+        for _ in range(passes):
+            for m_lo in range(lo, hi, 2 * width):
+                mid = min(m_lo + width, hi)
+                m_hi = min(m_lo + 2 * width, hi)
+                if mid < m_hi:
+                    merge_into(a, b, m_lo, mid, m_hi, counters)
+                else:
+                    b[m_lo:m_hi] = a[m_lo:m_hi]
+                    if counters is not None:
+                        counters.assignments += m_hi - m_lo
+            _record_traffic(counters, hi - lo, 2 * (hi - lo))
+            a, b = b, a
+            width *= 2
+    if passes % 2:
+        src, dst = dst, src
+
+    # 2) Bloklar arası k-yollu geçişler
+    width = block
+    while width < n:
+        _kway_pass(src, dst, 0, n, width, k, counters)
+        _record_traffic(counters, n, 2 * n)
+        src, dst = dst, src
+        width *= k
+    return src
+
+
+# Benchmark'ın seçebileceği MergeSort motorları.
+# Hepsi mergesort(arr, counters) imzasıyla çağrılır ve yeni sıralı liste döner.
+MERGESORT_ENGINES = {
+    "topdown": mergesort,
+    "bottomup": mergesort_bottom_up,
+    "natural": partial(mergesort_bottom_up, natural_runs=True),
+    "kway": mergesort_kway,
+    "blocked": mergesort_blocked,
+}
+
+
 # --------------------------------------------------
 # QuickSort (Rastgele Pivot + İTERATİF + sayaçlı)
 # --------------------------------------------------
-def quicksort(arr, counters: Counters, low: int = None, high: int = None):
+@dataclass(frozen=True)
+class QuickSortConfig:
+    """
+    QuickSort ailesinin ayarları (introsort tarzı).
+
+    - pivot            : "random" (varsayılan), "median3" veya "ninther"
+    - scheme           : "lomuto" (varsayılan), "hoare" veya "3way" (Dutch flag)
+    - insertion_cutoff : bu uzunluğa kadar olan aralıklar insertion sort ile
+                         bitirilir (0 = kapalı)
+    - introsort        : True ise özyineleme derinliği 2*log2(n)'i aşan aralıklar
+                         heapsort ile sıralanır (en kötü durum O(n log n))
+
+    Varsayılan ayar klasik Randomized QuickSort'tur (partition fonksiyonu).
+    """
+    pivot: str = "random"
+    scheme: str = "lomuto"
+    insertion_cutoff: int = 0
+    introsort: bool = False
+
+    def label(self) -> str:
+        """Tablolarda kullanılacak kısa ad, ör. 'median3/3way/ins16/intro'."""
+        parts = [self.pivot, self.scheme]
+        if self.insertion_cutoff > 1:
+            parts.append(f"ins{self.insertion_cutoff}")
+        if self.introsort:
+            parts.append("intro")
+        return "/".join(parts)
+
+
+PIVOT_STRATEGIES = ("random", "median3", "ninther")
+PARTITION_SCHEMES = ("lomuto", "hoare", "3way")
+
+# Bu uzunluktan kısa aralıklarda ninther yerine median-of-3 kullanılır
+NINTHER_THRESHOLD = 40
+
+
+def quicksort(arr, counters: Counters, low: int = None, high: int = None,
+              instrumentation: str = "counted", config: QuickSortConfig = None, key=None):
     """
     In-place QuickSort (dizi üzerinde yerinde değişim yapar).
 
@@ -123,29 +608,99 @@ def quicksort(arr, counters: Counters, low: int = None, high: int = None):
     - Kendi stack yapımızı kullanıyoruz.
     - Böylece Python'un recursion limitine takılmayız.
     - Pivot yine rastgele seçilir (Randomized QuickSort).
+    - Her partition'dan sonra BÜYÜK alt aralık yığına itilir, küçük olanla
+      döngüye devam edilir. Yığına itilen her aralık devam edilenden büyük
+      olduğundan yığın derinliği en fazla log2(n) + 1'dir.
+    - Yığın, önceden ayrılmış iki array('q') tamponudur (tuple üretilmez).
+      Ulaşılan en büyük derinlik counters.max_stack_depth'e yazılır.
+
+    instrumentation: "counted", "batched" veya "uncounted"
+    config: QuickSortConfig; verilirse (ve varsayılan değilse) pivot stratejisi,
+        partition şeması, insertion sort eşiği ve heapsort geri dönüşü bu ayara
+        göre seçilir. Bu ailede sayaçlar her yardımcı çağrının sonunda toplu
+        yazılır ("counted" ile "batched" aynı toplamları verir).
+    key: verilirse arr'ın tamamı key(kayıt)'a göre sort_by_key ile KARARLI
+        sıralanır (QuickSort tekil kodlanmış anahtar tamponunu sıralar) ve
+        sonuç arr'a yerinde yazılır; low / high ile birlikte kullanılamaz.
     """
+    if key is not None:
+        if low is not None or high is not None:
+            raise ValueError("key ile low / high birlikte kullanılamaz")
+        arr[:] = sort_by_key(arr, key, counters, partial(quicksort, config=config), instrumentation)
+        return
+
+    if config is not None and config != QuickSortConfig():
+        _quicksort_configured(arr, _batch_target(counters, instrumentation), low, high, config)
+        return
+
+    if instrumentation == "counted":
+        partition_fn = partition
+    else:
+        partition_fn = _partition_fast
+        counters = _batch_target(counters, instrumentation)
+
     if len(arr) == 0:
         return
 
     if low is None or high is None:
         low, high = 0, len(arr) - 1
 
+    _quicksort_loop(arr, counters, low, high, partition_fn)
+
+
+def _new_range_stack(size: int, count: int = 2):
+    """
+    Açık yığın için önceden ayrılmış array('q') tamponları.
+    Küçük-taraf-önce disipliniyle derinlik <= log2(size) + 1 olduğundan
+    size.bit_length() + 1 kapasite yeterlidir.
+    """
+    capacity = max(1, size).bit_length() + 1
+    return [array("q", bytes(8 * capacity)) for _ in range(count)]
+
+
+def _record_stack_depth(counters, peak: int):
+    """Yığının ulaştığı en büyük derinliği counters'a yazar (counters None ise yazmaz)."""
+    if counters is not None and peak > counters.max_stack_depth:
+        counters.max_stack_depth = peak
+
+
+def _quicksort_loop(arr, counters, low: int, high: int, partition_fn):
+    """
+    Küçük-taraf-önce yığın disiplinli iteratif QuickSort döngüsü.
+    partition_fn(arr, counters, l, h) pivot'un son konumunu döner.
+    (numpy_backend.quicksort_np de bu döngüyü kullanır.)
+    """
     # Python çağrı yığını yerine kendi stack'imizi kullanıyoruz.
-    stack = [(low, high)]
+    stack_lo, stack_hi = _new_range_stack(high - low + 1)
+    top = 0
+    peak = 0
 
-    while stack:
-        l, h = stack.pop()
+    l, h = low, high
+    while True:
         if l < h:
-            p = partition(arr, counters, l, h)
+            p = partition_fn(arr, counters, l, h)
+            _record_traffic(counters, h - l + 1, h - l + 1)
+
+            # Büyük tarafı yığına it, küçük tarafla devam et
+            if p - l < h - p:
+                if p + 1 < h:
+                    stack_lo[top], stack_hi[top] = p + 1, h
+                    top += 1
+                h = p - 1
+            else:
+                if p - 1 > l:
+                    stack_lo[top], stack_hi[top] = l, p - 1
+                    top += 1
+                l = p + 1
+            if top > peak:
+                peak = top
+        elif top:
+            top -= 1
+            l, h = stack_lo[top], stack_hi[top]
+        else:
+            break
 
-            # Daha küçük olan alt aralığı sona itmeyi tercih etmek
-            # teoride stack kullanımını azaltabilir, ama burada basit tutuyoruz.
-            # Sol taraf
-            if p - 1 > l:
-                stack.append((l, p - 1))
-            # Sağ taraf
-            if p + 1 < h:
-                stack.append((p + 1, h))
+    _record_stack_depth(counters, peak)
 
 
 def partition(arr, counters: Counters, low: int, high: int):
@@ -159,13 +714,15 @@ def partition(arr, counters: Counters, low: int, high: int):
     Sayaçlar:
         - comparisons: arr[j] ? pivot karşılaştırmaları
         - assignments: swap işlemleri ve pivot ataması
+          (bir elemanın kendisiyle swap'ı yapılmaz ve sayılmaz)
     """
     # 1) Rastgele pivot indeksi seç
     pivot_index = random.randint(low, high)
 
     # 2) Pivot elemanını sona (high) taşı (klasik partition şekli için)
-    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
-    counters.assignments += 3  # swap için 3 atama saydık
+    if pivot_index != high:
+        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+        counters.assignments += 3  # swap için 3 atama saydık
 
     # 3) Pivot değerini belirle
     pivot = arr[high]
@@ -178,17 +735,847 @@ def partition(arr, counters: Counters, low: int, high: int):
 
         if arr[j] <= pivot:
             i += 1
-            # swap(arr[i], arr[j])
-            arr[i], arr[j] = arr[j], arr[i]
-            counters.assignments += 3  # 3 atama (swap)
+            # swap(arr[i], arr[j]) — i == j ise eleman zaten yerinde
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                counters.assignments += 3  # 3 atama (swap)
 
     # Pivot'u doğru yerine al
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    counters.assignments += 3
+    if i + 1 != high:
+        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+        counters.assignments += 3
 
     return i + 1
 
 
+def _partition_fast(arr, counters, low: int, high: int):
+    """
+    partition ile aynı bölmeyi yapar (aynı rastgele pivot seçimi dahil),
+    sayaçları ise çağrı sonunda tek seferde yazar:
+        - comparisons = high - low
+        - assignments = 3 * (gerçek swap sayısı) + 1 (pivot)
+    counters None ise hiç yazılmaz.
+    """
+    pivot_index = random.randint(low, high)
+    swaps = 0
+    if pivot_index != high:
+        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+        swaps += 1
+    pivot = arr[high]
+
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                swaps += 1
+
+    if i + 1 != high:
+        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+        swaps += 1
+
+    if counters is not None:
+        counters.comparisons += high - low
+        counters.assignments += 3 * swaps + 1
+    return i + 1
+
+
+# --------------------------------------------------
+# QuickSort ailesi (pivot stratejileri, şemalar, introsort)
+# --------------------------------------------------
+# Bu bölümdeki yardımcılar sayaçları yerel int'lerde toplar ve çağrı sonunda
+# counters'a yazar; counters None ise ("uncounted") hiç yazmaz.
+
+def _quicksort_configured(arr, counters, low, high, config: QuickSortConfig):
+    """config'e göre iteratif QuickSort; quicksort() tarafından çağrılır."""
+    if config.pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"Bilinmeyen pivot stratejisi: {config.pivot}")
+    if config.scheme not in PARTITION_SCHEMES:
+        raise ValueError(f"Bilinmeyen partition şeması: {config.scheme}")
+
+    if len(arr) == 0:
+        return
+    if low is None or high is None:
+        low, high = 0, len(arr) - 1
+
+    scheme_fn = {"lomuto": _lomuto, "hoare": _hoare, "3way": _three_way}[config.scheme]
+    cutoff = config.insertion_cutoff
+    depth_limit = 2 * max(1, (high - low + 1).bit_length()) if config.introsort else None
+
+    # Küçük-taraf-önce disiplin + önceden ayrılmış yığın (bkz. _quicksort_loop).
+    # Üçüncü tampon her aralığın özyineleme derinliğini tutar (introsort için).
+    stack_lo, stack_hi, stack_depth = _new_range_stack(high - low + 1, 3)
+    top = 0
+    peak = 0
+
+    l, h, depth = low, high, 0
+    while True:
+        if h - l + 1 <= cutoff:
+            insertion_sort(arr, counters, l, h)
+            l = h  # aralık bitti
+        elif l < h and depth_limit is not None and depth > depth_limit:
+            heapsort(arr, counters, l, h)
+            l = h
+        elif l < h:
+            pivot_index = _choose_pivot(arr, counters, l, h, config.pivot)
+            left_hi, right_lo = scheme_fn(arr, counters, l, h, pivot_index)
+            _record_traffic(counters, h - l + 1, h - l + 1)
+            depth += 1
+
+            # Büyük tarafı yığına it, küçük tarafla devam et
+            if left_hi - l < h - right_lo:
+                if right_lo < h:
+                    stack_lo[top], stack_hi[top], stack_depth[top] = right_lo, h, depth
+                    top += 1
+                h = left_hi
+            else:
+                if left_hi > l:
+                    stack_lo[top], stack_hi[top], stack_depth[top] = l, left_hi, depth
+                    top += 1
+                l = right_lo
+            if top > peak:
+                peak = top
+            continue
+
+        if not top:
+            break
+        top -= 1
+        l, h, depth = stack_lo[top], stack_hi[top], stack_depth[top]
+
+    _record_stack_depth(counters, peak)
+
+
+def _median3(arr, a: int, b: int, c: int):
+    """arr[a], arr[b], arr[c] değerlerinin ortancasının indeksi ve karşılaştırma sayısı."""
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b, 2
+        return (c, 3) if x < z else (a, 3)
+    if x < z:
+        return a, 2
+    return (c, 3) if y < z else (b, 3)
+
+
+def _choose_pivot(arr, counters, low: int, high: int, strategy: str) -> int:
+    """
+    Pivot indeksini seçer.
+        - random : random.randint(low, high)
+        - median3: arr[low], arr[mid], arr[high] ortancası
+        - ninther: dokuz örneğin "ortancaların ortancası" (Tukey ninther);
+                   kısa aralıklarda median3'e döner
+    Seçim sırasındaki karşılaştırmalar comparisons'a eklenir.
+    """
+    if strategy == "random":
+        return random.randint(low, high)
+
+    mid = low + (high - low) // 2
+    size = high - low + 1
+    if strategy == "ninther" and size >= NINTHER_THRESHOLD:
+        step = size // 8
+        m1, c1 = _median3(arr, low, low + step, low + 2 * step)
+        m2, c2 = _median3(arr, mid - step, mid, mid + step)
+        m3, c3 = _median3(arr, high - 2 * step, high - step, high)
+        index, c4 = _median3(arr, m1, m2, m3)
+        comps = c1 + c2 + c3 + c4
+    else:
+        index, comps = _median3(arr, low, mid, high)
+
+    if counters is not None:
+        counters.comparisons += comps
+    return index
+
+
+def _lomuto(arr, counters, low: int, high: int, pivot_index: int):
+    """
+    Lomuto şeması (partition ile aynı, pivot indeksi dışarıdan gelir).
+    Dönüş: (sol_aralık_sonu, sağ_aralık_başı) = (p - 1, p + 1)
+    """
+    swaps = 0
+    if pivot_index != high:
+        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+        swaps += 1
+    pivot = arr[high]
+
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                swaps += 1
+
+    p = i + 1
+    if p != high:
+        arr[p], arr[high] = arr[high], arr[p]
+        swaps += 1
+
+    if counters is not None:
+        counters.comparisons += high - low
+        counters.assignments += 3 * swaps + 1
+    return p - 1, p + 1
+
+
+def _hoare(arr, counters, low: int, high: int, pivot_index: int):
+    """
+    Hoare şeması: iki uçtan içeri taranır, yanlış taraftaki çiftler swap edilir.
+    Lomuto'dan ~3 kat az swap yapar. Pivot son yerine konmaz; aralıklar
+    [low, j] ve [j + 1, high] olarak ayrılır.
+    """
+    comps = 0
+    swaps = 0
+    if pivot_index != low:
+        arr[pivot_index], arr[low] = arr[low], arr[pivot_index]
+        swaps += 1
+    pivot = arr[low]
+
+    i, j = low - 1, high + 1
+    while True:
+        i += 1
+        comps += 1
+        while arr[i] < pivot:
+            i += 1
+            comps += 1
+        j -= 1
+        comps += 1
+        while arr[j] > pivot:
+            j -= 1
+            comps += 1
+        if i >= j:
+            break
+        arr[i], arr[j] = arr[j], arr[i]
+        swaps += 1
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += 3 * swaps + 1
+    return j, j + 1
+
+
+def _three_way(arr, counters, low: int, high: int, pivot_index: int):
+    """
+    3-yollu (Dijkstra Dutch flag) partition: < pivot | == pivot | > pivot.
+    Pivot'a eşit elemanlar ortada kalır ve bir daha işlenmez; tekrarlı
+    (duplicate-heavy) girdilerde Lomuto'nun O(n^2)'ye kaymasını önler.
+    """
+    comps = 0
+    swaps = 0
+    pivot = arr[pivot_index]
+
+    lt, i, gt = low, low, high
+    while i <= gt:
+        x = arr[i]
+        comps += 1
+        if x < pivot:
+            if lt != i:
+                arr[lt], arr[i] = x, arr[lt]
+                swaps += 1
+            lt += 1
+            i += 1
+        else:
+            comps += 1
+            if x > pivot:
+                arr[i], arr[gt] = arr[gt], x
+                swaps += 1
+                gt -= 1
+            else:
+                i += 1
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += 3 * swaps + 1
+    return lt - 1, gt + 1
+
+
+def insertion_sort(arr, counters, low: int, high: int):
+    """
+    arr[low..high] aralığını yerinde insertion sort ile sıralar (sayaçlı).
+        - comparisons: arr[j] ? key karşılaştırmaları
+        - assignments: key ataması, kaydırmalar ve key'in yerine yazılması
+    """
+    comps = 0
+    assigns = 0
+    for k in range(low + 1, high + 1):
+        key = arr[k]
+        j = k - 1
+        while j >= low:
+            comps += 1
+            if arr[j] <= key:
+                break
+            arr[j + 1] = arr[j]
+            assigns += 1
+            j -= 1
+        if j + 1 != k:
+            arr[j + 1] = key
+            assigns += 2  # key'i alma + yerine yazma
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += assigns
+
+
+def heapsort(arr, counters, low: int, high: int):
+    """
+    arr[low..high] aralığını yerinde heapsort ile sıralar (sayaçlı).
+    Introsort'ta derinlik sınırı aşılınca QuickSort'un yerine geçer.
+    """
+    comps = 0
+    swaps = 0
+    size = high - low + 1
+
+    def sift_down(root, end):
+        nonlocal comps, swaps
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end:
+                comps += 1
+                if arr[low + child] < arr[low + child + 1]:
+                    child += 1
+            comps += 1
+            if arr[low + root] >= arr[low + child]:
+                return
+            arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+            swaps += 1
+            root = child
+
+    for start in range(size // 2 - 1, -1, -1):
+        sift_down(start, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        swaps += 1
+        sift_down(0, end)
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += 3 * swaps
+
+
+# Benchmark taramasında (run_quicksort_sweep) denenen hazır ayarlar
+QUICKSORT_SWEEP = [
+    QuickSortConfig(),
+    QuickSortConfig(pivot="median3"),
+    QuickSortConfig(pivot="ninther", scheme="hoare"),
+    QuickSortConfig(pivot="median3", scheme="3way"),
+    QuickSortConfig(pivot="ninther", scheme="hoare", insertion_cutoff=16),
+    QuickSortConfig(pivot="ninther", scheme="3way", insertion_cutoff=16, introsort=True),
+    QuickSortConfig(pivot="median3", scheme="hoare", insertion_cutoff=16, introsort=True),
+]
+
+
+# --------------------------------------------------
+# TimSort benzeri run-uyarlamalı hibrit (sayaçlı)
+# --------------------------------------------------
+# Önceden (kısmen) sıralı girdide mergesort yine tam n log n merge işi yapar.
+# Bu hibrit girdideki hazır run'ları kullanır:
+#   - doğal run tespiti; kesin azalan run'lar yerinde ters çevrilir
+#   - minrun'dan kısa run'lar binary insertion sort ile minrun'a uzatılır
+#   - run yığını TimSort değişmezleriyle birleştirilir (dengeli merge'ler)
+#   - merge, merge() ile aynı sayaç semantiğini kullanır; bir taraf art arda
+#     MIN_GALLOP kez kazanırsa üstel (galloping) aramayla blok kopyalanır
+# Sıralı / ters sıralı girdide n - 1 karşılaştırma ile biter.
+# Sayaçlar QuickSort ailesindeki gibi her yardımcı çağrının sonunda toplu
+# yazılır ("counted" ile "batched" aynı toplamları verir).
+
+# Bu uzunluktan kısa diziler tek run olarak insertion sort ile sıralanır
+MIN_MERGE = 32
+# Galloping moduna geçmek için bir tarafın art arda kazanması gereken tur sayısı
+MIN_GALLOP = 7
+
+
+def _min_run_length(n: int) -> int:
+    """n / minrun ikinin kuvvetine yakın olacak şekilde [MIN_MERGE/2, MIN_MERGE] aralığında minrun."""
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run_and_make_ascending(arr, counters, low: int, high: int) -> int:
+    """
+    arr[low:high] başındaki run'ın uzunluğunu döner. Run kesin azalansa
+    (kararlılık için eşitler azalan sayılmaz) yerinde ters çevrilir;
+    ters çevirmede yazılan her eleman bir atama sayılır.
+    """
+    run_end = low + 1
+    if run_end == high:
+        return 1
+
+    comps = 1
+    if arr[run_end] < arr[low]:
+        run_end += 1
+        while run_end < high:
+            comps += 1
+            if not arr[run_end] < arr[run_end - 1]:
+                break
+            run_end += 1
+        arr[low:run_end] = arr[low:run_end][::-1]
+        assigns = run_end - low
+    else:
+        run_end += 1
+        while run_end < high:
+            comps += 1
+            if arr[run_end] < arr[run_end - 1]:
+                break
+            run_end += 1
+        assigns = 0
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += assigns
+    return run_end - low
+
+
+def _binary_insertion_sort(arr, counters, low: int, high: int, start: int):
+    """
+    arr[low:start] sıralıyken arr[start:high] elemanlarını binary search ile
+    yerine ekler. Sayaçlar insertion_sort ile aynı anlamdadır: kaydırılan her
+    eleman ve key'in alınıp yerine yazılması atama sayılır.
+    """
+    comps = 0
+    assigns = 0
+    for k in range(start, high):
+        key = arr[k]
+        lo, hi = low, k
+        while lo < hi:
+            mid = (lo + hi) // 2
+            comps += 1
+            if key < arr[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo != k:
+            arr[lo + 1:k + 1] = arr[lo:k]
+            arr[lo] = key
+            assigns += (k - lo) + 2
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += assigns
+
+
+def _gallop(seq, key, start: int, end: int, strict: bool):
+    """
+    seq[start:end] sıralıyken baştan itibaren key'den küçük (strict=True)
+    ya da küçük-eşit (strict=False) elemanların bittiği indeksi bulur.
+    Önce 1, 2, 4, ... adımlarla üstel, sonra ikili arama yapılır.
+
+    Dönüş:
+        (indeks, karşılaştırma_sayısı)
+    """
+    comps = 0
+    lo, hi = start, end
+    ofs = 1
+    while start + ofs - 1 < end:
+        idx = start + ofs - 1
+        comps += 1
+        if seq[idx] < key if strict else seq[idx] <= key:
+            lo = idx + 1
+            ofs *= 2
+        else:
+            hi = idx
+            break
+    while lo < hi:
+        mid = (lo + hi) // 2
+        comps += 1
+        if seq[mid] < key if strict else seq[mid] <= key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo, comps
+
+
+def gallop_merge(left, right, counters, min_gallop: int = MIN_GALLOP):
+    """
+    merge() ile aynı sonucu ve aynı sayaç semantiğini (her left/right
+    karşılaştırması 1 comparison, merged'e yazılan her eleman 1 assignment)
+    kullanan birleştirme; tek fark galloping moddur: bir taraf art arda
+    min_gallop kez kazanınca o taraftan kaç elemanın sırayla geleceği üstel
+    aramayla bulunur ve blok halinde kopyalanır (arama karşılaştırmaları sayılır).
+    Eşitlikte left önce gelir (kararlı).
+    """
+    i = j = 0
+    n_left, n_right = len(left), len(right)
+    merged = []
+    append = merged.append
+    comps = 0
+    left_wins = right_wins = 0
+
+    while i < n_left and j < n_right:
+        comps += 1
+        if right[j] < left[i]:
+            append(right[j])
+            j += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= min_gallop:
+                k, c = _gallop(right, left[i], j, n_right, strict=True)
+                comps += c
+                merged.extend(right[j:k])
+                j = k
+                right_wins = 0
+        else:
+            append(left[i])
+            i += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= min_gallop and j < n_right:
+                k, c = _gallop(left, right[j], i, n_left, strict=False)
+                comps += c
+                merged.extend(left[i:k])
+                i = k
+                left_wins = 0
+
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += n_left + n_right
+    return merged
+
+
+def _merge_runs(arr, counters, base1: int, len1: int, len2: int):
+    """
+    Komşu run'ları arr[base1:base1+len1] ve ardından gelen len2 elemanı birleştirir.
+    Zaten yerinde olan uçlar galloping aramayla atlanır: left'in right[0]'dan
+    küçük-eşit başı ve right'ın left[-1]'den büyük-eşit sonu hiç kopyalanmaz.
+    """
+    base2 = base1 + len1
+    end = base2 + len2
+
+    # left'in baştaki yerinde kalan kısmı
+    start, comps = _gallop(arr, arr[base2], base1, base2, strict=False)
+    # right'ın sondaki yerinde kalan kısmı
+    stop, c = _gallop(arr, arr[base2 - 1], base2, end, strict=True)
+    comps += c
+    if counters is not None:
+        counters.comparisons += comps
+    if start == base2 or stop == base2:
+        return   # run'lar zaten sıralı
+
+    arr[start:stop] = gallop_merge(arr[start:base2], arr[base2:stop], counters)
+    _record_traffic(counters, stop - start, 2 * (stop - start))
+
+
+def timsort(arr, counters: Counters, instrumentation: str = "counted"):
+    """
+    TimSort benzeri run-uyarlamalı hibrit sıralama (yukarıdaki açıklamaya bakın).
+    mergesort gibi yeni sıralı liste döner, arr değiştirilmez.
+    Run yığınının ulaştığı en büyük yükseklik counters.max_stack_depth'e yazılır.
+
+    instrumentation: "counted", "batched" veya "uncounted"
+    """
+    counters = _batch_target(counters, instrumentation)
+    arr = list(arr)
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    if n < MIN_MERGE:
+        run_len = _count_run_and_make_ascending(arr, counters, 0, n)
+        _binary_insertion_sort(arr, counters, 0, n, run_len)
+        return arr
+
+    min_run = _min_run_length(n)
+    run_base, run_len = [], []
+    peak = 0
+
+    def merge_at(i):
+        _merge_runs(arr, counters, run_base[i], run_len[i], run_len[i + 1])
+        run_len[i] += run_len[i + 1]
+        del run_base[i + 1], run_len[i + 1]
+
+    low = 0
+    while low < n:
+        length = _count_run_and_make_ascending(arr, counters, low, n)
+        if length < min_run:
+            forced = min(min_run, n - low)
+            _binary_insertion_sort(arr, counters, low, low + forced, low + length)
+            length = forced
+        run_base.append(low)
+        run_len.append(length)
+        peak = max(peak, len(run_len))
+        low += length
+
+        # TimSort değişmezleri (üst üç run için): X > Y + Z ve Y > Z
+        while len(run_len) > 1:
+            k = len(run_len) - 2
+            if ((k > 0 and run_len[k - 1] <= run_len[k] + run_len[k + 1])
+                    or (k > 1 and run_len[k - 2] <= run_len[k - 1] + run_len[k])):
+                if run_len[k - 1] < run_len[k + 1]:
+                    k -= 1
+            elif run_len[k] > run_len[k + 1]:
+                break
+            merge_at(k)
+
+    while len(run_len) > 1:
+        k = len(run_len) - 2
+        if k > 0 and run_len[k - 1] < run_len[k + 1]:
+            k -= 1
+        merge_at(k)
+
+    _record_stack_depth(counters, peak)
+    return arr
+
+
+# --------------------------------------------------
+# Doğrusal zamanlı tamsayı sıralamaları (counting / LSD radix / MSD radix)
+# --------------------------------------------------
+# generate_array'in ürettiği diziler sınırlı tamsayılardır; karşılaştırma
+# yapmayan sıralamalar için ideal durum. Sayaç anlamları:
+#   - comparisons: min/max taraması (2(n - 1)) ve MSD'nin insertion sort'u
+#   - assignments: yardımcı / çıktı tampona yazılan her eleman (MSD'de geri kopya da)
+#   - bucket_ops : sayım artırma (n), önek toplamı (kova sayısı) ve dağıtımda
+#                  kova konumunun ilerletilmesi (n) — dağıtım geçişi başına
+# Değerler min'e göre kaydırılır; negatif tamsayılar da sıralanır. Bütün
+# sürümler kararlıdır ve sayaçları çağrı sonunda toplu yazar.
+
+RADIX_DIGIT_BITS = (8, 11)      # LSD basamağı: bayt ya da 11 bit
+DEFAULT_RADIX_BITS = 8
+MSD_CUTOFF = 32                 # MSD: bu boydan küçük kovalar insertion sort ile biter
+COUNTING_MAX_RANGE = 1 << 24    # counting sort'un kabul ettiği en geniş değer aralığı
+COUNTING_RANGE_FACTOR = 8       # aralık n'nin bu katını aşarsa sayım dizisi işi domine eder
+
+
+def _int_list(arr):
+    """Girdinin düz Python int listesi kopyası (list, array('q') ya da NumPy dizisi)."""
+    return arr.tolist() if hasattr(arr, "tolist") else list(arr)
+
+
+def _write_linear_counts(counters, comps: int, assigns: int, buckets: int):
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += assigns
+        counters.bucket_ops += buckets
+
+
+def counting_sort(arr, counters: Counters, instrumentation: str = "counted"):
+    """
+    Kararlı counting sort. Yeni sıralı liste döner, arr değiştirilmez.
+    Değer aralığı k = max - min + 1, COUNTING_MAX_RANGE'i ya da
+    COUNTING_RANGE_FACTOR * n'yi aşarsa sayım dizisi ayrılmaz; sıralama
+    radix_sort_lsd'ye (DEFAULT_RADIX_BITS) düşer ve sayaçlar onun işini yansıtır.
+    Böylece geniş aralıklı senaryolar deneyi durdurmaz ve küçük n'de süreyi
+    O(k)'lık sayım dizisi değil sıralama belirler.
+    """
+    target = _batch_target(counters, instrumentation)
+    arr = _int_list(arr)
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    lo = min(arr)
+    k = max(arr) - lo + 1
+    if k > COUNTING_MAX_RANGE or k > COUNTING_RANGE_FACTOR * n:
+        return radix_sort_lsd(arr, counters, instrumentation=instrumentation)
+    counters = target
+
+    counts = [0] * k
+    for x in arr:
+        counts[x - lo] += 1
+    # starts[v]: v değerinin çıktıdaki ilk konumu (önek toplamı)
+    starts = list(accumulate(counts, initial=0))
+    out = [0] * n
+    for x in arr:
+        v = x - lo
+        out[starts[v]] = x
+        starts[v] += 1
+
+    _record_traffic(counters, n, 2 * n + k)
+    _write_linear_counts(counters, 2 * (n - 1), n, 2 * n + k)
+    return out
+
+
+def radix_sort_lsd(arr, counters: Counters, bits: int = DEFAULT_RADIX_BITS, instrumentation: str = "counted"):
+    """
+    LSD radix sort: en az anlamlı basamaktan başlayarak her basamakta kararlı
+    counting dağıtımı yapar (iki tampon arasında). Yeni sıralı liste döner.
+    bits: basamak genişliği (RADIX_DIGIT_BITS: 8 -> bayt, 11 -> 2048 kova).
+    Geçiş sayısı ceil(bit_uzunluğu(max - min) / bits).
+    """
+    if bits < 1:
+        raise ValueError("bits en az 1 olmalı")
+    counters = _batch_target(counters, instrumentation)
+    src = _int_list(arr)
+    n = len(src)
+    if n < 2:
+        return src
+
+    lo = min(src)
+    span = max(src) - lo
+    radix = 1 << bits
+    mask = radix - 1
+    dst = [0] * n
+    assigns = buckets = 0
+
+    shift = 0
+    while span >> shift:
+        counts = [0] * radix
+        for x in src:
+            counts[((x - lo) >> shift) & mask] += 1
+        starts = list(accumulate(counts, initial=0))
+        for x in src:
+            d = ((x - lo) >> shift) & mask
+            dst[starts[d]] = x
+            starts[d] += 1
+        assigns += n
+        buckets += 2 * n + radix
+        _record_traffic(counters, n, 2 * n + radix)
+        src, dst = dst, src
+        shift += bits
+
+    _write_linear_counts(counters, 2 * (n - 1), assigns, buckets)
+    return src
+
+
+def radix_sort_msd(arr, counters: Counters, bits: int = DEFAULT_RADIX_BITS, cutoff: int = MSD_CUTOFF,
+                   instrumentation: str = "counted"):
+    """
+    MSD radix sort: en anlamlı basamakla kovalara dağıtır, her kovayı bir
+    sonraki basamakla ayrı işler (açık yığınla, özyinelemesiz). cutoff'tan
+    küçük kovalar insertion sort ile bitirilir. Yeni sıralı liste döner.
+    Yığının ulaştığı en büyük derinlik counters.max_stack_depth'e yazılır.
+    """
+    if bits < 1:
+        raise ValueError("bits en az 1 olmalı")
+    counters = _batch_target(counters, instrumentation)
+    arr = _int_list(arr)
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    lo = min(arr)
+    span = max(arr) - lo
+    radix = 1 << bits
+    mask = radix - 1
+    comps, assigns, buckets = 2 * (n - 1), 0, 0
+    if n <= cutoff:
+        insertion_sort(arr, counters, 0, n - 1)
+        _write_linear_counts(counters, comps, assigns, buckets)
+        return arr
+
+    aux = [0] * n
+    top = max(0, (span.bit_length() - 1) // bits * bits)   # en anlamlı basamağın kayması
+    stack = [(0, n, top)]
+    peak = 1
+    while stack:
+        l, h, shift = stack.pop()
+        m = h - l
+        counts = [0] * radix
+        for i in range(l, h):
+            counts[((arr[i] - lo) >> shift) & mask] += 1
+        ends = list(accumulate(counts, initial=l))   # dağıtımdan sonra ends[d] = kova d'nin sonu
+        for i in range(l, h):
+            x = arr[i]
+            d = ((x - lo) >> shift) & mask
+            aux[ends[d]] = x
+            ends[d] += 1
+        arr[l:h] = aux[l:h]
+        assigns += 2 * m
+        buckets += 2 * m + radix
+        _record_traffic(counters, m, 2 * m + radix)
+
+        if shift == 0:
+            continue
+        start = l
+        for d in range(radix):
+            end = ends[d]
+            if end - start > cutoff:
+                stack.append((start, end, shift - bits))
+            elif end - start > 1:
+                insertion_sort(arr, counters, start, end - 1)
+            start = end
+        peak = max(peak, len(stack))
+
+    _record_stack_depth(counters, peak)
+    _write_linear_counts(counters, comps, assigns, buckets)
+    return arr
+
+
+# --------------------------------------------------
+# key= ile kararlı kayıt sıralama (decorate-once)
+# --------------------------------------------------
+# Kayıtları doğrudan sıralamak her karşılaştırmada key çağrısı ve her
+# atamada büyük nesne taşıma demektir. Bunun yerine:
+#   1) key her kayıt için BİR KEZ çağrılır,
+#   2) tamsayı anahtarlar (anahtar - min) * n + orijinal_indeks biçiminde tekil
+#      int64 değerlere kodlanıp kompakt bir array('q') / NumPy tamponuna yazılır
+#      (eşit anahtarlar orijinal sıralarını korur -> QuickSort dahil kararlı),
+#   3) yalnızca bu tampon sayaçlı algoritmayla sıralanır,
+#   4) indeks permütasyonu (değer % n) çıkarılıp kayıtlara TEK SEFERDE uygulanır.
+# Anahtar tamsayı değilse ya da kodlama int64'e sığmıyorsa (anahtar, indeks)
+# çiftleri sıralanır; kararlılık yine indeks sayesinde korunur.
+
+KEY_BUFFERS = ("array", "numpy")
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+def decorate_keys(records, key, buffer: str = "array"):
+    """
+    Kayıtların anahtarlarını çıkarıp sıralanacak tamponu üretir.
+    "numpy" tamponunda tamsayı olmayan anahtarlar (str, float, ...) önce
+    np.unique ile sıra numaralarına (rank) sıkıştırılır.
+
+    Dönüş:
+        (tampon, indeks_çözücü) — indeks_çözücü(sıralı_değer) kaydın orijinal indeksidir
+    """
+    if buffer not in KEY_BUFFERS:
+        raise ValueError(f"Bilinmeyen key tamponu: {buffer}")
+    n = len(records)
+    keys = [key(record) for record in records]
+
+    if buffer == "numpy":
+        from numpy_backend import np, require_numpy
+        require_numpy()
+        if not all(type(k) is int for k in keys):
+            keys = np.unique(np.asarray(keys), return_inverse=True)[1].tolist()
+
+    if n and all(type(k) is int for k in keys):
+        lo, hi = min(keys), max(keys)
+        if (hi - lo + 1) * n <= _INT64_MAX:
+            if buffer == "numpy":
+                encoded = (np.array(keys, dtype=np.int64) - lo) * n + np.arange(n, dtype=np.int64)
+            else:
+                encoded = array("q", [(k - lo) * n + i for i, k in enumerate(keys)])
+            return encoded, lambda value: int(value) % n
+    if buffer == "numpy" and n:
+        raise OverflowError("Anahtar aralığı x n int64'e sığmıyor; buffer=\"array\" kullanın")
+    # Genel yol: (anahtar, indeks) çiftleri; tuple karşılaştırması kararlılığı sağlar
+    return [(k, i) for i, k in enumerate(keys)], lambda pair: pair[1]
+
+
+def sort_by_key(records, key, counters: Counters, sort_fn=None, instrumentation: str = "counted",
+                buffer: str = "array"):
+    """
+    records'u key'e göre KARARLI sıralanmış yeni liste olarak döner (decorate-once).
+
+    Parametreler:
+        sort_fn : sort_fn(tampon, counters, instrumentation=...) imzalı sayaçlı
+                  sıralama (yeni liste döndürebilir ya da yerinde sıralayabilir);
+                  None -> mergesort. "numpy" tamponuyla numpy_backend.mergesort_np /
+                  quicksort_np kullanılabilir.
+        buffer  : "array" (array('q')) veya "numpy" (int64 NumPy dizisi)
+
+    Sayaçlar: tamponun sıralanması + permütasyonun uygulanması (kayıt başına 1 atama).
+    """
+    sort_fn = sort_fn or mergesort
+    decorated, decode = decorate_keys(records, key, buffer)
+    result = sort_fn(decorated, counters, instrumentation=instrumentation)
+    if result is None:   # yerinde sıralayan algoritma (quicksort)
+        result = decorated
+
+    ordered = [records[decode(value)] for value in result]
+    if instrumentation != "uncounted":
+        counters.assignments += len(ordered)
+    return ordered
+
+
+
 # --------------------------------------------------
 # Küçük doğrulama testi (isteğe bağlı)
 # --------------------------------------------------
@@ -1,8 +1,8 @@
 """
 benchmark.py
 ------------
-Bu dosya, algorithms.py içindeki sayaçlı MergeSort ve QuickSort
-algoritmalarını FARKLI GİRDİ BOYUTLARI ve FARKLI DİZİ SENARYOLARI
+Bu dosya, algorithms.py içindeki sayaçlı MergeSort, QuickSort ve
+TimSort benzeri run-uyarlamalı hibrit algoritmalarını FARKLI GİRDİ BOYUTLARI ve FARKLI DİZİ SENARYOLARI
 (random, sorted, reversed) için test eder.
 
 Amaç:
@@ -14,81 +14,401 @@ Amaç:
   (rapordaki tabloya birebir kopyalanabilir).
 """
 
+import gc
+import hashlib
+import os
+import random
 import time
+from dataclasses import dataclass
+from functools import partial
+
+# Ağır / yalnızca bazı yollarda gereken modüller (codecarbon, numpy_backend,
+# multiprocessing, concurrent.futures, tempfile, ...) modül yüklenirken değil,
+# onları kullanan fonksiyonun içinde içe aktarılır: kısa CLI koşuları ve işçi
+# süreçler kullanmadıkları bağımlılığın yükleme süresini ödemez
+# (bkz. import_times.py).
 
 # CodeCarbon açıldığında macOS'ta powermetrics çağırır ve sudo ister.
 # Şifre istemesinin sebebi budur  ENABLE_CODECARBON = False kalsın.
 ENABLE_CODECARBON = False
 
-if ENABLE_CODECARBON:
-    from codecarbon import EmissionsTracker
-else:
-    EmissionsTracker = None
+# Gerçek enerji ölçümü (energy_meters.py): "auto" RAPL -> perf -> ölçümsüz sırasıyla
+# ilk çalışan backend'i seçer. "null" ile kapatılır, "fake" sahte sabit güç ölçeridir.
+DEFAULT_ENERGY_METER = "auto"
 
 # Kendi yazdığımız algoritma ve sayaç yapısını içe aktarıyoruz
-from algorithms import Counters, generate_array, mergesort, quicksort
+from algorithms import (
+    Counters,
+    generate_array,
+    quicksort,
+    MERGESORT_ENGINES,
+    INSTRUMENTATION_MODES,
+    QUICKSORT_SWEEP,
+    QuickSortConfig,
+    timsort,
+    MIN_MERGE,
+    MIN_GALLOP,
+    counting_sort,
+    radix_sort_lsd,
+    radix_sort_msd,
+    DEFAULT_RADIX_BITS,
+    MSD_CUTOFF,
+)
+
+# TimSort satırlarının variant etiketi
+TIMSORT_VARIANT = f"minrun{MIN_MERGE}/gallop{MIN_GALLOP}"
+
+# Benchmark'ın kabul ettiği ölçüm modları:
+# algorithms.INSTRUMENTATION_MODES + "split"
+#   split: süre "uncounted" koşudan, sayaçlar ayrı (zamanlanmayan) bir
+#          "batched" koşudan alınır. Böylece avg_time_ms sayaç maliyetini içermez.
+BENCH_INSTRUMENTATION_MODES = INSTRUMENTATION_MODES + ("split",)
+
+
+def measure_sort(sort_fn, base_arr, instrumentation: str = "counted", energy_meter=None,
+                 disable_gc: bool = False):
+    """
+    sort_fn'i base_arr'ın bir kopyası üzerinde bir kez çalıştırır.
+    energy_meter (energy_meters.EnergyMeter) verilirse yalnızca zamanlanan
+    sıralama çağrısının enerjisi ölçülür. disable_gc=True ise ölçümden önce
+    toplama yapılır ve zamanlanan bölümde çöp toplayıcı kapatılır.
+
+    Dönüş:
+        (geçen_süre_saniye, Counters, joule) — ölçer yoksa joule None
+    """
+    if instrumentation not in BENCH_INSTRUMENTATION_MODES:
+        raise ValueError(f"Bilinmeyen instrumentation: {instrumentation}")
+
+    timed_mode = "uncounted" if instrumentation == "split" else instrumentation
+
+    counters = Counters()
+    arr = base_arr.copy()
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        energy_start = energy_meter.read() if energy_meter is not None else None
+        start = time.perf_counter()
+        sort_fn(arr, counters, instrumentation=timed_mode)
+        end = time.perf_counter()
+        joules = energy_meter.joules(energy_start, energy_meter.read()) if energy_meter is not None else None
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+    if instrumentation == "split":
+        # Sayaçlar için ayrı, zamanlanmayan koşu
+        sort_fn(base_arr.copy(), counters, instrumentation="batched")
+
+    return end - start, counters, joules
+
+
+def resolve_sort_functions(merge_engine: str = "topdown", backend: str = "list",
+                           quick_config: QuickSortConfig = None):
+    """
+    Seçilen motor/backend için kullanılacak sıralama fonksiyonlarını döner.
+    quick_config verilirse QuickSort bu ayarla çalışır (yalnızca "list" backend).
+
+    Dönüş:
+        (merge_fn, quick_fn, engine_adı)
+    """
+    if backend == "numpy":
+        from numpy_backend import mergesort_np, quicksort_np
+        return mergesort_np, quicksort_np, "numpy"
+    if backend != "list":
+        raise ValueError(f"Bilinmeyen backend: {backend}")
+    if merge_engine not in MERGESORT_ENGINES:
+        raise ValueError(f"Bilinmeyen merge_engine: {merge_engine}")
+    quick_fn = partial(quicksort, config=quick_config) if quick_config is not None else quicksort
+    return MERGESORT_ENGINES[merge_engine], quick_fn, merge_engine
+
+
+# Her deneyde karşılaştırılan algoritmalar (sonuç demetlerinin sırası):
+# üç karşılaştırmalı O(n log n) sıralama + doğrusal zamanlı tamsayı sıralamaları
+ALGORITHMS = ("MergeSort", "QuickSort", "TimSort", "RadixLSD", "RadixMSD", "CountingSort")
+
+# avg_stack_depth raporlanan algoritmalar (açık yığın / run yığını kullananlar)
+STACK_ALGORITHMS = ("QuickSort", "TimSort", "RadixMSD")
+
+
+def resolve_algorithms(merge_engine: str = "topdown", backend: str = "list",
+                       quick_config: QuickSortConfig = None, radix_bits: int = DEFAULT_RADIX_BITS):
+    """
+    ALGORITHMS sırasıyla (ad, sıralama_fonksiyonu) çiftleri ve MergeSort motor adı.
+    TimSort, radix ve counting sort her backend'de saf Python sürümüdür (NumPy
+    dizisini listeye çevirir). radix_bits: RadixLSD / RadixMSD basamak genişliği.
+
+    Dönüş:
+        ([(algo, sort_fn), ...], engine_adı)
+    """
+    merge_fn, quick_fn, engine = resolve_sort_functions(merge_engine, backend, quick_config)
+    return [
+        ("MergeSort", merge_fn),
+        ("QuickSort", quick_fn),
+        ("TimSort", timsort),
+        ("RadixLSD", partial(radix_sort_lsd, bits=radix_bits)),
+        ("RadixMSD", partial(radix_sort_msd, bits=radix_bits)),
+        ("CountingSort", counting_sort),
+    ], engine
+
+
+def algorithm_label(algo: str, merge_engine: str, quick_config: QuickSortConfig = None,
+                    radix_bits: int = DEFAULT_RADIX_BITS) -> dict:
+    """Sonuç sözlüğündeki ayar alanı: MergeSort -> engine, diğerleri -> variant."""
+    if algo == "MergeSort":
+        return {"engine": merge_engine}
+    if algo == "QuickSort":
+        return {"variant": (quick_config or QuickSortConfig()).label()}
+    if algo == "RadixLSD":
+        return {"variant": f"{radix_bits}bit"}
+    if algo == "RadixMSD":
+        return {"variant": f"{radix_bits}bit/cutoff{MSD_CUTOFF}"}
+    if algo == "CountingSort":
+        return {"variant": "stable"}
+    return {"variant": TIMSORT_VARIANT}
+
 
+def cell_seed(base_seed: int, *parts) -> int:
+    """
+    (base_seed, n, mode, tekrar, ...) gibi parçalardan deterministik 64-bit tohum üretir.
+    Python'un hash()'i süreçler arasında değiştiği için sha256 kullanılır.
+    """
+    text = ":".join(str(p) for p in (base_seed,) + parts)
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
 
-def run_single_experiment(n: int, mode: str, repetitions: int = 5):
+
+def summarize_results(algo: str, n: int, mode: str, repetitions: int,
+                      time_total: float, comp_total: int, assign_total: int,
+                      stack_total: int = None, bytes_total: int = None, miss_total: int = None,
+                      bucket_total: int = 0, **extra):
+    """
+    Toplamlardan benchmark satır sözlüğünü (ortalamalar + ek alanlar) üretir.
+    Tablo yazıcısı ve gui_app.py bu sözlük yapısını kullanır.
+
+    stack_total: tekrarların max_stack_depth toplamı (yalnızca yığın kullanan
+        algoritmalar için; diğerlerinde avg_stack_depth None olur).
+    bytes_total / miss_total: tekrarların bytes_moved / cache_misses toplamı
+        (bellek trafiği modeli, bkz. algorithms._record_traffic); verilmezse None.
+    bucket_total: tekrarların bucket_ops toplamı (radix / counting sort). Kova
+        işlemleri de iş olduğu için energy_proxy'ye eklenir; karşılaştırmalı
+        sıralamalarda 0'dır, energy_proxy = avg_comp + avg_assign kalır.
+    """
+    return {
+        "algo": algo,
+        "n": n,
+        "mode": mode,
+        "repetitions": repetitions,
+        "avg_time_ms": (time_total / repetitions) * 1000.0,
+        "avg_comp": comp_total / repetitions,
+        "avg_assign": assign_total / repetitions,
+        "avg_bucket_ops": bucket_total / repetitions,
+        "energy_proxy": (comp_total + assign_total + bucket_total) / repetitions,
+        "avg_stack_depth": stack_total / repetitions if stack_total is not None else None,
+        "avg_bytes_moved": bytes_total / repetitions if bytes_total is not None else None,
+        "avg_cache_misses": miss_total / repetitions if miss_total is not None else None,
+        **extra,
+    }
+
+
+def run_single_experiment(n: int, mode: str, repetitions: int = 5, merge_engine: str = "topdown",
+                          instrumentation: str = "counted", backend: str = "list", seed: int = None,
+                          quick_config: QuickSortConfig = None, dataset_cache: str = None,
+                          energy_meter=None, run_windows: list = None, progress=None,
+                          profile: bool = False, radix_bits: int = DEFAULT_RADIX_BITS,
+                          sample_interval: float = None, power_callback=None):
     """
     Verilen n ve mode için:
       - MergeSort'u 'repetitions' kez çalıştırır, süre + sayaç ortalamasını alır
       - QuickSort'u 'repetitions' kez çalıştırır, süre + sayaç ortalamasını alır
-      - CodeCarbon ile tüm bu deneyi kapsayan (tahmini) enerji/karbon ölçümü alır
+      - TimSort benzeri run-uyarlamalı hibriti (algorithms.timsort) ve doğrusal
+        zamanlı tamsayı sıralamalarını (LSD / MSD radix, counting sort) da aynı
+        dizilerde çalıştırır
+      - Her algoritmanın her koşusunun enerjisini ayrı ölçer (energy_meter)
+      - CodeCarbon açıksa tüm bu deneyi kapsayan (tahmini) karbon ölçümü alır
+
+    merge_engine: algorithms.MERGESORT_ENGINES anahtarlarından biri
+        ("topdown", "bottomup", "natural"). Büyük n için "bottomup" önerilir.
+    instrumentation: "counted", "batched", "uncounted" veya "split"
+        (bkz. BENCH_INSTRUMENTATION_MODES). "uncounted" modunda sayaçlar 0 kalır.
+    backend: "list" (varsayılan) veya "numpy". "numpy" seçilirse diziler int64
+        NumPy dizisi olarak üretilir, numpy_backend'deki mergesort_np / quicksort_np
+        kullanılır (merge_engine yok sayılır) ve aynı diziler numpy.sort ile de
+        sıralanıp np_<kind>_ms sütunlarına yazılır.
+    seed: verilirse her tekrarın dizisi ve QuickSort pivotları cell_seed ile
+        deterministik üretilir (run_experiments_parallel ile aynı tohumlar).
+    quick_config: QuickSort ayarı (pivot / şema / insertion eşiği / introsort).
+        Sonuçta "variant" alanına config.label() yazılır.
+    dataset_cache: verilirse (dizin yolu) her tekrarın dizisi datasets.DatasetCache'ten
+        (n, mode, cell_seed(seed, n, mode, tekrar)) anahtarıyla alınır: bir kez
+        üretilip diske yazılır, o tekrardaki bütün algoritmalar aynı bellek
+        eşlemeli baytları kullanır. Diziler önbelleksiz koşudakilerle aynıdır,
+        tekrarlar arasındaki girdi çeşitliliği korunur. seed=None ise dizi
+        tekrarlanabilir olmadığından önbellek kullanılmaz.
+    energy_meter: energy_meters ölçer adı ("auto", "rapl", "perf", "fake", "null")
+        veya açık bir EnergyMeter; None -> DEFAULT_ENERGY_METER. energy_joule,
+        algoritma başına ortalama Joule'dür (ölçüm yoksa None). Ölçer yoksa ve
+        CodeCarbon açıksa, senaryo geneli CodeCarbon değeri kullanılır.
+    run_windows: verilirse (liste) her koşu için {"algo", "n", "mode", "rep",
+        "start", "end"} kaydı eklenir (Unix zamanı). Aynı anda alınan bir
+        powermetrics kaydıyla powermetrics.integrate_windows /
+        energy_by_algorithm üzerinden algoritma başına Joule hesaplanır.
+    progress: verilirse her algoritma koşusundan sonra progress(tamamlanan, toplam)
+        çağrılır (toplam = len(ALGORITHMS) * repetitions); GUI ilerleme çubuğu için.
+    profile: True ise ölçümlerden SONRA ilk tekrarın dizisi üzerinde ayrı bir
+        profil koşusu (profiling.profile_run) yapılır ve kayıtları her sonucun
+        "profile" alanına yazılır (yalnızca "list" backend ve MergeSort /
+        QuickSort; aksi halde None).
+        Zamanlanan koşular bundan etkilenmez.
+    radix_bits: RadixLSD / RadixMSD basamak genişliği (algorithms.RADIX_DIGIT_BITS: 8 veya 11).
+    sample_interval: verilirse (sn) ölçer energy_meters.PowerSampler ile arka
+        planda bu aralıkla örneklenir; her tekrarın enerjisi örneklerden alınır.
+        Sonuçlara energy_windows (tekrar başına başlangıç / bitiş / Joule / watt)
+        ve power_trace (algoritmanın pencerelerine düşen [(t_sn, watt), ...])
+        eklenir; yoksa None.
+    power_callback: sample_interval ile birlikte verilirse her koşudan sonra
+        yeni güç izi noktalarıyla power_callback([(t_sn, watt), ...]) çağrılır
+        (GUI canlı izi için).
 
     Dönüş:
-        merge_results, quick_results şeklinde iki sözlük (dict).
+        merge_results, quick_results, tim_results, ... şeklinde ALGORITHMS sırasıyla
+        sözlük (dict) demeti. Ortalamaların yanında tekrar başına time_samples_ms
+        ve proxy_samples listeleri, ölçüm varsa tekrar başına energy_samples_j de bulunur.
     """
+    algos, merge_engine = resolve_algorithms(merge_engine, backend, quick_config, radix_bits)
+
+    np_totals = None
+    if backend == "numpy":
+        from numpy_backend import numpy_sort_times, NUMPY_SORT_KINDS
+        np_totals = {kind: 0.0 for kind in NUMPY_SORT_KINDS}
+
+    # Algoritma başına toplamlar: [süre, comparisons, assignments, stack, bytes_moved, cache_misses,
+    # bucket_ops]; enerji toplamı ölçüm yoksa None kalır
+    totals = {algo: [0.0, 0, 0, 0, 0, 0, 0] for algo, _ in algos}
+    energy_totals = {algo: None for algo, _ in algos}
 
-    # MergeSort toplamları
-    merge_time_total = 0.0
-    merge_comp_total = 0
-    merge_assign_total = 0
+    # Tekrar başına örnekler (sonuç deposundaki anlamlılık testleri için)
+    samples = {algo: ([], []) for algo, _ in algos}   # (süre_ms, energy_proxy)
+    energy_samples = {algo: [] for algo, _ in algos}  # tekrar başına Joule
+    energy_windows = {algo: [] for algo, _ in algos}
 
-    # QuickSort toplamları
-    quick_time_total = 0.0
-    quick_comp_total = 0
-    quick_assign_total = 0
+    owns_meter = energy_meter is None or isinstance(energy_meter, str)
+    if owns_meter:
+        from energy_meters import get_energy_meter
+        energy_meter = get_energy_meter(energy_meter or DEFAULT_ENERGY_METER)
+
+    # Arka plan örnekleyici: measure_sort onu sıradan bir ölçer gibi kullanır
+    sampler = None
+    meter = energy_meter
+    cached = None
+    trace_sent = None
 
     tracker = None
     energy_joule = None
     emissions_kg = None
 
-    # CodeCarbon: Bu (n, mode) senaryosunun tüm repetitions çalışmasını kapsasın
-    if ENABLE_CODECARBON and EmissionsTracker is not None:
-        tracker = EmissionsTracker(
-            project_name=f"DivideConquer_{mode}_{n}",
-            measure_power_secs=1,
-            log_level="error",
-            save_to_file=False,
-        )
-        tracker.start()
-
-    for _ in range(repetitions):
-        # Her deney için aynı senaryoya uygun dizi üret
-        base_arr = generate_array(n, mode)
-
-        # ----------------- MERGESORT -----------------
-        c_merge = Counters()
-        arr_merge = base_arr.copy()
-        start = time.perf_counter()
-        _ = mergesort(arr_merge, c_merge)
-        end = time.perf_counter()
+    try:
+        if sample_interval:
+            from energy_meters import PowerSampler
+            sampler = meter = PowerSampler(energy_meter, interval=sample_interval).start()
 
-        merge_time_total += (end - start)
-        merge_comp_total += c_merge.comparisons
-        merge_assign_total += c_merge.assignments
+        # CodeCarbon: Bu (n, mode) senaryosunun tüm repetitions çalışmasını kapsasın
+        if ENABLE_CODECARBON:
+            from codecarbon import EmissionsTracker
+            tracker = EmissionsTracker(
+                project_name=f"DivideConquer_{mode}_{n}",
+                measure_power_secs=1,
+                log_level="error",
+                save_to_file=False,
+            )
+            tracker.start()
 
-        # ----------------- QUICKSORT -----------------
-        c_quick = Counters()
-        arr_quick = base_arr.copy()
-        start = time.perf_counter()
-        quicksort(arr_quick, c_quick)
-        end = time.perf_counter()
+        cache = None
+        if dataset_cache is not None and seed is not None:
+            from datasets import DatasetCache
+            cache = DatasetCache(dataset_cache)
+
+        steps_total = len(algos) * repetitions
+        for rep in range(repetitions):
+            # Her tekrar için senaryoya uygun dizi (önbellek varsa aynı tohumlu dosyadan)
+            data_seed = cell_seed(seed, n, mode, rep) if seed is not None else None
+            if cache is not None:
+                cached = base_arr = cache.get(n, mode, data_seed, backend)
+            else:
+                base_arr = generate_array(n, mode, backend=backend, seed=data_seed)
+
+            # Her algoritma aynı diziyi kendi kopyası üzerinde sıralar
+            for index, (algo, sort_fn) in enumerate(algos):
+                if seed is not None:
+                    random.seed(cell_seed(seed, n, mode, rep, algo))
+                wall_start = time.time()
+                elapsed, counters, joules = measure_sort(sort_fn, base_arr, instrumentation, meter)
+                if run_windows is not None:
+                    run_windows.append({"algo": algo, "n": n, "mode": mode, "rep": rep,
+                                        "start": wall_start, "end": time.time()})
+
+                acc = totals[algo]
+                acc[0] += elapsed
+                acc[1] += counters.comparisons
+                acc[2] += counters.assignments
+                acc[3] += counters.max_stack_depth
+                acc[4] += counters.bytes_moved
+                acc[5] += counters.cache_misses
+                acc[6] += counters.bucket_ops
+                if joules is not None:
+                    energy_totals[algo] = (energy_totals[algo] or 0.0) + joules
+                    energy_samples[algo].append(joules)
+                    if sampler is not None:
+                        start, end, _ = sampler.windows[-1]
+                        energy_windows[algo].append({
+                            "rep": rep,
+                            "start_s": start - sampler.started_at,
+                            "end_s": end - sampler.started_at,
+                            "joules": joules,
+                            "watts": joules / (end - start) if end > start else None,
+                        })
+                if sampler is not None and power_callback is not None:
+                    points = sampler.trace(since=trace_sent)
+                    if points:
+                        trace_sent = points[-1][0]
+                        power_callback(points)
+                samples[algo][0].append(elapsed * 1000.0)
+                samples[algo][1].append(counters.comparisons + counters.assignments + counters.bucket_ops)
+                if progress is not None:
+                    progress(rep * len(algos) + index + 1, steps_total)
+
+            # ----------------- numpy.sort REFERANSI -----------------
+            if np_totals is not None:
+                for kind, elapsed in numpy_sort_times(base_arr).items():
+                    np_totals[kind] += elapsed
 
-        quick_time_total += (end - start)
-        quick_comp_total += c_quick.comparisons
-        quick_assign_total += c_quick.assignments
+            if cached is not None:
+                cached.close()
+                cached = None
+
+        profiles = {algo: None for algo, _ in algos}
+        if profile and backend == "list":
+            from profiling import profile_run, PROFILED_MERGE_ENGINES
+            base_arr = generate_array(n, mode, seed=cell_seed(seed, n, mode, 0) if seed is not None else None)
+            profiles.update({
+                algo: profile_run(algo, base_arr, mode, seed=cell_seed(seed or 0, n, mode, 0, algo),
+                                  merge_engine=merge_engine, config=quick_config).records()
+                for algo in ("MergeSort", "QuickSort")
+                if algo != "MergeSort" or merge_engine in PROFILED_MERGE_ENGINES
+            })
+    finally:
+        # Sıralama hata verse de örnekleyici iş parçacığı durur, ölçer kapanır
+        if cached is not None:
+            cached.close()
+        if sampler is not None:
+            sampler.stop()
+        if owns_meter:
+            energy_meter.close()
+
+    power_traces = {algo: None for algo, _ in algos}
+    if sampler is not None:
+        trace = sampler.trace()
+        power_traces = {algo: _trace_in_windows(trace, energy_windows[algo]) for algo, _ in algos}
 
     # Tracker stop: MUTLAKA for döngüsünün DIŞINDA olmalı
     if tracker is not None:
@@ -99,95 +419,865 @@ def run_single_experiment(n: int, mode: str, repetitions: int = 5):
         energy_kwh = getattr(data, "energy_consumed", None) if data is not None else None
         energy_joule = (energy_kwh * 3_600_000) if energy_kwh is not None else None  # 1 kWh = 3.6e6 J
 
-    # Ortalamalar (ms cinsinden süre)
-    merge_avg_time_ms = (merge_time_total / repetitions) * 1000.0
-    quick_avg_time_ms = (quick_time_total / repetitions) * 1000.0
-
-    merge_results = {
-        "algo": "MergeSort",
-        "n": n,
-        "mode": mode,
-        "repetitions": repetitions,
-        "avg_time_ms": merge_avg_time_ms,
-        "avg_comp": merge_comp_total / repetitions,
-        "avg_assign": merge_assign_total / repetitions,
-        "energy_proxy": (merge_comp_total + merge_assign_total) / repetitions,
-        "energy_joule": energy_joule,     # CodeCarbon’dan (tahmini) Joule
-        "emissions_kg": emissions_kg,     # kgCO2eq
+    # numpy.sort referans süreleri (ms) — senaryo başına, bütün satırlarda aynı
+    np_ref = {
+        f"np_{kind}_ms": (np_totals[kind] / repetitions) * 1000.0 if np_totals is not None else None
+        for kind in ("mergesort", "quicksort", "stable")
     }
 
-    quick_results = {
-        "algo": "QuickSort",
-        "n": n,
-        "mode": mode,
-        "repetitions": repetitions,
-        "avg_time_ms": quick_avg_time_ms,
-        "avg_comp": quick_comp_total / repetitions,
-        "avg_assign": quick_assign_total / repetitions,
-        "energy_proxy": (quick_comp_total + quick_assign_total) / repetitions,
-        "energy_joule": energy_joule,     # aynı senaryo ölçümü (ikisi aynı tracker içinde)
-        "emissions_kg": emissions_kg,
+    results = []
+    for algo, _ in algos:
+        time_total, comp_total, assign_total, stack_total, bytes_total, miss_total, bucket_total = totals[algo]
+        # Algoritma başına ortalama Joule; ölçer yoksa CodeCarbon'un senaryo değeri
+        energy = energy_totals[algo] / repetitions if energy_totals[algo] is not None else energy_joule
+        results.append(summarize_results(
+            algo, n, mode, repetitions, time_total, comp_total, assign_total,
+            stack_total if algo in STACK_ALGORITHMS else None, bytes_total, miss_total, bucket_total,
+            **algorithm_label(algo, merge_engine, quick_config, radix_bits),
+            instrumentation=instrumentation,
+            energy_joule=energy,           # ölçülen ortalama Joule (algoritmaya özel)
+            emissions_kg=emissions_kg,     # kgCO2eq
+            backend=backend,
+            time_samples_ms=samples[algo][0],
+            proxy_samples=samples[algo][1],
+            energy_samples_j=energy_samples[algo] or None,
+            energy_windows=energy_windows[algo] if sampler is not None else None,
+            power_trace=power_traces[algo],
+            profile=profiles[algo],
+            **np_ref,
+        ))
+    return tuple(results)
+
+
+def _trace_in_windows(trace, windows):
+    """trace [(t_sn, watt), ...] noktalarından windows'taki (start_s..end_s) aralıklara düşenler."""
+    from bisect import bisect_left, bisect_right
+
+    times = [t for t, _ in trace]
+    points = []
+    for window in windows:
+        lo = bisect_left(times, window["start_s"])
+        hi = bisect_right(times, window["end_s"])
+        points.extend(trace[lo:hi])
+    return points
+
+
+# --------------------------------------------------
+# İstatistiksel koşucu (ısınma + uyarlamalı tekrar + güven aralığı)
+# --------------------------------------------------
+def run_statistical_experiment(n: int, mode: str, merge_engine: str = "topdown",
+                               instrumentation: str = "uncounted", backend: str = "list", seed: int = 0,
+                               quick_config: QuickSortConfig = None, energy_meter=None,
+                               warmup: int = 2, min_repetitions: int = 5, max_repetitions: int = 200,
+                               ci_target: float = 0.05, time_budget: float = 10.0,
+                               confidence: float = 0.95, radix_bits: int = DEFAULT_RADIX_BITS):
+    """
+    run_single_experiment'in istatistiksel sürümü.
+
+    - Önce 'warmup' ısınma koşusu yapılır (sonuçlar atılır).
+    - Zamanlanan bölümlerde çöp toplayıcı kapalıdır (measure_sort(disable_gc=True)).
+    - Tekrarlar, bütün algoritmaların süre güven aralığının yarı genişliği
+      ortalamanın ci_target oranına inene kadar (örn. 0.05 -> ±%5) sürer;
+      time_budget saniye dolarsa ya da max_repetitions'a ulaşılırsa durur.
+      Her tekrar cell_seed(seed, n, mode, rep) ile yeni bir dizi kullanır.
+
+    Varsayılan instrumentation "uncounted"tır: süre sayaç maliyeti içermez,
+    sayaçlar 0 kalır. Sayaç da isteniyorsa "split" kullanılabilir.
+
+    Dönüş:
+        ALGORITHMS sırasıyla sonuç sözlükleri — summarize_results alanlarına ek olarak
+        time_{median,p95,std,ci_low,ci_high}_ms, energy_{mean,median,p95,std,ci_low,ci_high}_j,
+        warmup, converged (CI hedefine ulaşıldı mı) alanları.
+    """
+    algos, merge_engine = resolve_algorithms(merge_engine, backend, quick_config, radix_bits)
+
+    owns_meter = energy_meter is None or isinstance(energy_meter, str)
+    if owns_meter:
+        from energy_meters import get_energy_meter
+        energy_meter = get_energy_meter(energy_meter or DEFAULT_ENERGY_METER)
+
+    from stats import describe, relative_ci_width
+
+    samples = {algo: {"time": [], "energy": [], "proxy": [], "comp": 0, "assign": 0, "stack": 0,
+                      "bytes": 0, "misses": 0, "buckets": 0}
+               for algo, _ in algos}
+    try:
+        for w in range(warmup):
+            base_arr = generate_array(n, mode, backend=backend, seed=cell_seed(seed, n, mode, "warmup", w))
+            for algo, sort_fn in algos:
+                measure_sort(sort_fn, base_arr, instrumentation, disable_gc=True)
+
+        budget_end = time.perf_counter() + time_budget
+        converged = False
+        rep = 0
+        while rep < max_repetitions:
+            base_arr = generate_array(n, mode, backend=backend, seed=cell_seed(seed, n, mode, rep))
+            for algo, sort_fn in algos:
+                random.seed(cell_seed(seed, n, mode, rep, algo))
+                elapsed, counters, joules = measure_sort(sort_fn, base_arr, instrumentation,
+                                                         energy_meter, disable_gc=True)
+                acc = samples[algo]
+                acc["time"].append(elapsed)
+                if joules is not None:
+                    acc["energy"].append(joules)
+                acc["proxy"].append(counters.comparisons + counters.assignments + counters.bucket_ops)
+                acc["comp"] += counters.comparisons
+                acc["assign"] += counters.assignments
+                acc["stack"] += counters.max_stack_depth
+                acc["bytes"] += counters.bytes_moved
+                acc["misses"] += counters.cache_misses
+                acc["buckets"] += counters.bucket_ops
+            rep += 1
+
+            if rep >= min_repetitions:
+                converged = all(
+                    relative_ci_width(describe(acc["time"], confidence)) <= ci_target
+                    for acc in samples.values()
+                )
+                if converged or time.perf_counter() >= budget_end:
+                    break
+    finally:
+        if owns_meter:
+            energy_meter.close()
+
+    results = []
+    for algo, _ in algos:
+        acc = samples[algo]
+        t = describe(acc["time"], confidence)
+        e = describe(acc["energy"], confidence)
+        extra = {
+            "instrumentation": instrumentation,
+            "backend": backend,
+            "time_samples_ms": [t_ * 1000.0 for t_ in acc["time"]],
+            "proxy_samples": acc["proxy"],
+            "warmup": warmup,
+            "converged": converged,
+            "energy_joule": e["mean"],
+            **{f"time_{key}_ms": (t[stat] * 1000.0 if t[stat] is not None else None)
+               for key, stat in (("median", "median"), ("p95", "p95"), ("std", "stddev"),
+                                 ("ci_low", "ci_low"), ("ci_high", "ci_high"))},
+            **{f"energy_{key}_j": e[stat]
+               for key, stat in (("mean", "mean"), ("median", "median"), ("p95", "p95"), ("std", "stddev"),
+                                 ("ci_low", "ci_low"), ("ci_high", "ci_high"))},
+        }
+        extra.update(algorithm_label(algo, merge_engine, quick_config, radix_bits))
+        stack_total = acc["stack"] if algo in STACK_ALGORITHMS else None
+        results.append(summarize_results(algo, n, mode, rep, sum(acc["time"]), acc["comp"], acc["assign"],
+                                         stack_total, acc["bytes"], acc["misses"], acc["buckets"], **extra))
+    return tuple(results)
+
+
+# --------------------------------------------------
+# Paralel deney ızgarası (ProcessPoolExecutor)
+# --------------------------------------------------
+@dataclass(frozen=True)
+class ExperimentCell:
+    """Izgaradaki tek bir iş: (n, mode, algo, tekrar) + temel tohum."""
+    n: int
+    mode: str
+    algo: str
+    rep: int
+    seed: int
+
+
+def _pin_worker(cpus, next_slot):
+    """
+    ProcessPoolExecutor initializer'ı: her işçiyi cpus listesinden sıradaki
+    çekirdeğe sabitler (yalnızca os.sched_setaffinity olan sistemlerde, ör. Linux).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+
+def _run_cell(cell: ExperimentCell, merge_engine: str, instrumentation: str, backend: str,
+              quick_config: QuickSortConfig = None, dataset_cache: str = None,
+              radix_bits: int = DEFAULT_RADIX_BITS):
+    """
+    Tek hücreyi işçi süreçte çalıştırır. Dizi (n, mode, rep) tohumundan üretildiği
+    için aynı tekrardaki bütün algoritma hücreleri AYNI diziyi sıralar.
+    dataset_cache verilirse dizi önbellekten aynı (n, mode, rep) tohumuyla alınır;
+    bütün işçiler aynı dosyayı (ve işletim sisteminin sayfa önbelleğini) paylaşır.
+
+    Dönüş:
+        (cell, geçen_süre_saniye, comparisons, assignments, max_stack_depth, bytes_moved, cache_misses,
+         bucket_ops)
+    """
+    algos, _ = resolve_algorithms(merge_engine, backend, quick_config, radix_bits)
+    sort_fn = dict(algos)[cell.algo]
+
+    data_seed = cell_seed(cell.seed, cell.n, cell.mode, cell.rep)
+    if dataset_cache is not None:
+        from datasets import DatasetCache
+        base_arr = DatasetCache(dataset_cache).get(cell.n, cell.mode, data_seed, backend)
+    else:
+        base_arr = generate_array(cell.n, cell.mode, backend=backend, seed=data_seed)
+    random.seed(cell_seed(cell.seed, cell.n, cell.mode, cell.rep, cell.algo))
+    elapsed, counters, _ = measure_sort(sort_fn, base_arr, instrumentation)
+    if dataset_cache is not None:
+        base_arr.close()
+    return (cell, elapsed, counters.comparisons, counters.assignments, counters.max_stack_depth,
+            counters.bytes_moved, counters.cache_misses, counters.bucket_ops)
+
+
+def run_experiments_parallel(sizes, modes, repetitions: int = 5, workers: int = None,
+                             pin_cpus: bool = False, seed: int = 0,
+                             merge_engine: str = "topdown", instrumentation: str = "counted",
+                             backend: str = "list", quick_config: QuickSortConfig = None,
+                             dataset_cache: str = None, radix_bits: int = DEFAULT_RADIX_BITS):
+    """
+    sizes x modes x ALGORITHMS x repetitions hücrelerini bir
+    ProcessPoolExecutor'a dağıtır ve sonuçları run_single_experiment ile
+    AYNI sözlük yapısında toplar.
+
+    Parametreler:
+        workers  : işçi süreç sayısı (None -> os.cpu_count())
+        pin_cpus : True ise her işçi ayrı bir çekirdeğe sabitlenir (Linux)
+        seed     : temel tohum; hücre tohumları cell_seed ile türetilir, bu yüzden
+                   sonuçlar (süre hariç) işçi sayısından bağımsızdır
+        dataset_cache: verilirse (dizin yolu) diziler datasets.DatasetCache'ten
+                   alınır (bkz. run_single_experiment)
+
+    Not: RAPL/perf sayaçları paket geneli olduğundan eşzamanlı hücreler birbirinin
+    enerjisini ölçerdi; bu yüzden paralel modda energy_joule / emissions_kg ve
+    numpy.sort referans sütunları None kalır.
+
+    Dönüş:
+        [(merge_results, quick_results, tim_results, ...), ...]  — ALGORITHMS sırasıyla, (n, mode) sırasıyla
+    """
+    algos = ALGORITHMS
+    cells = [
+        ExperimentCell(n, mode, algo, rep, seed)
+        for n in sizes for mode in modes for rep in range(repetitions) for algo in algos
+    ]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    initializer, initargs = None, ()
+    if pin_cpus:
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        if cpus:
+            initializer, initargs = _pin_worker, (cpus, multiprocessing.Value("i", 0))
+
+    # (n, mode, algo) -> [süre, comp, assign, stack, bytes, misses, buckets] toplamları ve tekrar başına örnekler
+    totals = {}
+    samples = {}
+    job = partial(_run_cell, merge_engine=merge_engine, instrumentation=instrumentation, backend=backend,
+                  quick_config=quick_config, dataset_cache=dataset_cache, radix_bits=radix_bits)
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        for cell, elapsed, comps, assigns, stack, moved, misses, buckets in pool.map(job, cells, chunksize=1):
+            acc = totals.setdefault((cell.n, cell.mode, cell.algo), [0.0, 0, 0, 0, 0, 0, 0])
+            acc[0] += elapsed
+            acc[1] += comps
+            acc[2] += assigns
+            acc[3] += stack
+            acc[4] += moved
+            acc[5] += misses
+            acc[6] += buckets
+            times, proxies = samples.setdefault((cell.n, cell.mode, cell.algo), ([], []))
+            times.append(elapsed * 1000.0)
+            proxies.append(comps + assigns + buckets)
+
+    _, _, engine = resolve_sort_functions(merge_engine, backend)
+    extra = {
+        "instrumentation": instrumentation,
+        "energy_joule": None,
+        "emissions_kg": None,
+        "backend": backend,
+        "np_mergesort_ms": None,
+        "np_quicksort_ms": None,
+        "np_stable_ms": None,
     }
 
-    return merge_results, quick_results
+    results = []
+    for n in sizes:
+        for mode in modes:
+            row = []
+            for algo in algos:
+                (time_total, comp_total, assign_total, stack_total,
+                 bytes_total, miss_total, bucket_total) = totals[(n, mode, algo)]
+                times, proxies = samples[(n, mode, algo)]
+                row.append(summarize_results(algo, n, mode, repetitions, time_total, comp_total, assign_total,
+                                             stack_total if algo in STACK_ALGORITHMS else None,
+                                             bytes_total, miss_total, bucket_total,
+                                             **algorithm_label(algo, engine, quick_config, radix_bits),
+                                             time_samples_ms=times, proxy_samples=proxies, **extra))
+            results.append(tuple(row))
+    return results
+
+
+# --------------------------------------------------
+# QuickSort ayar taraması
+# --------------------------------------------------
+def run_quicksort_sweep(n: int, modes, configs=QUICKSORT_SWEEP, repetitions: int = 5,
+                        instrumentation: str = "counted", seed: int = 0):
+    """
+    Her mode için configs içindeki QuickSort ayarlarını AYNI dizilerde çalıştırır.
+
+    Dönüş:
+        (rows, best)
+          rows: sonuç sözlükleri ("variant" alanı config.label())
+          best: {mode: en düşük energy_proxy'li satır}
+    """
+    rows = []
+    best = {}
+    for mode in modes:
+        arrays = [generate_array(n, mode, seed=cell_seed(seed, n, mode, rep)) for rep in range(repetitions)]
+        for config in configs:
+            sort_fn = partial(quicksort, config=config)
+            time_total, comp_total, assign_total, stack_total = 0.0, 0, 0, 0
+            for rep, base_arr in enumerate(arrays):
+                random.seed(cell_seed(seed, n, mode, rep, "QuickSort"))
+                elapsed, counters, _ = measure_sort(sort_fn, base_arr, instrumentation)
+                time_total += elapsed
+                comp_total += counters.comparisons
+                assign_total += counters.assignments
+                stack_total += counters.max_stack_depth
+
+            res = summarize_results("QuickSort", n, mode, repetitions, time_total, comp_total, assign_total,
+                                    stack_total, variant=config.label(), instrumentation=instrumentation)
+            rows.append(res)
+            if mode not in best or res["energy_proxy"] < best[mode]["energy_proxy"]:
+                best[mode] = res
+    return rows, best
+
+
+# --------------------------------------------------
+# MergeSort motor karşılaştırması (bellek geçişleri vs karşılaştırmalar)
+# --------------------------------------------------
+def run_merge_engine_comparison(n: int, modes, engines=tuple(MERGESORT_ENGINES), repetitions: int = 3,
+                                instrumentation: str = "split", seed: int = 0, energy_meter=None):
+    """
+    Her mode için MergeSort motorlarını AYNI dizilerde çalıştırır: 2-yollu
+    (topdown / bottomup / natural), k-yollu loser tree (kway) ve cache-blocked
+    (blocked). avg_bytes_moved / avg_cache_misses ile süre ve energy_joule yan
+    yana konunca daha az bellek geçişinin daha az karşılaştırmadan önemli olup
+    olmadığı görülür.
+
+    Varsayılan instrumentation "split": süre ve enerji sayaçsız koşudan gelir.
+
+    Dönüş:
+        (rows, best)
+          rows: sonuç sözlükleri ("variant" alanı motor adı)
+          best: {mode: {"time": en hızlı satır, "energy": en düşük energy_joule'lü satır (ölçüm yoksa None)}}
+    """
+    owns_meter = energy_meter is None or isinstance(energy_meter, str)
+    if owns_meter:
+        from energy_meters import get_energy_meter
+        energy_meter = get_energy_meter(energy_meter or DEFAULT_ENERGY_METER)
+
+    rows = []
+    best = {}
+    try:
+        for mode in modes:
+            arrays = [generate_array(n, mode, seed=cell_seed(seed, n, mode, rep)) for rep in range(repetitions)]
+            mode_rows = []
+            for engine in engines:
+                sort_fn = MERGESORT_ENGINES[engine]
+                totals = [0.0, 0, 0, 0, 0]
+                energy_total = None
+                for base_arr in arrays:
+                    elapsed, counters, joules = measure_sort(sort_fn, base_arr, instrumentation, energy_meter)
+                    totals[0] += elapsed
+                    totals[1] += counters.comparisons
+                    totals[2] += counters.assignments
+                    totals[3] += counters.bytes_moved
+                    totals[4] += counters.cache_misses
+                    if joules is not None:
+                        energy_total = (energy_total or 0.0) + joules
+                time_total, comp_total, assign_total, bytes_total, miss_total = totals
+                mode_rows.append(summarize_results(
+                    "MergeSort", n, mode, repetitions, time_total, comp_total, assign_total,
+                    None, bytes_total, miss_total, variant=engine, instrumentation=instrumentation,
+                    energy_joule=energy_total / repetitions if energy_total is not None else None,
+                ))
+            rows.extend(mode_rows)
+            measured = [res for res in mode_rows if res["energy_joule"] is not None]
+            best[mode] = {
+                "time": min(mode_rows, key=lambda res: res["avg_time_ms"]),
+                "energy": min(measured, key=lambda res: res["energy_joule"]) if measured else None,
+            }
+    finally:
+        if owns_meter:
+            energy_meter.close()
+    return rows, best
+
+
+# --------------------------------------------------
+# Harici (external) MergeSort deneyi
+# --------------------------------------------------
+def run_external_experiment(n: int, mode: str, chunk_size: int = None, fmt: str = "binary",
+                            repetitions: int = 1, use_mmap: bool = False, seed: int = None):
+    """
+    generate_array ile üretilen diziyi geçici bir dosyaya yazar ve external_sort
+    ile dosyadan dosyaya sıralar. Dosyaya yazma süresi ölçüme dahil değildir.
+
+    chunk_size verilmezse n / 8 alınır (en az 8 run oluşsun diye).
+
+    Dönüş:
+        Sonuç sözlüğü; standart alanlara ek olarak runs, avg_bytes_read,
+        avg_bytes_written.
+    """
+    import tempfile
+    from external_sort import external_sort, write_array
+
+    chunk_size = chunk_size or max(1, n // 8)
+    time_total, comp_total, assign_total = 0.0, 0, 0
+    runs = bytes_read = bytes_written = 0
+
+    with tempfile.TemporaryDirectory(prefix="extbench_") as work_dir:
+        in_path = os.path.join(work_dir, "input.dat")
+        out_path = os.path.join(work_dir, "output.dat")
+        for rep in range(repetitions):
+            data_seed = cell_seed(seed, n, mode, rep) if seed is not None else None
+            write_array(in_path, generate_array(n, mode, seed=data_seed), fmt)
+
+            counters = Counters()
+            start = time.perf_counter()
+            stats = external_sort(in_path, out_path, counters, chunk_size=chunk_size, fmt=fmt,
+                                  use_mmap=use_mmap, tmp_dir=work_dir)
+            end = time.perf_counter()
+
+            time_total += end - start
+            comp_total += counters.comparisons
+            assign_total += counters.assignments
+            runs = stats.runs
+            bytes_read += stats.bytes_read
+            bytes_written += stats.bytes_written
+
+    return summarize_results(
+        "ExtMerge", n, mode, repetitions, time_total, comp_total, assign_total,
+        runs=runs,
+        avg_bytes_read=bytes_read / repetitions,
+        avg_bytes_written=bytes_written / repetitions,
+        chunk_size=chunk_size,
+        file_format=fmt,
+    )
+
+
+# --------------------------------------------------
+# Paralel sıralama ölçekleme deneyi (speedup / verimlilik)
+# --------------------------------------------------
+def run_parallel_scaling(n: int, mode: str, core_counts=(1, 2, 4, 8), repetitions: int = 3,
+                         cutoff: int = None, instrumentation: str = "counted", seed: int = None):
+    """
+    parallel_sort içindeki çok süreçli MergeSort/QuickSort'u farklı çekirdek
+    sayılarıyla çalıştırır.
+
+    - workers=1 satırı seri sayaçlı koddur (referans süre).
+    - speedup    = seri_süre / paralel_süre
+    - efficiency = speedup / workers
 
+    Her çekirdek sayısı için havuz bir kez açılır ve tekrarlar boyunca kullanılır;
+    süreç başlatma maliyeti ölçüme dahil edilmez.
 
-def run_all_experiments():
+    Dönüş:
+        Sonuç sözlükleri listesi (algo başına, core_counts sırasıyla).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from parallel_sort import parallel_mergesort, parallel_quicksort, DEFAULT_CUTOFF
+
+    cutoff = DEFAULT_CUTOFF if cutoff is None else cutoff
+    arrays = [
+        generate_array(n, mode, seed=cell_seed(seed, n, mode, rep) if seed is not None else None)
+        for rep in range(repetitions)
+    ]
+
+    results = []
+    for algo, parallel_fn in (("MergeSort", parallel_mergesort), ("QuickSort", parallel_quicksort)):
+        serial_time = None
+        for workers in core_counts:
+            time_total, comp_total, assign_total = 0.0, 0, 0
+            pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+            try:
+                sort_fn = partial(parallel_fn, workers=workers, cutoff=cutoff, executor=pool)
+                for rep, base_arr in enumerate(arrays):
+                    if seed is not None:
+                        random.seed(cell_seed(seed, n, mode, rep, algo))
+                    elapsed, counters, _ = measure_sort(sort_fn, base_arr, instrumentation)
+                    time_total += elapsed
+                    comp_total += counters.comparisons
+                    assign_total += counters.assignments
+            finally:
+                if pool is not None:
+                    pool.shutdown()
+
+            if serial_time is None:
+                serial_time = time_total
+            speedup = serial_time / time_total if time_total > 0 else None
+            results.append(summarize_results(
+                algo, n, mode, repetitions, time_total, comp_total, assign_total,
+                workers=workers,
+                speedup=speedup,
+                efficiency=speedup / workers if speedup is not None else None,
+                instrumentation=instrumentation,
+            ))
+    return results
+
+
+# --------------------------------------------------
+# Profil (faz / derinlik / bellek) deneyi
+# --------------------------------------------------
+def run_profiled_experiment(n: int, mode: str, merge_engine: str = "topdown", quick_config: QuickSortConfig = None,
+                            seed: int = 0, trace_memory: bool = True):
+    """
+    Aynı dizi üzerinde MergeSort ve QuickSort için birer profil koşusu yapar
+    (profiling.py: faz süreleri, derinlik başına sayaçlar, tracemalloc belleği).
+
+    Dönüş:
+        Düz kayıtlar listesi (SortProfile.records(); "kind" = run / phase / depth).
+    """
+    from profiling import profile_run
+
+    base_arr = generate_array(n, mode, seed=cell_seed(seed, n, mode, 0))
+    records = []
+    for algo in ("MergeSort", "QuickSort"):
+        profile = profile_run(algo, base_arr, mode, seed=cell_seed(seed, n, mode, 0, algo),
+                              trace_memory=trace_memory, merge_engine=merge_engine, config=quick_config)
+        records.extend(profile.records())
+    return records
+
+
+def export_records(records, path: str):
+    """
+    Sözlük kayıtlarını dosyaya yazar: ".csv" uzantısında CSV (sütunlar tüm
+    kayıtların anahtar birleşimi), diğerlerinde satır başına bir JSON (JSONL).
+    """
+    import csv
+    import json
+
+    if path.endswith(".csv"):
+        fields = list(dict.fromkeys(key for record in records for key in record))
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(records)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+
+# Terminal tablosu sütunları: (sonuç anahtarı, başlık, hizalama+genişlik, sayı formatı)
+# Değer None ise hücreye "-" basılır.
+TABLE_COLUMNS = [
+    ("algo", "Algo", "<12", ""),
+    ("n", "n", ">8", ""),
+    ("mode", "mode", ">10", ""),
+    ("avg_time_ms", "avg_time_ms", ">15", ".3f"),
+    ("avg_comp", "avg_comp", ">12", ".1f"),
+    ("avg_assign", "avg_assign", ">12", ".1f"),
+    ("avg_bytes_moved", "bytes_moved", ">13", ".0f"),
+    ("avg_cache_misses", "est_misses", ">11", ".0f"),
+    ("avg_bucket_ops", "bucket_ops", ">12", ".1f"),
+    ("avg_stack_depth", "stack", ">7", ".1f"),
+    ("energy_proxy", "energy_proxy", ">13", ".1f"),
+    ("energy_joule", "energy_joule", ">13", ".4f"),
+    ("emissions_kg", "emissions_kg", ">13", ".8f"),
+]
+
+# backend="numpy" iken eklenen numpy.sort karşılaştırma sütunları
+NUMPY_TABLE_COLUMNS = [
+    ("np_mergesort_ms", "np_mergesort_ms", ">16", ".3f"),
+    ("np_quicksort_ms", "np_quicksort_ms", ">16", ".3f"),
+    ("np_stable_ms", "np_stable_ms", ">13", ".3f"),
+]
+
+
+# run_merge_engine_comparison tablosu
+MERGE_ENGINE_TABLE_COLUMNS = [
+    ("variant", "engine", "<10", ""),
+    ("n", "n", ">9", ""),
+    ("mode", "mode", ">10", ""),
+    ("avg_time_ms", "avg_time_ms", ">13", ".3f"),
+    ("avg_comp", "avg_comp", ">13", ".1f"),
+    ("avg_assign", "avg_assign", ">13", ".1f"),
+    ("avg_bytes_moved", "bytes_moved", ">13", ".0f"),
+    ("avg_cache_misses", "est_misses", ">11", ".0f"),
+    ("energy_proxy", "energy_proxy", ">13", ".1f"),
+    ("energy_joule", "energy_joule", ">13", ".4f"),
+]
+
+
+# run_quicksort_sweep tablosu
+SWEEP_TABLE_COLUMNS = [
+    ("variant", "variant", "<34", ""),
+    ("n", "n", ">8", ""),
+    ("mode", "mode", ">10", ""),
+    ("avg_time_ms", "avg_time_ms", ">15", ".3f"),
+    ("avg_comp", "avg_comp", ">12", ".1f"),
+    ("avg_assign", "avg_assign", ">12", ".1f"),
+    ("avg_stack_depth", "stack", ">7", ".1f"),
+    ("energy_proxy", "energy_proxy", ">13", ".1f"),
+]
+
+# run_external_experiment tablosu
+EXTERNAL_TABLE_COLUMNS = [
+    ("algo", "Algo", "<10", ""),
+    ("n", "n", ">10", ""),
+    ("mode", "mode", ">10", ""),
+    ("runs", "runs", ">6", ""),
+    ("avg_time_ms", "avg_time_ms", ">15", ".3f"),
+    ("avg_comp", "avg_comp", ">14", ".1f"),
+    ("avg_assign", "avg_assign", ">14", ".1f"),
+    ("energy_proxy", "energy_proxy", ">14", ".1f"),
+    ("avg_bytes_read", "bytes_read", ">14", ".0f"),
+    ("avg_bytes_written", "bytes_written", ">14", ".0f"),
+]
+
+# run_parallel_scaling tablosu
+PARALLEL_TABLE_COLUMNS = [
+    ("algo", "Algo", "<10", ""),
+    ("n", "n", ">10", ""),
+    ("mode", "mode", ">10", ""),
+    ("workers", "workers", ">8", ""),
+    ("avg_time_ms", "avg_time_ms", ">15", ".3f"),
+    ("speedup", "speedup", ">9", ".2f"),
+    ("efficiency", "efficiency", ">11", ".2f"),
+    ("avg_comp", "avg_comp", ">14", ".1f"),
+    ("avg_assign", "avg_assign", ">14", ".1f"),
+]
+
+
+# run_profiled_experiment kayıtları için sütunlar
+PROFILE_RUN_COLUMNS = [
+    ("algo", "Algo", "<10", ""),
+    ("variant", "variant", "<16", ""),
+    ("seconds", "total_s", ">10", ".4f"),
+    ("comparisons", "comparisons", ">13", "d"),
+    ("assignments", "assignments", ">13", "d"),
+    ("peak_bytes", "peak_bytes", ">12", "d"),
+    ("net_bytes", "net_bytes", ">11", "d"),
+    ("net_blocks", "net_blocks", ">11", "d"),
+]
+
+PROFILE_PHASE_COLUMNS = [
+    ("algo", "Algo", "<10", ""),
+    ("phase", "phase", "<10", ""),
+    ("seconds", "seconds", ">10", ".4f"),
+    ("share", "share", ">7", ".1%"),
+]
+
+PROFILE_DEPTH_COLUMNS = [
+    ("algo", "Algo", "<10", ""),
+    ("depth", "depth", ">6", "d"),
+    ("calls", "calls", ">8", "d"),
+    ("comparisons", "comparisons", ">12", "d"),
+    ("assignments", "assignments", ">12", "d"),
+    ("seconds", "seconds", ">10", ".4f"),
+]
+
+# run_statistical_experiment çıktısı için sütunlar
+STATS_TABLE_COLUMNS = [
+    ("algo", "Algo", "<12", ""),
+    ("n", "n", ">8", "d"),
+    ("mode", "mode", ">10", ""),
+    ("repetitions", "reps", ">5", "d"),
+    ("avg_time_ms", "mean_ms", ">10", ".3f"),
+    ("time_median_ms", "median_ms", ">10", ".3f"),
+    ("time_p95_ms", "p95_ms", ">10", ".3f"),
+    ("time_std_ms", "std_ms", ">9", ".3f"),
+    ("time_ci_low_ms", "ci_low_ms", ">10", ".3f"),
+    ("time_ci_high_ms", "ci_high_ms", ">10", ".3f"),
+    ("energy_median_j", "median_J", ">10", ".4f"),
+    ("energy_ci_low_j", "ci_low_J", ">10", ".4f"),
+    ("energy_ci_high_j", "ci_high_J", ">10", ".4f"),
+    ("converged", "conv", ">5", ""),
+]
+
+
+def format_header(columns=TABLE_COLUMNS) -> str:
+    """Tablo başlık satırını üretir."""
+    return " ".join(f"{title:{align}}" for _, title, align, _ in columns)
+
+
+def format_row(res: dict, columns=TABLE_COLUMNS) -> str:
+    """Tek bir sonuç sözlüğünü tablo satırına çevirir (eksik/None değerler "-")."""
+    cells = []
+    for key, _, align, fmt in columns:
+        value = res.get(key)
+        text = "-" if value is None else format(value, fmt)
+        cells.append(f"{text:{align}}")
+    return " ".join(cells)
+
+
+def _run_grid(sizes, modes, repetitions: int, backend: str, workers: int, pin_cpus: bool, seed: int):
+    """sizes x modes ızgarasını seri ya da paralel koşar; ALGORITHMS sırasıyla sonuç demetlerini (n, mode) sırasıyla üretir."""
+    if workers > 1:
+        return run_experiments_parallel(sizes, modes, repetitions, workers=workers, pin_cpus=pin_cpus,
+                                        seed=seed if seed is not None else 0, backend=backend)
+    return (run_single_experiment(n, mode, repetitions, backend=backend, seed=seed)
+            for n in sizes for mode in modes)
+
+
+def _run_grid_cached(store, sizes, modes, repetitions: int, backend: str, workers: int, pin_cpus: bool,
+                     seed: int):
+    """
+    _run_grid'in sonuç depolu sürümü: geçerli kod sürümü ve makine için depoda
+    olan hücreler tekrar koşulmaz, eksikler koşulup depoya yazılır.
+    """
+    from results_store import variant_key
+
+    _, engine = resolve_algorithms("topdown", backend)
+    variants = [variant_key(algo, *algorithm_label(algo, engine).values(), "counted", backend) for algo in ALGORITHMS]
+    cells = {(n, mode): tuple(store.get(v, n, mode, seed) for v in variants) for n in sizes for mode in modes}
+
+    missing = [key for key, row in cells.items() if None in row]
+    print(f"Sonuç deposu: {len(cells) - len(missing)}/{len(cells)} hücre depodan "
+          f"(kod {store.code}, makine {store.machine})\n")
+
+    # Eksik hücreler n başına gruplanır (paralel modda aynı n'in mode'ları tek havuzda)
+    for n in sizes:
+        n_modes = [mode for m_n, mode in missing if m_n == n]
+        if not n_modes:
+            continue
+        for mode, row in zip(n_modes, _run_grid([n], n_modes, repetitions, backend, workers, pin_cpus, seed)):
+            for res in row:
+                store.put(res, seed)
+            cells[(n, mode)] = row
+
+    return [cells[(n, mode)] for n in sizes for mode in modes]
+
+
+def run_all_experiments(backend: str = "list", workers: int = 1, pin_cpus: bool = False, seed: int = None,
+                        modes=None, store=None):
     """
     Farklı n ve senaryolar için deneyleri çalıştırır ve
     sonuçları terminale tablo benzeri bir formatta yazar.
+
+    modes: senaryo adları (workloads.WORKLOADS, örn. ["nearly_sorted:swap_pct=1", "zipf"]);
+    verilmezse random / sorted / reversed.
+
+    backend="numpy" ile NumPy motoru ve numpy.sort karşılaştırma sütunları kullanılır.
+    workers > 1 ise ızgara run_experiments_parallel ile süreç havuzunda koşar
+    (seed verilmezse 0 kullanılır).
+
+    store: results_store.ResultStore veya SQLite dosya yolu. Verilirse sonuçlar
+    depoya yazılır ve aynı kod sürümünde ölçülmüş hücreler tekrar koşulmaz
+    (seed verilmezse 0 kullanılır).
     """
     sizes = [1000, 5000, 10000]
-    modes = ["random", "sorted", "reversed"]
+    modes = list(modes) if modes else ["random", "sorted", "reversed"]
     repetitions = 5
 
+    columns = TABLE_COLUMNS + (NUMPY_TABLE_COLUMNS if backend == "numpy" else [])
+
     print("=== Divide & Conquer Enerji Deneyi (Python) ===\n")
     print(f"Tekrar sayısı (repetitions): {repetitions}\n")
 
-    header = (
-        f"{'Algo':<10} {'n':>8} {'mode':>10} "
-        f"{'avg_time_ms':>15} {'avg_comp':>12} {'avg_assign':>12} "
-        f"{'energy_proxy':>13} {'energy_joule':>13} {'emissions_kg':>13}"
-    )
+    owns_store = isinstance(store, str)
+    if owns_store:
+        from results_store import ResultStore
+        store = ResultStore(store)
+
+    try:
+        if store is not None:
+            grid = _run_grid_cached(store, sizes, modes, repetitions, backend, workers, pin_cpus,
+                                    seed if seed is not None else 0)
+        else:
+            grid = _run_grid(sizes, modes, repetitions, backend, workers, pin_cpus, seed)
+
+        header = format_header(columns)
+        print(header)
+        print("-" * len(header))
+
+        for i, row in enumerate(grid):
+            for res in row:
+                print(format_row(res, columns))
+
+            # Her n grubunun sonunda ayraç
+            if (i + 1) % len(modes) == 0:
+                print("-" * len(header))
+    finally:
+        if owns_store:
+            store.close()
+
+
+def print_statistical_experiments(sizes=(1000, 5000, 10000), modes=("random", "sorted", "reversed"), **options):
+    """run_statistical_experiment sonuçlarını (medyan, p95, std, güven aralığı) tablo olarak yazar."""
+    header = format_header(STATS_TABLE_COLUMNS)
+    print(header)
+    print("-" * len(header))
+    for n in sizes:
+        for mode in modes:
+            for res in run_statistical_experiment(n, mode, **options):
+                print(format_row(res, STATS_TABLE_COLUMNS))
+        print("-" * len(header))
+
+
+def print_quicksort_sweep(n: int, modes=("random", "sorted", "reversed"), repetitions: int = 5):
+    """run_quicksort_sweep sonuçlarını ve her mode için en ucuz ayarı yazar."""
+    rows, best = run_quicksort_sweep(n, modes, repetitions=repetitions)
+    header = format_header(SWEEP_TABLE_COLUMNS)
+    print(header)
+    print("-" * len(header))
+    for res in rows:
+        print(format_row(res, SWEEP_TABLE_COLUMNS))
+    print("-" * len(header))
+    for mode, res in best.items():
+        print(f"En ucuz ayar ({mode}): {res['variant']}  energy_proxy={res['energy_proxy']:.1f}")
+
+
+def print_merge_engine_comparison(n: int = 1_000_000, modes=("random", "sorted", "reversed"), **options):
+    """run_merge_engine_comparison sonuçlarını ve her mode için en hızlı / en az enerji harcayan motoru yazar."""
+    rows, best = run_merge_engine_comparison(n, modes, **options)
+    header = format_header(MERGE_ENGINE_TABLE_COLUMNS)
     print(header)
     print("-" * len(header))
+    for res in rows:
+        print(format_row(res, MERGE_ENGINE_TABLE_COLUMNS))
+    print("-" * len(header))
+    for mode, winners in best.items():
+        line = f"En hızlı motor ({mode}): {winners['time']['variant']}"
+        if winners["energy"] is not None:
+            line += f"  en düşük energy_joule: {winners['energy']['variant']}"
+        print(line)
+
 
+def print_external_experiment(sizes=(100_000, 1_000_000), modes=("random", "sorted", "reversed"),
+                              fmt: str = "binary"):
+    """run_external_experiment sonuçlarını (G/Ç bayt metrikleriyle) tablo olarak yazar."""
+    header = format_header(EXTERNAL_TABLE_COLUMNS)
+    print(header)
+    print("-" * len(header))
     for n in sizes:
         for mode in modes:
-            merge_res, quick_res = run_single_experiment(n, mode, repetitions)
-
-            # Format: enerji gelmezse "-" bas
-            m_ej = f"{merge_res['energy_joule']:.2f}" if merge_res["energy_joule"] is not None else "-"
-            m_em = f"{merge_res['emissions_kg']:.8f}" if merge_res["emissions_kg"] is not None else "-"
-
-            q_ej = f"{quick_res['energy_joule']:.2f}" if quick_res["energy_joule"] is not None else "-"
-            q_em = f"{quick_res['emissions_kg']:.8f}" if quick_res["emissions_kg"] is not None else "-"
-
-            print(
-                f"{merge_res['algo']:<10} "
-                f"{merge_res['n']:>8} "
-                f"{merge_res['mode']:>10} "
-                f"{merge_res['avg_time_ms']:>15.3f} "
-                f"{merge_res['avg_comp']:>12.1f} "
-                f"{merge_res['avg_assign']:>12.1f} "
-                f"{merge_res['energy_proxy']:>13.1f} "
-                f"{m_ej:>13} "
-                f"{m_em:>13}"
-            )
+            print(format_row(run_external_experiment(n, mode, fmt=fmt), EXTERNAL_TABLE_COLUMNS))
+        print("-" * len(header))
 
-            print(
-                f"{quick_res['algo']:<10} "
-                f"{quick_res['n']:>8} "
-                f"{quick_res['mode']:>10} "
-                f"{quick_res['avg_time_ms']:>15.3f} "
-                f"{quick_res['avg_comp']:>12.1f} "
-                f"{quick_res['avg_assign']:>12.1f} "
-                f"{quick_res['energy_proxy']:>13.1f} "
-                f"{q_ej:>13} "
-                f"{q_em:>13}"
-            )
 
+def print_parallel_scaling(n: int, mode: str, core_counts=(1, 2, 4, 8), repetitions: int = 3):
+    """run_parallel_scaling sonuçlarını terminale tablo olarak yazar."""
+    header = format_header(PARALLEL_TABLE_COLUMNS)
+    print(header)
+    print("-" * len(header))
+    for res in run_parallel_scaling(n, mode, core_counts, repetitions):
+        print(format_row(res, PARALLEL_TABLE_COLUMNS))
+    print("-" * len(header))
+
+
+def print_profiled_experiment(n: int, mode: str = "random", export: str = None, **options):
+    """
+    run_profiled_experiment sonuçlarını koşu / faz / derinlik tabloları olarak yazar.
+    export verilirse kayıtlar ayrıca export_records ile dosyaya yazılır.
+    """
+    records = run_profiled_experiment(n, mode, **options)
+    for kind, columns in (("run", PROFILE_RUN_COLUMNS), ("phase", PROFILE_PHASE_COLUMNS),
+                          ("depth", PROFILE_DEPTH_COLUMNS)):
+        header = format_header(columns)
+        print(header)
         print("-" * len(header))
+        for record in records:
+            if record["kind"] == kind:
+                print(format_row(record, columns))
+        print()
+    if export:
+        export_records(records, export)
+        print(f"{len(records)} kayıt yazıldı: {export}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""
+datasets.py
+-----------
+Tekrarlanabilir benchmark'lar için diskte tutulan, bellek eşlemeli (memory-mapped)
+veri seti önbelleği.
+
+Her (n, mode, seed, backend) dizisi yalnızca BİR kez üretilir ve diske yazılır:
+    - "list"  backend: ham int64 dosyası (array('q') biçimi, .bin)
+    - "numpy" backend: NumPy .npy dosyası
+Aynı diziyi sıralayan algoritmalar ve sonraki çalıştırmalar aynı baytları
+dosyadan salt-okunur mmap ile kullanır; üretim maliyeti bir daha ödenmez.
+benchmark her tekrar için ayrı tohum (cell_seed(seed, n, mode, tekrar)) ister,
+böylece önbellekli ve önbelleksiz koşular aynı dizileri sıralar.
+
+CachedDataset.copy() her algoritmaya ucuz bir kopya verir:
+    - numpy backend: np.load(mmap_mode="c") -> copy-on-write görünüm; yalnızca
+      yazılan sayfalar kopyalanır, dosya asla değişmez.
+    - list backend : varsayılan olarak C seviyesinde tek seferde liste kopyası
+      (memoryview.tolist). cow_views=True ile mmap.ACCESS_COPY üzerinden
+      copy-on-write memoryview verilir; algoritmalar memoryview üzerinde de
+      çalışır ancak eleman erişimi listeden yavaştır (süre ölçümünü etkiler).
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+
+from algorithms import generate_array
+
+DEFAULT_CACHE_DIR = ".dataset_cache"
+
+
+class DatasetCache:
+    """
+    Diskteki veri seti önbelleği.
+
+    Kullanım:
+        cache = DatasetCache()
+        data = cache.get(100_000, "random", seed=42)
+        arr = data.copy()        # algoritmaya verilecek kopya
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, n: int, mode: str, seed: int, backend: str = "list") -> str:
+        """Bir dizinin önbellekteki dosya yolu."""
+        ext = "npy" if backend == "numpy" else "bin"
+        return os.path.join(self.root, f"{backend}_{mode}_n{n}_s{seed}.{ext}")
+
+    def get(self, n: int, mode: str, seed: int = 0, backend: str = "list", cow_views: bool = False):
+        """
+        (n, mode, seed, backend) dizisini döner; dosya yoksa önce üretip yazar.
+
+        Dönüş:
+            CachedDataset
+        """
+        path = self.path_for(n, mode, seed, backend)
+        if not os.path.exists(path):
+            self._build(path, n, mode, seed, backend)
+        return CachedDataset(path, n, backend, cow_views)
+
+    def clear(self):
+        """Önbellekteki tüm veri seti dosyalarını siler."""
+        for name in os.listdir(self.root):
+            if name.endswith((".bin", ".npy")):
+                os.remove(os.path.join(self.root, name))
+
+    def _build(self, path: str, n: int, mode: str, seed: int, backend: str):
+        """
+        Diziyi üretip geçici dosyaya yazar, sonra atomik olarak yerine taşır.
+        Böylece aynı diziyi eşzamanlı üreten süreçler yarım dosya görmez.
+        """
+        values = generate_array(n, mode, backend=backend, seed=seed)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if backend == "numpy":
+                    import numpy as np
+                    np.save(f, values)
+                else:
+                    array("q", values).tofile(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+class CachedDataset:
+    """
+    Önbellekteki tek bir dizinin salt-okunur eşlemesi.
+    benchmark.measure_sort'un beklediği .copy() arayüzünü sağlar.
+    """
+
+    def __init__(self, path: str, n: int, backend: str = "list", cow_views: bool = False):
+        self.path = path
+        self.n = n
+        self.backend = backend
+        self.cow_views = cow_views
+        self._file = None
+        self._mm = None
+
+        if backend == "numpy":
+            import numpy as np
+            self._view = np.load(path, mmap_mode="r") if n else np.empty(0, dtype=np.int64)
+        elif n:
+            self._file = open(path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mm).cast("q")
+        else:
+            self._view = memoryview(array("q"))
+
+    def __len__(self):
+        return self.n
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+        return np.asarray(self._view, dtype=dtype)
+
+    def view(self):
+        """Salt-okunur görünüm (memoryview veya NumPy memmap); kopya yapılmaz."""
+        return self._view
+
+    def tolist(self):
+        return self._view.tolist()
+
+    def copy(self):
+        """Algoritmaya verilecek, üzerinde yazılabilen kopya (bkz. modül açıklaması)."""
+        if self.backend == "numpy":
+            if not self.n:
+                return self._view.copy()
+            import numpy as np
+            return np.load(self.path, mmap_mode="c")
+        if self.cow_views and self.n:
+            cow = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+            return memoryview(cow).cast("q")
+        return self._view.tolist()
+
+    def close(self):
+        """Eşlemeyi ve dosyayı kapatır."""
+        if isinstance(self._view, memoryview):
+            self._view.release()
+        if self._mm is not None:
+            self._mm.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,426 @@
+"""
+energy_meters.py
+----------------
+Gerçek enerji ölçümü için eklenebilir (pluggable) ölçer arayüzü.
+
+Her ölçer iki işlem sunar:
+    snap = meter.read()            # anlık (opak) sayaç okuması
+    joule = meter.joules(s0, s1)   # iki okuma arasındaki enerji (J) veya None
+
+Backend'ler:
+    - "rapl" : Linux RAPL, /sys/class/powercap/intel-rapl:* altındaki energy_uj
+               sayaçları. Sayaç max_energy_range_uj'de sıfırlandığı için
+               (wraparound) negatif farklara aralık eklenir.
+    - "perf" : Linux perf_event_open ile "power" PMU olayları (energy-pkg,
+               energy-psys, ...). Sayaçlar 64 bit; ölçek .scale dosyasından okunur.
+    - "fake" : sabit güç varsayan sahte ölçer (watts * geçen süre); testler ve
+               donanım sayacı olmayan makineler için deterministik değer üretir.
+    - "null" : ölçüm yok; joules() her zaman None döner ("-" olarak yazılır).
+
+get_energy_meter("auto") sırasıyla rapl, perf ve null'ı dener.
+
+PowerSampler herhangi bir ölçeri arka plan thread'inde yüksek hızda okur,
+örnekleri sınırlı bir ring buffer'da tutar; kendisi de bir ölçer olduğundan
+benchmark her tekrarın enerjisini örneklerden alır ve canlı güç izi üretir.
+
+RAPL/perf sayaçları paket (soket) geneli enerjiyi ölçer: ölçüm sırasında
+çalışan diğer süreçler de değere dahildir. Bu yüzden benchmark ölçümü her
+algoritmanın sıralama çağrısının hemen etrafında alır ve tek süreçte yapar.
+"""
+
+import ctypes
+import glob
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+POWERCAP_ROOT = "/sys/class/powercap"
+PERF_POWER_ROOT = "/sys/bus/event_source/devices/power"
+
+
+class EnergyMeter:
+    """Ölçer arayüzü; doğrudan kullanılırsa ölçüm yapmaz (null backend)."""
+    name = "null"
+
+    def read(self):
+        """Anlık sayaç okuması (opak değer)."""
+        return None
+
+    def joules(self, start, end):
+        """start ve end okumaları arasında harcanan enerji (J); ölçüm yoksa None."""
+        return None
+
+    def close(self):
+        """Açık dosya tanıtıcılarını kapatır."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NullEnergyMeter(EnergyMeter):
+    """Ölçüm yapmayan ölçer (energy_joule = None)."""
+
+
+class FakeEnergyMeter(EnergyMeter):
+    """Sabit güç (watts) varsayan sahte ölçer: enerji = watts * geçen süre."""
+    name = "fake"
+
+    def __init__(self, watts: float = 15.0, clock=time.perf_counter):
+        self.watts = watts
+        self.clock = clock
+
+    def read(self):
+        return self.clock()
+
+    def joules(self, start, end):
+        return (end - start) * self.watts
+
+
+# --------------------------------------------------
+# Linux RAPL (powercap sysfs)
+# --------------------------------------------------
+class RaplEnergyMeter(EnergyMeter):
+    """
+    /sys/class/powercap RAPL bölgelerinin energy_uj sayaçlarını okur.
+
+    domains: bölge adları (örn. ["package-0", "dram"]); verilmezse üst seviye
+    "package-*" bölgeleri, hiç yoksa tüm üst seviye bölgeler kullanılır.
+    Alt bölgeler (core, uncore) paketin içinde sayıldığından varsayılan değildir.
+    """
+    name = "rapl"
+
+    def __init__(self, domains=None, root: str = POWERCAP_ROOT):
+        zones = {}
+        for path in sorted(glob.glob(os.path.join(root, "intel-rapl:*"))):
+            with open(os.path.join(path, "name")) as f:
+                zone_name = f.read().strip()
+            top_level = os.path.basename(path).count(":") == 1
+            zones[zone_name if top_level else f"{zone_name}@{os.path.basename(path)}"] = path
+        if not zones:
+            raise OSError(f"RAPL bölgesi bulunamadı: {root}")
+
+        if domains is None:
+            top = {name: path for name, path in zones.items() if "@" not in name}
+            domains = [name for name in top if name.startswith("package")] or list(top)
+        unknown = [d for d in domains if d not in zones]
+        if unknown:
+            raise ValueError(f"Bilinmeyen RAPL bölgesi: {', '.join(unknown)}")
+
+        self.domains = list(domains)
+        self._files = []
+        self._ranges = []
+        try:
+            for domain in self.domains:
+                with open(os.path.join(zones[domain], "max_energy_range_uj")) as f:
+                    self._ranges.append(int(f.read()))
+                self._files.append(open(os.path.join(zones[domain], "energy_uj"), "rb", buffering=0))
+            self.read()  # izin hatası (energy_uj çoğu çekirdekte yalnızca root) burada çıksın
+        except BaseException:
+            self.close()
+            raise
+
+    def read(self):
+        values = []
+        for f in self._files:
+            f.seek(0)
+            values.append(int(f.read()))
+        return values
+
+    def joules(self, start, end):
+        total_uj = 0
+        for s, e, max_range in zip(start, end, self._ranges):
+            delta = e - s
+            if delta < 0:
+                delta += max_range  # sayaç taştı ve sıfırdan başladı
+            total_uj += delta
+        return total_uj / 1e6
+
+    def close(self):
+        for f in self._files:
+            f.close()
+        self._files = []
+
+
+# --------------------------------------------------
+# Linux perf_event_open ("power" PMU)
+# --------------------------------------------------
+_PERF_EVENT_OPEN = {"x86_64": 298, "i686": 336, "aarch64": 241}
+_PERF_ATTR_SIZE = 64  # PERF_ATTR_SIZE_VER0
+
+
+class PerfEnergyMeter(EnergyMeter):
+    """
+    perf_event_open ile "power" PMU enerji olaylarını sistem genelinde sayar.
+
+    events: olay adları (örn. ["energy-pkg", "energy-ram"]); verilmezse
+    energy-pkg, yoksa energy-psys kullanılır. Genellikle root ya da
+    kernel.perf_event_paranoid <= 0 gerekir.
+    """
+    name = "perf"
+
+    def __init__(self, events=None, root: str = PERF_POWER_ROOT):
+        syscall_nr = _PERF_EVENT_OPEN.get(os.uname().machine)
+        if syscall_nr is None or not os.path.isdir(root):
+            raise OSError("perf power PMU bu sistemde yok")
+
+        with open(os.path.join(root, "type")) as f:
+            pmu_type = int(f.read())
+        with open(os.path.join(root, "cpumask")) as f:
+            cpu = int(f.read().split(",")[0].split("-")[0])
+
+        available = sorted(
+            os.path.basename(p) for p in glob.glob(os.path.join(root, "events", "energy-*"))
+            if "." not in os.path.basename(p)
+        )
+        if events is None:
+            events = [e for e in ("energy-pkg", "energy-psys") if e in available][:1] or available[:1]
+        unknown = [e for e in events if e not in available]
+        if not events or unknown:
+            raise ValueError(f"Bilinmeyen perf enerji olayı: {', '.join(unknown) or '-'}")
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.events = list(events)
+        self._fds = []
+        self._scales = []
+        try:
+            for event in self.events:
+                config = _read_event_config(os.path.join(root, "events", event))
+                with open(os.path.join(root, "events", f"{event}.scale")) as f:
+                    self._scales.append(float(f.read()))
+                attr = ctypes.create_string_buffer(
+                    struct.pack("IIQ", pmu_type, _PERF_ATTR_SIZE, config), _PERF_ATTR_SIZE)
+                fd = libc.syscall(syscall_nr, attr, -1, cpu, -1, 0)  # pid=-1: tüm süreçler
+                if fd < 0:
+                    err = ctypes.get_errno()
+                    raise OSError(err, f"perf_event_open({event}): {os.strerror(err)}")
+                self._fds.append(fd)
+        except BaseException:
+            self.close()
+            raise
+
+    def read(self):
+        return [struct.unpack("Q", os.read(fd, 8))[0] for fd in self._fds]
+
+    def joules(self, start, end):
+        return sum(((e - s) % (1 << 64)) * scale for s, e, scale in zip(start, end, self._scales))
+
+    def close(self):
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+
+
+def _read_event_config(path: str) -> int:
+    """'event=0x02' (veya 'event=0x02,umask=0x1') biçimindeki olay tanımından config değeri."""
+    with open(path) as f:
+        fields = dict(item.split("=") for item in f.read().strip().split(","))
+    return int(fields["event"], 0) | (int(fields.get("umask", "0"), 0) << 8)
+
+
+# --------------------------------------------------
+# Kayıt ve seçim
+# --------------------------------------------------
+ENERGY_METERS = {
+    "rapl": RaplEnergyMeter,
+    "perf": PerfEnergyMeter,
+    "fake": FakeEnergyMeter,
+    "null": NullEnergyMeter,
+}
+
+
+def get_energy_meter(name: str = "auto", **options) -> EnergyMeter:
+    """
+    Adı verilen ölçeri açar. "auto": rapl -> perf -> null sırasıyla ilk çalışanı döner.
+    Açıkça istenen backend kullanılamıyorsa OSError / ValueError verir.
+    """
+    if name == "auto":
+        for candidate in ("rapl", "perf"):
+            try:
+                return ENERGY_METERS[candidate]()
+            except (OSError, ValueError):
+                continue
+        return NullEnergyMeter()
+    if name not in ENERGY_METERS:
+        raise ValueError(f"Bilinmeyen enerji ölçer: {name}")
+    return ENERGY_METERS[name](**options)
+
+
+# --------------------------------------------------
+# Arka plan güç örnekleyici (ring buffer + tekrar başına enerji)
+# --------------------------------------------------
+DEFAULT_SAMPLE_INTERVAL = 0.002      # sn (500 Hz)
+DEFAULT_SAMPLE_CAPACITY = 1 << 16    # ring buffer'da tutulan en fazla örnek
+
+
+class PowerSampler(EnergyMeter):
+    """
+    source ölçerini arka plan thread'inde interval aralıkla okur; her örnek
+    (zaman, kümülatif Joule) olarak sabit kapasiteli bir ring buffer'a
+    (array('d')) yazılır, bellek kullanımı capacity ile sınırlıdır.
+
+    EnergyMeter arayüzünü de sunar: read() zaman damgası (perf_counter) döner,
+    joules(t0, t1) kümülatif enerji eğrisini t0 ve t1'de doğrusal ara
+    değerlemeyle okur. Böylece benchmark.measure_sort değişmeden her tekrarın
+    enerjisini örneklerden alır; her pencere windows listesine de eklenir.
+
+    Not: saf Python sıralama sürerken thread GIL'i en geç
+    sys.getswitchinterval() (varsayılan 5 ms) aralıkla alabilir; daha kısa
+    interval uzun koşularda izi sıklaştırır ama tek bir kısa koşunun içini
+    çözemez (o koşunun enerjisi komşu örneklerin ortalama gücünden gelir).
+
+    Kullanım:
+        with PowerSampler(get_energy_meter("rapl"), interval=0.001) as sampler:
+            t0 = sampler.read(); mergesort(arr, counters); t1 = sampler.read()
+            print(sampler.joules(t0, t1), sampler.trace()[-5:])
+    """
+    name = "sampler"
+
+    def __init__(self, source: EnergyMeter, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 capacity: int = DEFAULT_SAMPLE_CAPACITY, clock=time.perf_counter):
+        if interval <= 0 or capacity < 2:
+            raise ValueError("interval > 0 ve capacity >= 2 olmalı")
+        self.source = source
+        self.interval = interval
+        self.capacity = capacity
+        self.clock = clock
+        self.windows = []          # joules() pencereleri: (t0, t1, joule)
+        self.started_at = None
+        self._times = array("d", bytes(8 * capacity))
+        self._energy = array("d", bytes(8 * capacity))
+        self._count = 0            # alınan toplam örnek; ring konumu = _count % capacity
+        self._total = 0.0
+        self._measuring = True
+        self._last_snap = None
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Örneklemeyi başlatır (zaten çalışıyorsa bir şey yapmaz)."""
+        if self.running:
+            return self
+        self._last_snap = self.source.read()
+        self._measuring = self.source.joules(self._last_snap, self._last_snap) is not None
+        now = self.clock()
+        if self.started_at is None:
+            self.started_at = now
+        with self._cond:
+            self._append(now, self._total)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="power-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Thread'i durdurur ve son bir örnek alır; tampon okunmaya devam edebilir."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._sample()
+
+    def close(self):
+        """Örneklemeyi durdurur; kaynak ölçer çağıranındır, kapatılmaz."""
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        snap = self.source.read()
+        now = self.clock()
+        joules = self.source.joules(self._last_snap, snap)
+        self._last_snap = snap
+        if joules is None:
+            self._measuring = False   # null ölçer: yalnızca zaman damgası tutulur
+        else:
+            self._total += joules
+        with self._cond:
+            self._append(now, self._total)
+            self._cond.notify_all()
+
+    def _append(self, t: float, energy: float):
+        i = self._count % self.capacity
+        self._times[i] = t
+        self._energy[i] = energy
+        self._count += 1
+
+    def _ordered(self):
+        """Tampondaki örnekler kronolojik sırada: (zamanlar, kümülatif_joule). Kilit tutulurken çağrılır."""
+        if self._count <= self.capacity:
+            return self._times[:self._count], self._energy[:self._count]
+        i = self._count % self.capacity
+        return self._times[i:] + self._times[:i], self._energy[i:] + self._energy[:i]
+
+    def _latest(self) -> float:
+        return self._times[(self._count - 1) % self.capacity] if self._count else float("-inf")
+
+    @staticmethod
+    def _interpolate(times, energy, t: float):
+        """t anındaki kümülatif enerji; t tamponun kapsamı dışındaysa None."""
+        if not times or t < times[0] or t > times[-1]:
+            return None
+        k = bisect_left(times, t)
+        if times[k] == t or k == 0:
+            return energy[k]
+        t0, t1 = times[k - 1], times[k]
+        return energy[k - 1] + (energy[k] - energy[k - 1]) * (t - t0) / (t1 - t0)
+
+    def read(self):
+        if not self.running:
+            self.start()
+        return self.clock()
+
+    def joules(self, start, end):
+        """
+        [start, end] penceresinin enerjisi (J). end'den sonraki ilk örnek
+        beklenir; pencere ring buffer'dan düşmüşse ya da ölçüm yoksa None.
+        """
+        if not self._measuring:
+            return None
+        with self._cond:
+            self._cond.wait_for(lambda: self._latest() >= end or not self.running,
+                                timeout=max(1.0, 10 * self.interval))
+            times, energy = self._ordered()
+        e0 = self._interpolate(times, energy, start)
+        e1 = self._interpolate(times, energy, end)
+        if e0 is None or e1 is None:
+            return None
+        self.windows.append((start, end, e1 - e0))
+        return e1 - e0
+
+    def trace(self, since: float = None):
+        """
+        Güç izi: ardışık örnek çiftlerinden [(t_sn, watt), ...]. t, örneklemenin
+        başından itibaren saniyedir (aralığın bitişi); since verilirse yalnızca
+        t > since olan noktalar döner (canlı izde artımlı okuma için).
+        """
+        if not self._measuring:
+            return []
+        with self._cond:
+            times, energy = self._ordered()
+        first = 1
+        if since is not None:
+            first = max(1, bisect_left(times, self.started_at + since))
+        points = []
+        for k in range(first, len(times)):
+            dt = times[k] - times[k - 1]
+            t = times[k] - self.started_at
+            if dt > 0 and (since is None or t > since):
+                points.append((t, (energy[k] - energy[k - 1]) / dt))
+        return points
+
+    def __enter__(self):
+        return self.start()
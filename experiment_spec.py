@@ -0,0 +1,393 @@
+"""
+experiment_spec.py
+------------------
+Deney tanım dosyasıyla (YAML / TOML / JSON) çalışan komut satırı girişi.
+
+run_all_experiments'in ızgarası (sizes, modes, repetitions) kaynak kodda
+sabittir; üretim boyutunda bir tarama için kod düzenlemek gerekmesin diye
+bütün ayarlar bir spec dosyasından okunur:
+
+    name: buyuk-tarama
+    algorithms:                     # benchmark.ALGORITHMS'tan alt küme
+      MergeSort: {engine: [bottomup, kway]}
+      QuickSort: {pivot: median3, scheme: [lomuto, hoare], insertion_cutoff: 16}
+      TimSort: {}
+      RadixLSD: {bits: [8, 11]}
+    sizes: [100000, 1000000, 10000000]
+    workloads: [random, sorted, "nearly_sorted:swap_pct=1"]
+    seeds: [0, 1]
+    repetitions: 5
+    instrumentation: split
+    backend: list
+    energy_meter: auto
+    time_budget: 120                # hücre süresi (sn) aşılınca o seri büyük n'de koşulmaz
+    workers: 4
+    output: buyuk-tarama.jsonl      # .csv -> CSV, diğerleri JSON Lines
+
+Liste verilen algoritma parametreleri kartezyen çarpımla ayrı variant'lara
+açılır. Her hücre (algo + variant, n, workload, seed) bittiği anda çıktı
+dosyasına bir satır olarak eklenir; dosyada cell_id'si bulunan hücreler
+yeniden koşulmaz, böylece yarıda kesilen tarama aynı komutla kaldığı yerden
+devam eder.
+
+Örnek:
+    python experiment_spec.py tarama.yaml
+    python experiment_spec.py tarama.toml --workers 8 --output sonuc.csv
+    python experiment_spec.py tarama.json --dry-run
+"""
+
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+
+from algorithms import QuickSortConfig, DEFAULT_RADIX_BITS, generate_array
+from benchmark import (
+    ALGORITHMS,
+    BENCH_INSTRUMENTATION_MODES,
+    DEFAULT_ENERGY_METER,
+    STACK_ALGORITHMS,
+    algorithm_label,
+    cell_seed,
+    measure_sort,
+    resolve_algorithms,
+    summarize_results,
+)
+
+# Algoritma başına spec'te verilebilen variant parametreleri
+ALGORITHM_PARAMS = {
+    "MergeSort": ("engine",),
+    "QuickSort": ("pivot", "scheme", "insertion_cutoff", "introsort"),
+    "TimSort": (),
+    "RadixLSD": ("bits",),
+    "RadixMSD": ("bits",),
+    "CountingSort": (),
+}
+
+# CSV çıktısının sabit sütunları (akışlı yazıldığı için baştan bellidir);
+# liste alanları (time_samples_ms, proxy_samples) yalnızca JSON Lines'ta bulunur
+CSV_FIELDS = (
+    "cell_id", "spec", "algo", "engine", "variant", "n", "mode", "seed", "repetitions",
+    "instrumentation", "backend", "cell_seconds",
+    "avg_time_ms", "avg_comp", "avg_assign", "avg_bytes_moved", "avg_cache_misses", "avg_bucket_ops",
+    "avg_stack_depth", "energy_proxy", "energy_joule",
+)
+
+
+# --------------------------------------------------
+# Spec okuma / doğrulama
+# --------------------------------------------------
+@dataclass
+class ExperimentSpec:
+    """Bir deney dosyasının doğrulanmış içeriği."""
+    name: str = "experiment"
+    algorithms: dict = field(default_factory=lambda: {algo: {} for algo in ALGORITHMS})
+    sizes: list = field(default_factory=list)
+    workloads: list = field(default_factory=lambda: ["random"])
+    seeds: list = field(default_factory=lambda: [0])
+    repetitions: int = 5
+    instrumentation: str = "counted"
+    backend: str = "list"
+    energy_meter: str = DEFAULT_ENERGY_METER
+    time_budget: float = None
+    workers: int = 1
+    output: str = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExperimentSpec":
+        """Sözlükten spec üretir; bilinmeyen anahtar / algoritma / parametre ValueError verir."""
+        data = dict(data)
+        if "modes" in data:   # benchmark'taki adla da yazılabilsin
+            data.setdefault("workloads", data.pop("modes"))
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Bilinmeyen spec anahtarları: {sorted(unknown)}")
+
+        algorithms = data.get("algorithms")
+        if isinstance(algorithms, (list, tuple)):
+            data["algorithms"] = {algo: {} for algo in algorithms}
+        for algo, params in (data.get("algorithms") or {}).items():
+            if algo not in ALGORITHM_PARAMS:
+                raise ValueError(f"Bilinmeyen algoritma: {algo}")
+            extra = set(params or {}) - set(ALGORITHM_PARAMS[algo])
+            if extra:
+                raise ValueError(f"{algo} için bilinmeyen parametreler: {sorted(extra)}")
+
+        spec = cls(**data)
+        if not spec.sizes:
+            raise ValueError("spec'te en az bir boyut (sizes) olmalı")
+        if spec.instrumentation not in BENCH_INSTRUMENTATION_MODES:
+            raise ValueError(f"Bilinmeyen instrumentation: {spec.instrumentation}")
+        if spec.output is None:
+            spec.output = f"{spec.name}.jsonl"
+        spec.sizes = sorted(int(n) for n in spec.sizes)
+        return spec
+
+    def variants(self):
+        """[(algo, ((param, değer), ...)), ...] — liste değerleri kartezyen çarpımla açılır."""
+        result = []
+        for algo, params in self.algorithms.items():
+            params = params or {}
+            keys = sorted(params)
+            choices = [params[k] if isinstance(params[k], list) else [params[k]] for k in keys]
+            for values in itertools.product(*choices):
+                result.append((algo, tuple(zip(keys, values))))
+        return result
+
+    def cells(self):
+        """Koşulacak bütün hücreler; küçük n'ler önce (süre bütçesi bu sırayla uygulanır)."""
+        return [
+            SpecCell(algo, params, n, mode, seed)
+            for n in self.sizes
+            for mode in self.workloads
+            for seed in self.seeds
+            for algo, params in self.variants()
+        ]
+
+
+def load_spec(path: str) -> ExperimentSpec:
+    """Uzantıya göre .yaml / .yml, .toml veya .json spec dosyasını okur."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".yaml", ".yml"):
+        import yaml   # PyYAML yalnızca YAML spec için gerekir
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    elif ext == ".toml":
+        import tomllib
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    elif ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        raise ValueError(f"Desteklenmeyen spec biçimi: {ext} (.yaml, .toml veya .json)")
+    return ExperimentSpec.from_dict(data or {})
+
+
+# --------------------------------------------------
+# Hücre çalıştırma
+# --------------------------------------------------
+@dataclass(frozen=True)
+class SpecCell:
+    """Spec ızgarasındaki tek hücre: algoritma + variant parametreleri, n, workload, seed."""
+    algo: str
+    params: tuple
+    n: int
+    mode: str
+    seed: int
+
+    def series(self):
+        """Süre bütçesinin uygulandığı seri: n dışındaki her şey."""
+        return self.algo, self.params, self.mode, self.seed
+
+
+def _cell_setup(cell: SpecCell, backend: str):
+    """Hücrenin sıralama fonksiyonu ve sonuç etiketi (algorithm_label)."""
+    params = dict(cell.params)
+    quick_config = None
+    if cell.algo == "QuickSort":
+        quick_config = QuickSortConfig(**{k: params[k] for k in ALGORITHM_PARAMS["QuickSort"] if k in params})
+    radix_bits = int(params.get("bits", DEFAULT_RADIX_BITS))
+    algos, engine = resolve_algorithms(params.get("engine", "topdown"), backend, quick_config, radix_bits)
+    return dict(algos)[cell.algo], algorithm_label(cell.algo, engine, quick_config, radix_bits)
+
+
+def cell_id(cell: SpecCell, instrumentation: str, backend: str) -> str:
+    """Çıktı dosyasındaki (devam ettirme için) hücre kimliği."""
+    from results_store import variant_key
+
+    _, label = _cell_setup(cell, backend)
+    impl = next(iter(label.values()))
+    return f"{variant_key(cell.algo, impl, instrumentation, backend)}|n={cell.n}|mode={cell.mode}|seed={cell.seed}"
+
+
+def run_cell(cell: SpecCell, repetitions: int, instrumentation: str = "counted", backend: str = "list",
+             energy_meter=None) -> dict:
+    """
+    Hücreyi repetitions kez koşar; diziler ve pivot tohumları run_single_experiment
+    ile aynı cell_seed'lerden üretilir (aynı seed -> aynı diziler).
+    Dönüş: summarize_results sözlüğü + seed ve cell_seconds (tekrarların toplam süresi).
+    """
+    sort_fn, label = _cell_setup(cell, backend)
+    time_total, comp_total, assign_total, stack_total = 0.0, 0, 0, 0
+    bytes_total, miss_total, bucket_total = 0, 0, 0
+    energy_total = None
+    times, proxies = [], []
+    cell_start = time.perf_counter()
+    for rep in range(repetitions):
+        base_arr = generate_array(cell.n, cell.mode, backend=backend,
+                                  seed=cell_seed(cell.seed, cell.n, cell.mode, rep))
+        random.seed(cell_seed(cell.seed, cell.n, cell.mode, rep, cell.algo))
+        elapsed, counters, joules = measure_sort(sort_fn, base_arr, instrumentation, energy_meter)
+        time_total += elapsed
+        comp_total += counters.comparisons
+        assign_total += counters.assignments
+        stack_total += counters.max_stack_depth
+        bytes_total += counters.bytes_moved
+        miss_total += counters.cache_misses
+        bucket_total += counters.bucket_ops
+        if joules is not None:
+            energy_total = (energy_total or 0.0) + joules
+        times.append(elapsed * 1000.0)
+        proxies.append(counters.comparisons + counters.assignments + counters.bucket_ops)
+        del base_arr
+
+    return summarize_results(
+        cell.algo, cell.n, cell.mode, repetitions, time_total, comp_total, assign_total,
+        stack_total if cell.algo in STACK_ALGORITHMS else None, bytes_total, miss_total, bucket_total,
+        **label,
+        seed=cell.seed,
+        instrumentation=instrumentation,
+        backend=backend,
+        energy_joule=energy_total / repetitions if energy_total is not None else None,
+        cell_seconds=time.perf_counter() - cell_start,
+        time_samples_ms=times,
+        proxy_samples=proxies,
+    )
+
+
+# --------------------------------------------------
+# Akışlı çıktı (JSON Lines / CSV) + devam ettirme
+# --------------------------------------------------
+class ResultWriter:
+    """
+    Hücre sonuçlarını bitiş sırasıyla dosyaya ekler (her satırdan sonra flush).
+    Uzantı .csv ise CSV_FIELDS sütunlu CSV, aksi halde JSON Lines yazılır.
+    """
+
+    def __init__(self, path: str, restart: bool = False):
+        self.path = path
+        self.csv = path.lower().endswith(".csv")
+        self.previous = [] if restart else self._read_existing()
+        fresh = restart or not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "w" if restart else "a", encoding="utf-8", newline="")
+        self._csv_writer = None
+        if self.csv:
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if fresh:
+                self._csv_writer.writeheader()
+                self._file.flush()
+
+    def _read_existing(self):
+        """Önceki koşudan kalan kayıtlar; yarım yazılmış son satır atlanır."""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8", newline="") as f:
+            if self.csv:
+                return [row for row in csv.DictReader(f) if row.get("cell_id") and row.get("cell_seconds")]
+            records = []
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue   # kesintide yarım kalmış satır
+            return records
+
+    def write(self, record: dict):
+        if self.csv:
+            self._csv_writer.writerow({k: ("" if v is None else v) for k, v in record.items()})
+        else:
+            self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _run_cell_worker(cell: SpecCell, repetitions: int, instrumentation: str, backend: str):
+    """İşçi süreç girişi (paralel modda enerji ölçümü yapılmaz)."""
+    return cell, run_cell(cell, repetitions, instrumentation, backend)
+
+
+def run_spec(spec: ExperimentSpec, output: str = None, workers: int = None, restart: bool = False, log=None):
+    """
+    spec'teki bütün hücreleri koşar ve her biri bittiğinde output'a yazar.
+
+    - output / workers verilirse spec'tekinin yerine kullanılır.
+    - Çıktıda cell_id'si olan hücreler atlanır (restart=True ise dosya sıfırlanır).
+    - time_budget: bir hücrenin bütün tekrarları bu süreyi (sn) aşarsa aynı
+      serinin (algo, variant, workload, seed) daha büyük n'leri koşulmaz.
+    - workers > 1: aynı n'in hücreleri bir süreç havuzunda koşar (n'ler sırayla,
+      bütçe kararı her n'den sonra verilir). RAPL/perf paket geneli ölçtüğü
+      için bu modda energy_joule None kalır (bkz. run_experiments_parallel).
+
+    Dönüş:
+        bu çağrıda yazılan kayıt sayısı
+    """
+    log = log or (lambda text: print(text, file=sys.stderr))
+    output = output or spec.output
+    workers = workers or spec.workers
+    cells = spec.cells()
+    ids = {cell: cell_id(cell, spec.instrumentation, spec.backend) for cell in cells}
+
+    with ResultWriter(output, restart=restart) as writer:
+        done = {record["cell_id"] for record in writer.previous}
+        stopped = set()
+        if spec.time_budget is not None:
+            by_id = {ids[cell]: cell for cell in cells}
+            stopped = {by_id[r["cell_id"]].series() for r in writer.previous
+                       if r["cell_id"] in by_id and float(r["cell_seconds"]) > spec.time_budget}
+        pending = [cell for cell in cells if ids[cell] not in done]
+        log(f"{spec.name}: {len(cells)} hücre, {len(cells) - len(pending)} tanesi {output} içinde mevcut")
+
+        written = 0
+
+        def finish(cell, res):
+            nonlocal written
+            record = {"cell_id": ids[cell], "spec": spec.name, **res}
+            writer.write(record)
+            written += 1
+            if spec.time_budget is not None and res["cell_seconds"] > spec.time_budget:
+                stopped.add(cell.series())
+            log(f"[{len(cells) - len(pending) + written}/{len(cells)}] {ids[cell]}  "
+                f"{res['avg_time_ms']:.3f} ms  energy_proxy={res['energy_proxy']:.1f}")
+
+        if workers <= 1:
+            from energy_meters import get_energy_meter
+            with get_energy_meter(spec.energy_meter) as meter:
+                for cell in pending:
+                    if cell.series() in stopped:
+                        continue
+                    finish(cell, run_cell(cell, spec.repetitions, spec.instrumentation, spec.backend, meter))
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for n in spec.sizes:
+                    wave = [cell for cell in pending if cell.n == n and cell.series() not in stopped]
+                    futures = [pool.submit(_run_cell_worker, cell, spec.repetitions, spec.instrumentation,
+                                           spec.backend) for cell in wave]
+                    for future in as_completed(futures):
+                        finish(*future.result())
+
+        if stopped:
+            log(f"Süre bütçesi ({spec.time_budget} sn) aşıldığı için {len(stopped)} seri büyük n'lerde durduruldu.")
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Spec dosyasıyla deney taraması (JSON Lines / CSV akışlı çıktı)")
+    parser.add_argument("spec", help="deney tanımı (.yaml / .yml / .toml / .json)")
+    parser.add_argument("--output", help="çıktı dosyası (spec'teki output yerine; .csv -> CSV)")
+    parser.add_argument("--workers", type=int, help="işçi süreç sayısı (spec'teki workers yerine)")
+    parser.add_argument("--restart", action="store_true", help="mevcut çıktıyı silip baştan başla")
+    parser.add_argument("--dry-run", action="store_true", help="yalnızca koşulacak hücreleri listele")
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    if args.dry_run:
+        for cell in spec.cells():
+            print(cell_id(cell, spec.instrumentation, spec.backend))
+        sys.exit(0)
+    run_spec(spec, output=args.output, workers=args.workers, restart=args.restart)
@@ -0,0 +1,288 @@
+"""
+external_sort.py
+----------------
+Belleğe sığmayan tamsayı dosyaları için akışlı (streaming) harici MergeSort.
+
+Aşamalar:
+1) Run üretimi : girdi chunk_size elemanlık parçalar halinde okunur, her parça
+                 algorithms.py'deki sayaçlı MergeSort motoruyla sıralanır ve
+                 geçici bir dosyaya (int64, ikili) yazılır.
+2) k-yollu merge: tüm run'lar sayaçlı bir min-heap ile tek geçişte birleştirilir.
+                 Run'lar tamponlu (array.fromfile) ya da mmap ile blok blok okunur;
+                 bellekte her run'dan yalnızca bir blok bulunur.
+
+Desteklenen dosya biçimleri:
+    - "binary": ardışık int64 (makinenin bayt sırası, array('q') ile aynı)
+    - "text"  : her satırda bir tamsayı
+
+Sayaçlar (Counters) tüm aşamaları kapsar:
+    - run sıralama: seçilen MergeSort motorunun comparisons / assignments'ı
+    - heap merge  : heap karşılaştırmaları; heap swap'ları (3 atama) ve
+                    çıktıya yazılan her eleman (1 atama)
+Ek maliyet metrikleri ExternalSortStats içinde döner: run sayısı,
+okunan ve yazılan bayt sayıları (geçici dosyalar dahil).
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+
+from algorithms import Counters, MERGESORT_ENGINES
+
+FILE_FORMATS = ("binary", "text")
+
+# Varsayılan run boyutu (eleman) ve okuma/yazma tampon boyutu (eleman)
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_BUFFER_ITEMS = 64 * 1024
+
+_ITEM_SIZE = array("q").itemsize
+
+
+@dataclass
+class ExternalSortStats:
+    """Harici sıralamanın G/Ç maliyet metrikleri."""
+    runs: int = 0            # diske yazılan sıralı parça sayısı
+    bytes_read: int = 0      # girdi + run dosyalarından okunan bayt
+    bytes_written: int = 0   # run dosyaları + çıktıya yazılan bayt
+
+
+# --------------------------------------------------
+# Dosya yardımcıları
+# --------------------------------------------------
+def write_array(path, values, fmt: str = "binary"):
+    """values'ı path'e verilen biçimde yazar. Yazılan bayt sayısını döner."""
+    _check_format(fmt)
+    if fmt == "binary":
+        with open(path, "wb") as f:
+            array("q", values).tofile(f)
+        return len(values) * _ITEM_SIZE
+
+    data = "".join(f"{v}\n" for v in values).encode()
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_array(path, fmt: str = "binary"):
+    """path'teki tüm değerleri liste olarak okur (küçük dosyalar / doğrulama için)."""
+    _check_format(fmt)
+    if fmt == "binary":
+        values = array("q")
+        with open(path, "rb") as f:
+            values.frombytes(f.read())
+        return values.tolist()
+    with open(path, "rb") as f:
+        return [int(line) for line in f if line.strip()]
+
+
+def _check_format(fmt: str):
+    if fmt not in FILE_FORMATS:
+        raise ValueError(f"Bilinmeyen dosya biçimi: {fmt}")
+
+
+def _read_chunks(path, fmt: str, chunk_size: int, stats: ExternalSortStats):
+    """Girdiyi en fazla chunk_size elemanlık listeler halinde üretir."""
+    with open(path, "rb") as f:
+        if fmt == "binary":
+            while True:
+                chunk = array("q")
+                try:
+                    chunk.fromfile(f, chunk_size)
+                except EOFError:
+                    pass  # son parça eksik kalabilir; okunanlar chunk'ta
+                if not chunk:
+                    return
+                stats.bytes_read += len(chunk) * _ITEM_SIZE
+                yield chunk.tolist()
+        else:
+            while True:
+                lines = list(islice(f, chunk_size))
+                if not lines:
+                    return
+                stats.bytes_read += sum(len(line) for line in lines)
+                chunk = [int(line) for line in lines if line.strip()]
+                if chunk:   # yalnızca boş satırlardan oluşan parça boş run dosyası üretmesin
+                    yield chunk
+
+
+def _iter_run(path, buffer_items: int, use_mmap: bool, stats: ExternalSortStats):
+    """Bir run dosyasındaki int64 değerleri blok blok okuyarak tek tek üretir."""
+    if use_mmap and os.path.getsize(path) > 0:   # boş dosya mmap edilemez
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm).cast("q")
+            try:
+                for start in range(0, len(view), buffer_items):
+                    block = view[start:start + buffer_items].tolist()
+                    stats.bytes_read += len(block) * _ITEM_SIZE
+                    yield from block
+            finally:
+                view.release()
+        return
+
+    with open(path, "rb") as f:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(f, buffer_items)
+            except EOFError:
+                pass
+            if not block:
+                return
+            stats.bytes_read += len(block) * _ITEM_SIZE
+            yield from block
+
+
+class _BufferedWriter:
+    """Çıktıyı buffer_items elemanlık bloklar halinde yazan küçük yardımcı."""
+
+    def __init__(self, f, fmt: str, buffer_items: int, stats: ExternalSortStats):
+        self.f = f
+        self.fmt = fmt
+        self.buffer_items = buffer_items
+        self.stats = stats
+        self.buffer = []
+
+    def write(self, value):
+        self.buffer.append(value)
+        if len(self.buffer) >= self.buffer_items:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.fmt == "binary":
+            data = array("q", self.buffer).tobytes()
+        else:
+            data = "".join(f"{v}\n" for v in self.buffer).encode()
+        self.f.write(data)
+        self.stats.bytes_written += len(data)
+        self.buffer = []
+
+
+# --------------------------------------------------
+# Sayaçlı k-yollu heap merge
+# --------------------------------------------------
+def _sift_down(vals, runs, root: int, size: int):
+    """
+    (değer, run) min-heap'inde root'u aşağı iter. Eşit değerlerde küçük run
+    numarası önce gelir (kararlılık). Dönüş: (karşılaştırma, swap) sayıları.
+    """
+    comps = 0
+    swaps = 0
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return comps, swaps
+        right = child + 1
+        if right < size:
+            comps += 1
+            if vals[right] < vals[child] or (vals[right] == vals[child] and runs[right] < runs[child]):
+                child = right
+        comps += 1
+        if vals[root] < vals[child] or (vals[root] == vals[child] and runs[root] < runs[child]):
+            return comps, swaps
+        vals[root], vals[child] = vals[child], vals[root]
+        runs[root], runs[child] = runs[child], runs[root]
+        swaps += 1
+        root = child
+
+
+def kway_merge(iterators, emit, counters: Counters):
+    """
+    Sıralı iterator'ları sayaçlı min-heap ile birleştirir; her elemanı emit(v) ile verir.
+    """
+    vals, runs = [], []
+    for r, it in enumerate(iterators):
+        for v in it:
+            vals.append(v)
+            runs.append(r)
+            break
+
+    comps = 0
+    swaps = 0
+    size = len(vals)
+    for start in range(size // 2 - 1, -1, -1):
+        c, s = _sift_down(vals, runs, start, size)
+        comps += c
+        swaps += s
+
+    written = 0
+    while size:
+        emit(vals[0])
+        written += 1
+
+        nxt = next(iterators[runs[0]], None)
+        if nxt is None:
+            # Run bitti: son yaprağı köke al
+            size -= 1
+            vals[0], runs[0] = vals[size], runs[size]
+            vals.pop()
+            runs.pop()
+        else:
+            vals[0] = nxt
+
+        if size > 1:
+            c, s = _sift_down(vals, runs, 0, size)
+            comps += c
+            swaps += s
+
+    if counters is not None:
+        counters.comparisons += comps
+        counters.assignments += 3 * swaps + written
+
+
+# --------------------------------------------------
+# Harici MergeSort
+# --------------------------------------------------
+def external_sort(input_path, output_path, counters: Counters, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  fmt: str = "binary", out_fmt: str = None, engine: str = "bottomup",
+                  use_mmap: bool = False, buffer_items: int = DEFAULT_BUFFER_ITEMS, tmp_dir=None):
+    """
+    input_path'teki tamsayıları sıralayıp output_path'e yazar.
+
+    Parametreler:
+        counters     : tüm aşamaların sayaçlarının toplanacağı Counters nesnesi
+        chunk_size   : bir run'ın eleman sayısı (bellekte aynı anda tutulan en büyük parça)
+        fmt / out_fmt: girdi / çıktı biçimi ("binary" veya "text"; out_fmt yoksa fmt)
+        engine       : run'ları sıralayan MERGESORT_ENGINES motoru
+        use_mmap     : True ise merge aşamasında run'lar mmap ile okunur
+        buffer_items : merge aşamasında run başına okuma ve çıktı yazma blok boyutu
+        tmp_dir      : geçici run dosyalarının dizini (None -> sistem varsayılanı)
+
+    Dönüş:
+        ExternalSortStats
+    """
+    _check_format(fmt)
+    out_fmt = out_fmt or fmt
+    _check_format(out_fmt)
+    if engine not in MERGESORT_ENGINES:
+        raise ValueError(f"Bilinmeyen merge_engine: {engine}")
+    sort_run = MERGESORT_ENGINES[engine]
+
+    stats = ExternalSortStats()
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="extsort_") as work_dir:
+        # 1) Run üretimi
+        run_paths = []
+        for chunk in _read_chunks(input_path, fmt, chunk_size, stats):
+            run = sort_run(chunk, counters)
+            path = os.path.join(work_dir, f"run_{len(run_paths):06d}.bin")
+            stats.bytes_written += write_array(path, run, "binary")
+            run_paths.append(path)
+            del chunk, run
+        stats.runs = len(run_paths)
+
+        # 2) k-yollu merge
+        with open(output_path, "wb") as f:
+            writer = _BufferedWriter(f, out_fmt, buffer_items, stats)
+            iterators = [_iter_run(path, buffer_items, use_mmap, stats) for path in run_paths]
+            try:
+                kway_merge(iterators, writer.write, counters)
+            finally:
+                for it in iterators:
+                    it.close()
+            writer.flush()
+
+    return stats
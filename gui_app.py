@@ -1,8 +1,12 @@
 # gui_app.py
+import time
+
 import streamlit as st
-import pandas as pd
 
-from benchmark import run_single_experiment
+from algorithms import QuickSortConfig, PIVOT_STRATEGIES, PARTITION_SCHEMES, RADIX_DIGIT_BITS
+from jobs import ExperimentJobs
+from workloads import WORKLOADS, workload_mode
+from energy_meters import ENERGY_METERS
 
 # ----------------------------
 # Sayfa ayarı + küçük stil dokunuşu
@@ -29,34 +33,121 @@ div[data-testid="stDataFrame"] {
 </style>
 """, unsafe_allow_html=True)
 
+# Tüm oturumların paylaştığı arka plan iş havuzu + sonuç önbelleği
+@st.cache_resource
+def get_jobs() -> ExperimentJobs:
+    return ExperimentJobs(workers=2)
+
+
+jobs = get_jobs()
+
+# Koşan işin ilerlemesi bu aralıkla (sn) yenilenir
+POLL_INTERVAL = 0.25
+
 st.title("Divide & Conquer Enerji Deneyi")
-st.caption("MergeSort vs QuickSort — süre, sayaçlar, proxy enerji ve (opsiyonel) CodeCarbon tahmini ölçümleri")
+st.caption("MergeSort vs QuickSort vs TimSort (run-uyarlamalı hibrit) vs radix / counting sort — süre, sayaçlar, "
+           "proxy enerji ve (opsiyonel) CodeCarbon tahmini ölçümleri")
 
 # ----------------------------
 # Sol panel: kullanıcı seçimleri
 # ----------------------------
 with st.sidebar:
     st.header("Deney Ayarları")
-    n = st.selectbox("Dizi boyutu (n)", [1000, 5000, 10000], index=0)
-    mode = st.selectbox(
+    n = st.select_slider(
+        "Dizi boyutu (n)",
+        [1000, 5000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000, 10_000_000],
+        value=1000,
+        help="Deney arka planda koşar; büyük n'lerde sayfa donmaz, ilerleme çubuğu güncellenir. "
+             "Büyük n için bottomup motoru ve uncounted ölçüm modu önerilir."
+    )
+    workload_name = st.selectbox(
         "Senaryo (mode)",
-        ["random", "sorted", "reversed"],
+        list(WORKLOADS),
+        index=0,
+        format_func=lambda name: f"{name} — {WORKLOADS[name].description}",
+        help="random: rastgele, sorted: önceden sıralı, reversed: ters sıralı; "
+             "diğerleri kısmen sıralı, tekrar ağırlıklı ve düşmanca senaryolar"
+    )
+    workload_params = {}
+    if WORKLOADS[workload_name].defaults:
+        with st.expander("Senaryo parametreleri"):
+            for key, default in WORKLOADS[workload_name].defaults.items():
+                step = 1.0 if isinstance(default, float) else 1
+                workload_params[key] = st.number_input(key, value=default, step=step)
+    mode = workload_mode(workload_name, **workload_params)
+    merge_engine = st.selectbox(
+        "MergeSort motoru",
+        ["topdown", "bottomup", "natural", "kway", "blocked"],
+        index=0,
+        help="topdown: klasik özyinelemeli, bottomup: tek tamponlu iteratif, natural: hazır run'larla başlayan bottom-up, "
+             "kway: 4-yollu loser tree (daha az bellek geçişi), blocked: önbelleğe sığan bloklar + k-yollu birleştirme"
+    )
+    instrumentation = st.selectbox(
+        "Ölçüm modu (instrumentation)",
+        ["counted", "batched", "uncounted", "split"],
+        index=0,
+        help="counted: her işlemde sayaç, batched: çağrı başına toplu sayaç, "
+             "uncounted: sayaçsız saf süre, split: süre sayaçsız koşudan, sayaçlar ayrı koşudan"
+    )
+    backend = st.selectbox(
+        "Dizi backend'i",
+        ["list", "numpy"],
+        index=0,
+        help="list: Python listeleri, numpy: int64 NumPy dizileri + vektörel merge/partition "
+             "(numpy.sort karşılaştırma sütunlarıyla)"
+    )
+    energy_meter = st.selectbox(
+        "Enerji ölçer",
+        ["auto", *ENERGY_METERS],
+        index=0,
+        help="auto: RAPL, yoksa perf, yoksa ölçüm yok; rapl: /sys/class/powercap sayaçları; "
+             "perf: perf_event_open power olayları; fake: sabit güçlü sahte ölçer; null: ölçüm yok"
+    )
+    sample_ms = st.number_input(
+        "Güç örnekleme aralığı (ms, 0 = kapalı)", min_value=0.0, max_value=100.0, value=0.0, step=0.5,
+        help="0'dan büyükse ölçer arka planda bu aralıkla örneklenir: tekrar başına Joule ve canlı güç izi. "
+             "Saf Python sıralamaları GIL'i tuttuğu için gerçek örnek aralığı daha uzun olabilir."
+    )
+    sample_interval = sample_ms / 1000.0 if sample_ms > 0 else None
+    with st.expander("QuickSort ayarı"):
+        q_pivot = st.selectbox("Pivot stratejisi", list(PIVOT_STRATEGIES), index=0)
+        q_scheme = st.selectbox("Partition şeması", list(PARTITION_SCHEMES), index=0)
+        q_cutoff = st.number_input("Insertion sort eşiği (0 = kapalı)", min_value=0, max_value=64, value=0)
+        q_intro = st.checkbox("Introsort (derinlik sınırında heapsort)", value=False)
+    quick_config = QuickSortConfig(q_pivot, q_scheme, int(q_cutoff), q_intro)
+    radix_bits = st.selectbox(
+        "Radix basamak genişliği (bit)",
+        list(RADIX_DIGIT_BITS),
         index=0,
-        help="random: rastgele, sorted: önceden sıralı, reversed: ters sıralı"
+        help="RadixLSD / RadixMSD her geçişte bu kadar bit işler: 8 -> 256 kova (bayt), 11 -> 2048 kova"
     )
     repetitions = st.slider(
         "Tekrar sayısı (repetitions)",
         min_value=1, max_value=20, value=5, step=1,
         help="Her senaryoyu kaç kez koşup ortalama alınacağını belirler."
     )
+    seed = st.number_input(
+        "Tohum (seed)", min_value=0, value=0, step=1,
+        help="Aynı tohum + aynı ayarlar önbellekteki sonucu tekrar kullanır."
+    )
+    profile = st.checkbox(
+        "Profil (faz / derinlik / bellek)", value=False,
+        help="Ölçümlerden sonra ayrı bir profil koşusu yapar: faz süreleri, özyineleme derinliği "
+             "başına işlem sayıları ve tracemalloc tepe belleği (yalnızca list backend)."
+    )
 
     st.divider()
     st.write("Çıktılar:")
     st.write("- avg_time_ms: ortalama süre (ms)")
     st.write("- avg_comp: ortalama karşılaştırma sayısı")
     st.write("- avg_assign: ortalama atama/swap sayısı")
-    st.write("- energy_proxy: avg_comp + avg_assign")
-    st.write("- energy_joule / emissions_kg: CodeCarbon (tahmini)")
+    st.write("- avg_bytes_moved / avg_cache_misses: bellek trafiği modeli (geçiş başına okunan + yazılan bayt, "
+             "önbelleğe sığmayan geçişlerde tahmini satır kaçırma)")
+    st.write("- avg_bucket_ops: radix / counting sort kova işlemleri (sayım, önek toplamı, dağıtım)")
+    st.write("- avg_stack_depth: QuickSort / RadixMSD yığınının, TimSort run yığınının ortalama en büyük derinliği")
+    st.write("- energy_proxy: avg_comp + avg_assign + avg_bucket_ops")
+    st.write("- energy_joule: algoritma başına ölçülen ortalama Joule (RAPL / perf)")
+    st.write("- emissions_kg: CodeCarbon (tahmini)")
 
 run = st.button("Deneyi Başlat ▶️", use_container_width=True)
 
@@ -73,27 +164,27 @@ def scenario_text(mode_: str) -> str:
     if mode_ == "reversed":
         return ("Reversed (ters sıralı) senaryo, **kötü duruma yakın** bir stres testidir. "
                 "Algoritmaların zorlayıcı veri düzenlerinde süre ve işlem sayısı açısından nasıl değiştiğini gösterir.")
+    name = mode_.partition(":")[0]
+    if name in WORKLOADS:
+        return f"{mode_} senaryosu: {WORKLOADS[name].description}."
     return ""
 
-def compare_paragraph(m, q, mode_: str) -> str:
-    # Basit kıyas metni
-    faster = "MergeSort" if m["avg_time_ms"] < q["avg_time_ms"] else "QuickSort"
-    lower_proxy = "MergeSort" if m["energy_proxy"] < q["energy_proxy"] else "QuickSort"
-
-    # fark yüzdesi
-    t_diff = abs(m["avg_time_ms"] - q["avg_time_ms"])
-    t_base = min(m["avg_time_ms"], q["avg_time_ms"]) or 1e-9
-    t_pct = (t_diff / t_base) * 100.0
+def compare_paragraph(results, mode_: str) -> str:
+    # Basit kıyas metni: en iyi algoritma ve bir sonrakine göre fark yüzdesi
+    def leader(key):
+        ranked = sorted(results, key=lambda r: r[key])
+        base = ranked[0][key] or 1e-9
+        return ranked[0]["algo"], (ranked[1][key] - ranked[0][key]) / base * 100.0
 
-    e_diff = abs(m["energy_proxy"] - q["energy_proxy"])
-    e_base = min(m["energy_proxy"], q["energy_proxy"]) or 1e-9
-    e_pct = (e_diff / e_base) * 100.0
+    faster, t_pct = leader("avg_time_ms")
+    lower_proxy, e_pct = leader("energy_proxy")
+    first = results[0]
 
     return (
-        f"Bu çalışmada **n={m['n']}** ve **{mode_}** senaryosu için her algoritma **{m['repetitions']}** kez çalıştırılıp "
-        f"ortalama değerler alınmıştır. Süre ölçümüne göre **{faster}** daha hızlı görünmektedir "
-        f"(yaklaşık **%{t_pct:.1f}** fark). İşlem tabanlı proxy enerji metriğinde (avg_comp + avg_assign) ise "
-        f"**{lower_proxy}** daha düşük maliyet üretmiştir (yaklaşık **%{e_pct:.1f}** fark). "
+        f"Bu çalışmada **n={first['n']}** ve **{mode_}** senaryosu için her algoritma **{first['repetitions']}** "
+        f"kez çalıştırılıp ortalama değerler alınmıştır. Süre ölçümüne göre **{faster}** en hızlı görünmektedir "
+        f"(bir sonrakine göre yaklaşık **%{t_pct:.1f}** fark). İşlem tabanlı proxy enerji metriğinde "
+        f"(avg_comp + avg_assign + avg_bucket_ops) ise **{lower_proxy}** en düşük maliyeti üretmiştir (yaklaşık **%{e_pct:.1f}** fark). "
         f"{scenario_text(mode_)}"
     )
 
@@ -101,17 +192,58 @@ def compare_paragraph(m, q, mode_: str) -> str:
 # Deney çalıştırma
 # ----------------------------
 if run:
-    with st.spinner("Çalıştırılıyor..."):
-        merge_res, quick_res = run_single_experiment(n, mode, repetitions)
+    # Aynı (n, mode, repetitions, seed, variant) daha önce koşulduysa önbellekten gelir
+    st.session_state["job_key"] = jobs.submit(n, mode, repetitions, seed=int(seed), merge_engine=merge_engine,
+                                              instrumentation=instrumentation, backend=backend,
+                                              quick_config=quick_config, energy_meter=energy_meter,
+                                              profile=profile, radix_bits=int(radix_bits),
+                                              sample_interval=sample_interval)
+
+job_key = st.session_state.get("job_key")
+result = None
+if job_key is not None:
+    if jobs.status(job_key) == "running":
+        progress_bar = st.progress(0.0, text="Arka planda çalıştırılıyor...")
+        live_chart = st.empty()
+        while jobs.status(job_key) == "running":
+            progress_bar.progress(jobs.progress(job_key), text="Arka planda çalıştırılıyor...")
+            trace = jobs.power_trace(job_key)
+            if trace:
+                live_chart.line_chart({"watt": [w for _, w in trace]})
+            time.sleep(POLL_INTERVAL)
+        progress_bar.empty()
+        live_chart.empty()
+    try:
+        result = jobs.result(job_key)
+    except Exception as exc:
+        st.error(f"Deney başarısız oldu: {exc}")
+        del st.session_state["job_key"]
+    else:
+        if result is None:
+            # Önbellekten düşmüş (LRU): kullanıcı yeniden başlatmalı
+            st.warning("Bu deneyin sonucu önbellekten silinmiş; lütfen yeniden başlatın.")
+            del st.session_state["job_key"]
+
+if result is not None:
+    # pandas yalnızca sonuç tablosu / grafikleri çizilirken gerekir; ilk sayfa
+    # açılışı ve ayar değişiklikleri onun yükleme süresini ödemez
+    import pandas as pd
+
+    results = list(result)
+    mode = results[0]["mode"]
 
     # tablo
-    df = pd.DataFrame([merge_res, quick_res])
+    df = pd.DataFrame(results)
 
     cols = [
         "algo", "n", "mode", "repetitions",
-        "avg_time_ms", "avg_comp", "avg_assign",
+        "avg_time_ms", "avg_comp", "avg_assign", "avg_bytes_moved", "avg_cache_misses", "avg_bucket_ops",
+        "avg_stack_depth",
         "energy_proxy", "energy_joule", "emissions_kg"
     ]
+    np_cols = ["np_mergesort_ms", "np_quicksort_ms", "np_stable_ms"]
+    if results[0].get("backend") == "numpy":
+        cols += np_cols
     df = df[cols]
 
     # daha okunur format (tablo gösteriminde)
@@ -119,9 +251,16 @@ if run:
     df_show["avg_time_ms"] = df_show["avg_time_ms"].map(lambda x: f"{x:.3f}")
     df_show["avg_comp"] = df_show["avg_comp"].map(lambda x: f"{x:.1f}")
     df_show["avg_assign"] = df_show["avg_assign"].map(lambda x: f"{x:.1f}")
+    df_show["avg_bytes_moved"] = df_show["avg_bytes_moved"].map(lambda x: f"{x:.0f}")
+    df_show["avg_cache_misses"] = df_show["avg_cache_misses"].map(lambda x: f"{x:.0f}")
+    df_show["avg_bucket_ops"] = df_show["avg_bucket_ops"].map(lambda x: f"{x:.1f}")
+    df_show["avg_stack_depth"] = df_show["avg_stack_depth"].map(lambda x: "-" if x is None else f"{x:.1f}")
     df_show["energy_proxy"] = df_show["energy_proxy"].map(lambda x: f"{x:.1f}")
-    df_show["energy_joule"] = df_show["energy_joule"].map(lambda x: "-" if x is None else f"{x:.2f}")
+    df_show["energy_joule"] = df_show["energy_joule"].map(lambda x: "-" if x is None else f"{x:.4f}")
     df_show["emissions_kg"] = df_show["emissions_kg"].map(lambda x: "-" if x is None else f"{x:.8f}")
+    for col in np_cols:
+        if col in df_show:
+            df_show[col] = df_show[col].map(lambda x: "-" if x is None else f"{x:.3f}")
 
     st.success("Bitti ✅")
 
@@ -130,25 +269,25 @@ if run:
     # ----------------------------
     st.subheader("Özet Metrikler")
 
-    c1, c2, c3, c4 = st.columns(4)
-
-    c1.metric("MergeSort süre", f"{merge_res['avg_time_ms']:.3f} ms")
-    c2.metric("QuickSort süre", f"{quick_res['avg_time_ms']:.3f} ms")
-    c3.metric("MergeSort energy_proxy", f"{merge_res['energy_proxy']:.1f}")
-    c4.metric("QuickSort energy_proxy", f"{quick_res['energy_proxy']:.1f}")
+    # Her algoritma için bir sütun: süre ve energy_proxy kartları
+    for col, res in zip(st.columns(len(results)), results):
+        col.metric(f"{res['algo']} süre", f"{res['avg_time_ms']:.3f} ms")
+        col.metric(f"{res['algo']} energy_proxy", f"{res['energy_proxy']:.1f}")
 
-    # küçük not (codecarbon)
-    with st.expander("Not: CodeCarbon ölçümleri nasıl okunmalı?"):
+    # küçük not (enerji ölçümü)
+    with st.expander("Not: enerji ölçümleri nasıl okunmalı?"):
         st.write(
-            "CodeCarbon bu senaryoyu (n, mode, repetitions) kapsayan tek bir ölçüm alır. "
-            "Bu yüzden aynı senaryoda MergeSort ve QuickSort satırlarında energy_joule / emissions_kg "
-            "değerleri **aynı görünebilir**. Proxy enerji metriği (energy_proxy) ise algoritmaya özeldir."
+            "energy_joule her algoritmanın sıralama çağrısının etrafında ayrı ölçülür (RAPL / perf sayaçları). "
+            "Bu sayaçlar paket genelidir; arka plandaki diğer işler de ölçüme karışabilir. "
+            "Ölçer yoksa değer '-' görünür. CodeCarbon (emissions_kg) ise senaryoyu (n, mode, repetitions) "
+            "kapsayan tek bir ölçüm alır, bu yüzden bütün satırlarda **aynı görünebilir**. "
+            "Proxy enerji metriği (energy_proxy) algoritmaya özeldir."
         )
 
     # ----------------------------
     # Sekmeler: tablo / grafik / yorum
     # ----------------------------
-    tab1, tab2, tab3 = st.tabs(["📋 Sonuç Tablosu", "📊 Grafikler", "📝 Yorum"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Sonuç Tablosu", "📊 Grafikler", "📝 Yorum", "🔬 Profil", "⚡ Güç"])
 
     with tab1:
         st.dataframe(df_show, use_container_width=True)
@@ -162,16 +301,71 @@ if run:
             st.bar_chart(chart_df)
 
         with right:
-            st.markdown("**energy_proxy (avg_comp + avg_assign)**")
+            st.markdown("**energy_proxy (avg_comp + avg_assign + avg_bucket_ops)**")
             chart_df2 = df.set_index("algo")[["energy_proxy"]]
             st.bar_chart(chart_df2)
 
+        left2, right2 = st.columns(2)
+
+        with left2:
+            st.markdown("**avg_bytes_moved (bayt)**")
+            st.bar_chart(df.set_index("algo")[["avg_bytes_moved"]])
+
+        with right2:
+            st.markdown("**avg_cache_misses (tahmini)**")
+            st.bar_chart(df.set_index("algo")[["avg_cache_misses"]])
+
     with tab3:
         st.markdown("### Sonuç açıklaması")
-        st.write(compare_paragraph(merge_res, quick_res, mode))
+        st.write(compare_paragraph(results, mode))
 
         st.markdown("### Senaryo açıklaması")
         st.info(scenario_text(mode))
 
-else:
+    with tab4:
+        records = [record for res in results for record in (res.get("profile") or [])]
+        if not records:
+            st.info("Profil kaydı yok: soldan **Profil** seçeneğini açıp deneyi yeniden başlat (list backend).")
+        else:
+            prof_df = pd.DataFrame(records)
+            runs = prof_df[prof_df["kind"] == "run"].set_index("algo")
+            for col, algo in zip(st.columns(len(runs.index)), runs.index):
+                col.metric(f"{algo} tepe bellek", f"{runs.loc[algo, 'peak_bytes'] / 1024:.1f} KiB")
+
+            st.markdown("**Faz süreleri (s)** — kalan süre 'overhead' (özyineleme / yığın / çağrı maliyeti)")
+            phases = prof_df[prof_df["kind"] == "phase"].pivot(index="algo", columns="phase", values="seconds")
+            st.bar_chart(phases.fillna(0.0))
+
+            depths = prof_df[prof_df["kind"] == "depth"].copy()
+            depths["ops"] = depths["comparisons"] + depths["assignments"]
+            left, right = st.columns(2)
+            with left:
+                st.markdown("**Derinlik başına işlem (comparisons + assignments)**")
+                st.line_chart(depths.pivot(index="depth", columns="algo", values="ops"))
+            with right:
+                st.markdown("**Derinlik başına süre (s)**")
+                st.line_chart(depths.pivot(index="depth", columns="algo", values="seconds"))
+
+    with tab5:
+        windows = [dict(window, algo=res["algo"]) for res in results for window in (res.get("energy_windows") or [])]
+        if not windows:
+            st.info("Güç izi yok: soldan **Güç örnekleme aralığı**nı 0'dan büyük seçip deneyi yeniden başlat "
+                    "(RAPL / perf ya da fake ölçer gerekir).")
+        else:
+            st.markdown("**Güç izi (W)** — her algoritmanın kendi tekrarlarına düşen örnekler, deney başından saniye")
+            trace_frames = [pd.DataFrame(res["power_trace"], columns=["t_s", "watt"]).assign(algo=res["algo"])
+                            for res in results if res.get("power_trace")]
+            if trace_frames:
+                trace_df = pd.concat(trace_frames, ignore_index=True)
+                st.line_chart(trace_df.pivot_table(index="t_s", columns="algo", values="watt"))
+            else:
+                st.info("Tekrarlar örnekleme aralığından kısa sürdü; pencerelere düşen güç örneği yok. "
+                        "Daha küçük aralık ya da daha büyük n seçilebilir (tekrar başına enerji aşağıda).")
+
+            win_df = pd.DataFrame(windows)
+            st.markdown("**Tekrar başına enerji (J)**")
+            st.bar_chart(win_df.pivot(index="rep", columns="algo", values="joules"))
+            st.dataframe(win_df[["algo", "rep", "start_s", "end_s", "joules", "watts"]], use_container_width=True)
+
+elif job_key is None:
     st.info("Soldan ayarları seçip **Deneyi Başlat ▶️** butonuna bas.")
@@ -0,0 +1,159 @@
+"""
+import_times.py
+---------------
+Giriş noktalarının başlangıç (import) maliyeti.
+
+Her giriş noktası temiz bir yorumlayıcıda `python -X importtime -c "import <modül>"`
+ile yüklenir; stderr'deki importtime raporu ayrıştırılır:
+
+- import_ms : giriş modülünün (bağımlılıkları dahil) toplam yükleme süresi
+- wall_ms   : yorumlayıcı açılışı dahil duvar saati süresi
+- heaviest  : kendi (self) süresi en büyük modüller
+- heavy     : HEAVY_MODULES'tan başlangıçta yüklenenler (pandas, codecarbon,
+              numpy, ...) — bunlar yalnızca kullanıldıkları yolda yüklenmeli
+
+gui_app.py ölçülmez: içe aktarılması Streamlit sayfasını çalıştırır. GUI'nin
+arka plan işçilerinin yüklediği zincir "jobs" giriş noktasıyla ölçülür.
+
+Örnek:
+    python import_times.py                        # tablo
+    python import_times.py --check                # ağır bağımlılık yüklenirse çıkış kodu 1
+    python import_times.py --history imports.jsonl   # sonuçları kod özetiyle dosyaya ekle
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+# Ölçülen giriş noktaları: ad -> içe aktarılan modül
+ENTRY_POINTS = {
+    "algorithms": "algorithms",
+    "benchmark": "benchmark",
+    "scaling": "scaling",
+    "experiment_spec": "experiment_spec",
+    "results_store": "results_store",
+    "powermetrics": "powermetrics",
+    "jobs": "jobs",
+}
+
+# Giriş noktaları bu dizinden içe aktarılır (betik başka bir dizinden çalıştırılsa da)
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Başlangıçta yüklenmemesi gereken (yalnızca kullanıldığı yolda yüklenen) paketler
+HEAVY_MODULES = ("numpy", "pandas", "codecarbon", "streamlit")
+
+
+@dataclass
+class ImportRecord:
+    """importtime raporunun bir satırı (süreler mikro saniye)."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str):
+    """`-X importtime` stderr çıktısını ImportRecord listesine çevirir (başlık satırı atlanır)."""
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+def _run_once(module: str, python: str):
+    start = time.perf_counter()
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, cwd=REPO_DIR)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} içe aktarılamadı:\n{proc.stderr.strip().splitlines()[-1]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def measure_entry_point(module: str, repeat: int = 5, python: str = None, top: int = 5) -> dict:
+    """
+    module'ü repeat kez ayrı yorumlayıcıda yükler; medyan süreleri döner.
+    heaviest ve heavy medyan koşunun raporundan alınır.
+    """
+    python = python or sys.executable
+    runs = []
+    for _ in range(repeat):
+        wall, records = _run_once(module, python)
+        import_us = next((r.cumulative_us for r in records if r.module == module and r.depth == 0), 0)
+        runs.append((import_us, wall, records))
+    runs.sort(key=lambda run: run[0])
+    import_us, _, records = runs[len(runs) // 2]
+    loaded = {r.module.partition(".")[0] for r in records}
+    return {
+        "entry": module,
+        "import_ms": import_us / 1000.0,
+        "wall_ms": statistics.median(run[1] for run in runs) * 1000.0,
+        "modules": len(records),
+        "heavy": sorted(loaded & set(HEAVY_MODULES)),
+        "heaviest": [(r.module, r.self_us / 1000.0)
+                     for r in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]],
+    }
+
+
+def measure_import_times(entry_points=ENTRY_POINTS, repeat: int = 5, python: str = None):
+    """Bütün giriş noktalarını ölçer; ayrıca boş yorumlayıcı açılışını ("python") taban olarak ekler."""
+    python = python or sys.executable
+    baseline = statistics.median(_run_once("sys", python)[0] for _ in range(repeat)) * 1000.0
+    results = [{"entry": "python", "import_ms": 0.0, "wall_ms": baseline, "modules": 0,
+                "heavy": [], "heaviest": []}]
+    for name, module in entry_points.items():
+        res = measure_entry_point(module, repeat, python)
+        res["entry"] = name
+        results.append(res)
+    return results
+
+
+def print_import_times(results):
+    header = f"{'entry':<16} {'import_ms':>10} {'wall_ms':>9} {'modules':>8}  {'ağır bağımlılık':<20} en yavaş modüller (self ms)"
+    print(header)
+    print("-" * len(header))
+    for res in results:
+        heavy = ",".join(res["heavy"]) or "-"
+        slowest = ", ".join(f"{name} {ms:.1f}" for name, ms in res["heaviest"][:3])
+        print(f"{res['entry']:<16} {res['import_ms']:>10.1f} {res['wall_ms']:>9.1f} {res['modules']:>8}  "
+              f"{heavy:<20} {slowest}")
+
+
+def append_history(results, path: str):
+    """Sonuçları kod özeti ve zaman damgasıyla JSON Lines dosyasına ekler (sürümler arası takip)."""
+    import json
+    from results_store import code_hash, machine_fingerprint
+
+    code, machine, stamp = code_hash(), machine_fingerprint(), time.time()
+    with open(path, "a", encoding="utf-8") as f:
+        for res in results:
+            f.write(json.dumps({"code": code, "machine": machine, "created_at": stamp, **res}) + "\n")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Giriş noktalarının import süresi (-X importtime)")
+    parser.add_argument("--repeat", type=int, default=5, help="giriş noktası başına ölçüm sayısı (medyan)")
+    parser.add_argument("--history", help="sonuçların ekleneceği JSON Lines dosyası")
+    parser.add_argument("--check", action="store_true",
+                        help="bir giriş noktası HEAVY_MODULES'tan birini yüklerse çıkış kodu 1")
+    args = parser.parse_args()
+
+    results = measure_import_times(repeat=args.repeat)
+    print_import_times(results)
+    if args.history:
+        append_history(results, args.history)
+    if args.check and any(res["heavy"] for res in results):
+        sys.exit(1)
@@ -0,0 +1,148 @@
+"""
+jobs.py
+-------
+GUI (gui_app.py) için arka plan deney yöneticisi.
+
+- Deneyler bir süreç havuzunda (ProcessPoolExecutor) koşar; Streamlit betiği
+  beklerken kilitlenmez ve aynı panoyu kullanan birden çok oturum aynı
+  süreçte sıraya girmez.
+- İlerleme, işçiden multiprocessing.Manager sözlüğü üzerinden okunur
+  (run_single_experiment(progress=...) her algoritma koşusundan sonra yazar).
+  sample_interval verilen işlerde canlı güç izi de aynı yolla okunur
+  (son LIVE_TRACE_POINTS nokta).
+- Sonuçlar (n, mode, repetitions, seed, variant) anahtarıyla sınırlı bir LRU
+  önbellekte tutulur; aynı deney tekrar istenirse yeniden koşulmaz, aynı anda
+  iki kez istenirse tek iş paylaşılır.
+"""
+
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from benchmark import run_single_experiment
+
+# Önbellekte tutulan en fazla sonuç sayısı
+DEFAULT_MAX_ENTRIES = 64
+
+# Canlı güç izinde iş başına tutulan en fazla nokta
+LIVE_TRACE_POINTS = 2000
+
+
+def job_key(n: int, mode: str, repetitions: int, seed: int, **variant):
+    """Önbellek anahtarı: (n, mode, repetitions, seed, variant) — variant ayarların sıralı demeti."""
+    return (n, mode, repetitions, seed, tuple(sorted((k, str(v)) for k, v in variant.items())))
+
+
+def _run_job(key, kwargs: dict, progress_table, trace_table):
+    """
+    İşçi süreçte deneyi koşar; ilerlemeyi progress_table[key]'e (0..1), güç
+    örnekleniyorsa canlı izi trace_table[key]'e ([(t_sn, watt), ...]) yazar.
+    """
+    def report(done, total):
+        progress_table[key] = done / total
+
+    def report_power(points):
+        trace_table[key] = (trace_table.get(key, []) + points)[-LIVE_TRACE_POINTS:]
+
+    power_callback = report_power if kwargs.get("sample_interval") else None
+    return run_single_experiment(**kwargs, progress=report, power_callback=power_callback)
+
+
+class ExperimentJobs:
+    """
+    Süreç havuzu + LRU sonuç önbelleği.
+
+    Kullanım:
+        jobs = ExperimentJobs(workers=2)
+        key = jobs.submit(n=10_000, mode="random", repetitions=5, seed=0, backend="list")
+        while jobs.status(key) == "running":
+            print(jobs.progress(key))
+        results = jobs.result(key)   # benchmark.ALGORITHMS sırasıyla sonuç sözlükleri
+    """
+
+    def __init__(self, workers: int = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        self._manager = multiprocessing.Manager()
+        self._progress = self._manager.dict()
+        self._traces = self._manager.dict()
+        self._results = OrderedDict()
+        self._errors = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def submit(self, n: int, mode: str, repetitions: int, seed: int = 0, **options):
+        """
+        Deneyi kuyruğa ekler (önbellekte ya da çalışıyorsa yeniden eklemez).
+        options run_single_experiment'e aynen geçer. Dönüş: iş anahtarı.
+        """
+        key = job_key(n, mode, repetitions, seed, **options)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return key
+            if key in self._futures:
+                return key
+            self._errors.pop(key, None)
+            self._progress[key] = 0.0
+            kwargs = dict(n=n, mode=mode, repetitions=repetitions, seed=seed, **options)
+            future = self._pool.submit(_run_job, key, kwargs, self._progress, self._traces)
+            self._futures[key] = future
+        future.add_done_callback(partial(self._finish, key))
+        return key
+
+    def _finish(self, key, future):
+        if future.cancelled():
+            # shutdown(cancel_futures=True): Manager sözlükleri kapanmış olabilir
+            with self._lock:
+                self._futures.pop(key, None)
+            return
+        with self._lock:
+            self._futures.pop(key, None)
+            self._progress.pop(key, None)
+            self._traces.pop(key, None)
+            error = future.exception()
+            if error is not None:
+                self._errors[key] = error
+                return
+            self._results[key] = future.result()
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)   # en eski kullanılan sonuç
+
+    def status(self, key) -> str:
+        """"done", "running", "failed" veya "missing" (hiç istenmemiş / önbellekten düşmüş)."""
+        with self._lock:
+            if key in self._results:
+                return "done"
+            if key in self._futures:
+                return "running"
+            if key in self._errors:
+                return "failed"
+            return "missing"
+
+    def progress(self, key) -> float:
+        """Çalışan işin tamamlanma oranı (0..1); bitmişse 1."""
+        if self.status(key) == "done":
+            return 1.0
+        return self._progress.get(key, 0.0)
+
+    def power_trace(self, key):
+        """Çalışan işin canlı güç izi [(t_sn, watt), ...]; yoksa boş liste."""
+        return list(self._traces.get(key, []))
+
+    def result(self, key):
+        """run_single_experiment sonuç demeti; iş bitmediyse None, başarısızsa hatayı yükseltir."""
+        with self._lock:
+            if key in self._errors:
+                raise self._errors.pop(key)
+            if key not in self._results:
+                return None
+            self._results.move_to_end(key)
+            return self._results[key]
+
+    def shutdown(self):
+        self._pool.shutdown(cancel_futures=True)
+        self._manager.shutdown()
@@ -0,0 +1,262 @@
+"""
+numpy_backend.py
+----------------
+algorithms.py'deki liste tabanlı algoritmaların OPSİYONEL NumPy karşılıkları.
+
+- generate_array_np : senaryo dizisini tek vektörel çağrıyla, bitişik (contiguous)
+                      int64 NumPy dizisi olarak üretir.
+- mergesort_np      : bottom-up MergeSort; her seviyedeki TÜM birleştirmeler
+                      searchsorted ile vektörel yapılır.
+- quicksort_np      : iteratif QuickSort; partition adımı boolean maske ile vektörel.
+- numpy_sort_times  : referans olarak numpy.sort (mergesort / quicksort / stable) süreleri.
+
+Sayaçlar liste sürümleriyle aynı kurallara göre, vektörel adımlardan analitik
+olarak hesaplanır. mergesort_np, mergesort_bottom_up ile aynı girdide birebir
+aynı toplamları verir. quicksort_np'de partition sonrası eleman sırası Lomuto'dan
+farklı olduğundan (kararlı bölme) alt problemler ve dolayısıyla toplamlar biraz
+farklılaşabilir.
+
+Vektörel adımlarda eleman başına sayaç yazmak mümkün olmadığından "counted"
+ve "batched" modları burada aynı şekilde (adım başına toplu) sayar.
+
+NumPy kurulu değilse modül yine içe aktarılabilir; fonksiyonlar çağrıldığında
+anlaşılır bir ImportError verilir.
+"""
+
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsiyonel bağımlılık
+    np = None
+
+from algorithms import Counters, _batch_target, _quicksort_loop, _record_traffic
+from workloads import generate_workload
+
+# numpy.sort referans ölçümü için kullanılan 'kind' değerleri
+NUMPY_SORT_KINDS = ("mergesort", "quicksort", "stable")
+
+
+def require_numpy():
+    """NumPy yoksa anlaşılır bir hata verir."""
+    if np is None:
+        raise ImportError(
+            "NumPy backend için numpy gerekli: python -m pip install numpy"
+        )
+
+
+# --------------------------------------------------
+# Veri üretici (vektörel)
+# --------------------------------------------------
+def generate_array_np(n: int, mode: str = "random", rng=None, seed: int = None):
+    """
+    generate_array'in NumPy karşılığı: bitişik int64 dizi döner.
+
+    Parametreler:
+        n   : dizi boyutu
+        mode: senaryo adı; "random", "sorted" ve "reversed" vektörel üretilir,
+              diğer workloads.WORKLOADS senaryoları listeden int64'e çevrilir
+        rng : (opsiyonel) numpy.random.Generator; verilmezse seed ile yeni bir tane açılır
+        seed: (opsiyonel) rng verilmediğinde kullanılan tohum
+    """
+    require_numpy()
+
+    if mode == "random":
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        arr = rng.integers(0, 10_000_000, size=n, dtype=np.int64, endpoint=True)
+    elif mode == "sorted":
+        arr = np.arange(n, dtype=np.int64)
+    elif mode == "reversed":
+        arr = np.arange(n, 0, -1, dtype=np.int64)
+    else:
+        arr = np.array(generate_workload(n, mode, seed=seed), dtype=np.int64)
+    return np.ascontiguousarray(arr)
+
+
+# --------------------------------------------------
+# MergeSort (bottom-up, seviye başına vektörel merge)
+# --------------------------------------------------
+def mergesort_np(arr, counters: Counters, instrumentation: str = "counted"):
+    """
+    NumPy dizisi üzerinde bottom-up MergeSort. Yeni bir dizi döner, arr değişmez.
+
+    Her seviyede width uzunluklu komşu run çiftleri birleştirilir. Bir elemanın
+    hedef konumu = kendi run'ı içindeki sırası + karşı run'da kendinden önce
+    gelen eleman sayısı; ikincisi tüm seviye için tek searchsorted çağrısıyla
+    bulunur. Eşit elemanlarda sol run önce gelir (kararlı / stable).
+
+    Sayaçlar mergesort_bottom_up ile aynıdır:
+        - comparisons: skaler merge döngüsünün yapacağı karşılaştırma sayısı
+        - assignments: her seviyede hedef tampona yazılan eleman sayısı
+        - bytes_moved / cache_misses: seviye başına bir tam geçiş
+    """
+    require_numpy()
+    counters = _batch_target(counters, instrumentation)
+
+    src = np.array(arr, dtype=np.int64)  # kopya
+    n = src.shape[0]
+    if n <= 1:
+        return src
+
+    dst = np.empty_like(src)
+    width = 1
+    while width < n:
+        _merge_level_np(src, dst, width, counters)
+        _record_traffic(counters, n, 2 * n)
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _merge_level_np(src, dst, width: int, counters):
+    """src içindeki width uzunluklu run çiftlerini dst'ye birleştirir (tek seviye)."""
+    n = src.shape[0]
+    block = 2 * width
+    num_pairs = (n + block - 1) // block
+
+    vmin = int(src.min())
+    span = int(src.max()) - vmin + 1
+    if span * num_pairs >= 2 ** 62:
+        # Çift kimliğini anahtara gömmek taşma yapardı; çift çift birleştir.
+        for lo in range(0, n, block):
+            _merge_pair_np(src, dst, lo, min(lo + width, n), min(lo + block, n), counters)
+        return
+
+    idx = np.arange(n, dtype=np.int64)
+    pair = idx // block
+    is_left = (idx - pair * block) < width
+
+    # Anahtar = değer + çift_no * span -> farklı çiftlerin değerleri karışmaz,
+    # böylece tüm sağ (veya sol) run'lar art arda GLOBAL olarak sıralıdır.
+    key = (src - vmin) + pair * span
+    left_keys, right_keys = key[is_left], key[~is_left]
+    left_pair, right_pair = pair[is_left], pair[~is_left]
+
+    # Önceki çiftlerin run'ları hep tam width uzunluğundadır (yalnız son çift eksik olabilir)
+    rank_l = np.searchsorted(right_keys, left_keys, side="left") - left_pair * width
+    rank_r = np.searchsorted(left_keys, right_keys, side="right") - right_pair * width
+
+    dst[idx[is_left] + rank_l] = src[is_left]
+    dst[idx[~is_left] - width + rank_r] = src[~is_left]
+
+    if counters is None:
+        return
+
+    # Sağ run'ı olan çiftler için skaler merge'ün karşılaştırma sayısı:
+    #   sol run önce biterse: width + (sağda son sol elemandan küçük olanlar)
+    #   sağ run önce biterse: len_right + (solda son sağ elemana <= olanlar)
+    merged_pairs = (n - width + block - 1) // block if n > width else 0
+    if merged_pairs:
+        p = np.arange(merged_pairs, dtype=np.int64)
+        left_last = p * block + width - 1
+        right_last = np.minimum(p * block + block, n) - 1
+        len_right = right_last - (p * block + width) + 1
+        left_first_done = src[left_last] <= src[right_last]
+        comps = np.where(
+            left_first_done,
+            width + rank_l[p * width + width - 1],
+            len_right + rank_r[p * width + len_right - 1],
+        )
+        counters.comparisons += int(comps.sum())
+    counters.assignments += n
+
+
+def _merge_pair_np(src, dst, lo: int, mid: int, hi: int, counters):
+    """Tek bir src[lo:mid] + src[mid:hi] çiftini dst[lo:hi] içine birleştirir."""
+    left, right = src[lo:mid], src[mid:hi]
+    if right.shape[0] == 0:
+        dst[lo:hi] = left
+        if counters is not None:
+            counters.assignments += hi - lo
+        return
+
+    rank_l = np.searchsorted(right, left, side="left")
+    rank_r = np.searchsorted(left, right, side="right")
+    dst[lo + np.arange(left.shape[0]) + rank_l] = left
+    dst[lo + np.arange(right.shape[0]) + rank_r] = right
+
+    if counters is not None:
+        if left[-1] <= right[-1]:
+            counters.comparisons += left.shape[0] + int(rank_l[-1])
+        else:
+            counters.comparisons += right.shape[0] + int(rank_r[-1])
+        counters.assignments += hi - lo
+
+
+# --------------------------------------------------
+# QuickSort (iteratif, vektörel partition)
+# --------------------------------------------------
+def quicksort_np(arr, counters: Counters, instrumentation: str = "counted"):
+    """
+    NumPy dizisi üzerinde in-place iteratif QuickSort (rastgele pivot).
+    Stack disiplini ve pivot seçimi algorithms.quicksort ile aynıdır.
+    """
+    require_numpy()
+    counters = _batch_target(counters, instrumentation)
+
+    if arr.shape[0] == 0:
+        return
+
+    _quicksort_loop(arr, counters, 0, arr.shape[0] - 1, _partition_np)
+
+
+def _partition_np(arr, counters, low: int, high: int):
+    """
+    Vektörel partition: pivot'a <= olanlar (sıralarını koruyarak) sola,
+    büyükler sağa alınır, pivot araya yerleşir.
+
+    Sayaçlar Lomuto partition'ın yapacağı işlemlere göre hesaplanır:
+        - comparisons = high - low
+        - assignments = 3 * (gerçek swap sayısı) + 1 (pivot)
+          Lomuto, baştaki kesintisiz "<= pivot" önekinde i == j olduğu için
+          swap yapmaz; swap sayısı = k - önek_uzunluğu (+ pivot taşımaları).
+    """
+    pivot_index = random.randint(low, high)
+    swaps = 0
+    if pivot_index != high:
+        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+        swaps += 1
+    pivot = arr[high]
+
+    seg = arr[low:high]
+    mask = seg <= pivot
+    k = int(np.count_nonzero(mask))
+    prefix = k if k == mask.shape[0] else int(np.argmin(mask))
+    swaps += k - prefix
+    seg[:] = np.concatenate((seg[mask], seg[~mask]))
+
+    p = low + k
+    if p != high:
+        arr[high] = arr[p]
+        arr[p] = pivot
+        swaps += 1
+
+    if counters is not None:
+        counters.comparisons += high - low
+        counters.assignments += 3 * swaps + 1
+    return p
+
+
+# --------------------------------------------------
+# numpy.sort referansı
+# --------------------------------------------------
+def numpy_sort_times(base_arr, kinds=NUMPY_SORT_KINDS):
+    """
+    base_arr'ın kopyasını numpy.sort ile her 'kind' için bir kez sıralar.
+
+    Dönüş:
+        {kind: geçen_süre_saniye}
+    """
+    require_numpy()
+    base = np.asarray(base_arr, dtype=np.int64)
+
+    times = {}
+    for kind in kinds:
+        arr = base.copy()
+        start = time.perf_counter()
+        arr.sort(kind=kind)
+        end = time.perf_counter()
+        times[kind] = end - start
+    return times
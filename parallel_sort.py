@@ -0,0 +1,270 @@
+"""
+parallel_sort.py
+----------------
+MergeSort ve QuickSort'un çok süreçli (multi-process) Divide & Conquer sürümleri.
+
+Alt problemler birbirinden bağımsız olduğu için özyinelemenin ÜST seviyeleri
+bir süreç havuzuna (ProcessPoolExecutor) dağıtılır:
+
+- parallel_mergesort: dizi, mergesort'un kendi bölme kuralıyla (mid = len // 2)
+  2^d yaprak parçaya ayrılır. Yapraklar işçilerde sayaçlı seri kodla sıralanır,
+  ardından birleştirmeler seviye seviye yine paralel yapılır. Bölme ağacı aynı
+  olduğundan toplam sayaçlar seri "topdown" mergesort ile birebir aynıdır.
+- parallel_quicksort: üst seviyedeki partition'lar ana süreçte yapılır; yeterince
+  bağımsız aralık oluşunca her aralık bir işçide seri quicksort ile sıralanır.
+
+Dizi işçilere pickle ile GÖNDERİLMEZ: int64 elemanlar multiprocessing.shared_memory
+tamponuna bir kez yazılır, işçiler tampona adıyla bağlanıp yalnızca kendi
+aralıklarını okur/yazar. Bu yüzden elemanlar int64 sınırları içinde olmalıdır.
+
+cutoff'tan küçük girdiler (ve alt problemler) doğrudan seri sayaçlı kodla çalışır.
+Her işçinin sayaçları ana süreçte verilen Counters nesnesine toplanır.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from algorithms import (
+    Counters,
+    MERGESORT_ENGINES,
+    _batch_target,
+    _merge_fast,
+    _partition_fast,
+    _record_traffic,
+    merge,
+    partition,
+    quicksort,
+)
+
+# Bu boyutun altındaki alt problemler işçiye gönderilmez
+DEFAULT_CUTOFF = 20_000
+
+# QuickSort'ta işçi başına hedeflenen bağımsız aralık sayısı (yük dengesi için)
+TASKS_PER_WORKER = 4
+
+
+# --------------------------------------------------
+# Paylaşımlı bellek yardımcıları
+# --------------------------------------------------
+def _create_shared(values):
+    """values'ı int64 olarak yeni bir SharedMemory bloğuna yazar."""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(values)) * 8)
+    with shm.buf.cast("q") as buf:
+        buf[:len(values)] = array("q", values)
+    return shm
+
+
+def _read_shared(shm, n: int):
+    """SharedMemory bloğundaki ilk n int64 değeri liste olarak döner."""
+    with shm.buf.cast("q") as buf:
+        return buf[:n].tolist()
+
+
+def _release(*blocks):
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+
+# --------------------------------------------------
+# İşçi görevleri (modül seviyesinde -> pickle edilebilir)
+# --------------------------------------------------
+def _sort_range_task(name: str, lo: int, hi: int, algo: str, engine: str, instrumentation: str):
+    """
+    Paylaşımlı tamponun [lo, hi) aralığını seri sayaçlı kodla sıralar.
+
+    Dönüş:
+        _counter_fields(counters) demeti
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast("q") as buf:
+            seg = buf[lo:hi].tolist()
+            counters = Counters()
+            if algo == "MergeSort":
+                seg = MERGESORT_ENGINES[engine](seg, counters, instrumentation=instrumentation)
+            else:
+                quicksort(seg, counters, instrumentation=instrumentation)
+            buf[lo:hi] = array("q", seg)
+    finally:
+        shm.close()
+    return _counter_fields(counters)
+
+
+def _merge_task(src_name: str, dst_name: str, lo: int, mid: int, hi: int, instrumentation: str):
+    """
+    src[lo:mid] ve src[mid:hi] sıralı parçalarını dst[lo:hi] içine birleştirir.
+    Trafik seri mergesort'taki gibi birleştirme başına bir kez yazılır.
+
+    Dönüş:
+        _counter_fields(counters) demeti
+    """
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    try:
+        with src.buf.cast("q") as s_buf, dst.buf.cast("q") as d_buf:
+            left = s_buf[lo:mid].tolist()
+            right = s_buf[mid:hi].tolist()
+            counters = Counters()
+            target = counters if instrumentation == "counted" else _batch_target(counters, instrumentation)
+            _record_traffic(target, hi - lo, 2 * (hi - lo))
+            if instrumentation == "counted":
+                merged = merge(left, right, counters)
+            else:
+                merged = _merge_fast(left, right, target)
+            d_buf[lo:hi] = array("q", merged)
+    finally:
+        src.close()
+        dst.close()
+    return _counter_fields(counters)
+
+
+def _counter_fields(counters):
+    """İşçiden dönen sayaç demeti (Counters alan sırasıyla)."""
+    return (counters.comparisons, counters.assignments, counters.max_stack_depth,
+            counters.bytes_moved, counters.cache_misses, counters.bucket_ops)
+
+
+def _collect(futures, counters):
+    """
+    Görevleri bekler ve sayaçlarını counters'a ekler (None ise eklemez).
+    max_stack_depth toplanmaz; işçilerin en büyüğü alınır.
+    """
+    for future in futures:
+        comps, assigns, stack, moved, misses, buckets = future.result()
+        if counters is not None:
+            counters.comparisons += comps
+            counters.assignments += assigns
+            counters.max_stack_depth = max(counters.max_stack_depth, stack)
+            counters.bytes_moved += moved
+            counters.cache_misses += misses
+            counters.bucket_ops += buckets
+
+
+def _resolve_pool(executor, workers):
+    """
+    Dışarıdan havuz verilmişse onu, verilmemişse yeni bir havuz döner.
+    Dönüşteki ikinci değer, havuzun bu çağrıda kapatılıp kapatılmayacağıdır.
+    """
+    if executor is not None:
+        return executor, False
+    return ProcessPoolExecutor(max_workers=workers), True
+
+
+# --------------------------------------------------
+# Paralel MergeSort
+# --------------------------------------------------
+def parallel_mergesort(arr, counters: Counters, workers: int = None, cutoff: int = DEFAULT_CUTOFF,
+                       engine: str = "topdown", instrumentation: str = "counted", executor=None):
+    """
+    Çok süreçli MergeSort. mergesort gibi yeni bir sıralı liste döner.
+
+    Parametreler:
+        arr             : sıralanacak int listesi (değiştirilmez)
+        counters        : tüm işçilerin sayaçlarının toplanacağı Counters nesnesi
+        workers         : işçi sayısı (None -> os.cpu_count())
+        cutoff          : yaprak parça bu boyutun altına inmez; n <= cutoff ise
+                          tamamen seri çalışılır
+        engine          : yapraklarda kullanılacak MERGESORT_ENGINES motoru
+        instrumentation : "counted", "batched" veya "uncounted"
+        executor        : (opsiyonel) tekrar kullanılacak ProcessPoolExecutor
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers <= 1 or n <= cutoff:
+        return MERGESORT_ENGINES[engine](arr, counters, instrumentation=instrumentation)
+
+    sink = counters if instrumentation == "counted" else _batch_target(counters, instrumentation)
+
+    # Üst seviyeler: mergesort'un bölme kuralıyla tam ikili ağaç.
+    # levels[k] = k. seviyedeki (lo, hi) düğümleri; yapraklar en son seviyededir.
+    levels = [[(0, n)]]
+    while len(levels[-1]) < workers and (n >> len(levels)) >= cutoff:
+        levels.append([
+            part
+            for lo, hi in levels[-1]
+            for part in ((lo, lo + (hi - lo) // 2), (lo + (hi - lo) // 2, hi))
+        ])
+
+    src = _create_shared(arr)
+    dst = shared_memory.SharedMemory(create=True, size=max(1, n) * 8)
+    pool, owns_pool = _resolve_pool(executor, workers)
+    try:
+        # 1) Yaprak parçaları paralel sırala (src üzerinde yerinde)
+        _collect([
+            pool.submit(_sort_range_task, src.name, lo, hi, "MergeSort", engine, instrumentation)
+            for lo, hi in levels[-1]
+        ], sink)
+
+        # 2) İç düğümleri alttan üste, seviye seviye paralel birleştir (ping-pong)
+        for level in reversed(levels[:-1]):
+            _collect([
+                pool.submit(_merge_task, src.name, dst.name, lo, lo + (hi - lo) // 2, hi, instrumentation)
+                for lo, hi in level
+            ], sink)
+            src, dst = dst, src
+
+        return _read_shared(src, n)
+    finally:
+        if owns_pool:
+            pool.shutdown()
+        _release(src, dst)
+
+
+# --------------------------------------------------
+# Paralel QuickSort
+# --------------------------------------------------
+def parallel_quicksort(arr, counters: Counters, workers: int = None, cutoff: int = DEFAULT_CUTOFF,
+                       instrumentation: str = "counted", executor=None):
+    """
+    Çok süreçli, in-place QuickSort.
+
+    Ana süreç en büyük aralığı tekrar tekrar partition eder; işçi başına
+    TASKS_PER_WORKER bağımsız aralık oluşunca (ya da en büyük aralık cutoff'un
+    altına inince) aralıklar işçilerde seri quicksort ile sıralanır.
+
+    Parametreler quicksort ve parallel_mergesort ile aynı anlamdadır.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers <= 1 or n <= cutoff:
+        quicksort(arr, counters, instrumentation=instrumentation)
+        return
+
+    if instrumentation == "counted":
+        partition_fn, sink = partition, counters
+    else:
+        partition_fn, sink = _partition_fast, _batch_target(counters, instrumentation)
+
+    # 1) Üst seviye partition'lar (ana süreçte); aralıklar kapalı [l, h]
+    pending = [(0, n - 1)]
+    ready = []
+    while pending and len(pending) + len(ready) < workers * TASKS_PER_WORKER:
+        pending.sort(key=lambda r: r[1] - r[0])
+        l, h = pending.pop()
+        if h - l + 1 <= cutoff:
+            ready.append((l, h))
+            continue
+        p = partition_fn(arr, sink, l, h)
+        _record_traffic(sink, h - l + 1, h - l + 1)   # seri quicksort'taki partition trafiği
+        if p - 1 > l:
+            pending.append((l, p - 1))
+        if p + 1 < h:
+            pending.append((p + 1, h))
+    ready.extend(pending)
+
+    # 2) Bağımsız aralıkları paralel sırala
+    shm = _create_shared(arr)
+    pool, owns_pool = _resolve_pool(executor, workers)
+    try:
+        _collect([
+            pool.submit(_sort_range_task, shm.name, l, h + 1, "QuickSort", "topdown", instrumentation)
+            for l, h in ready
+        ], sink)
+        arr[:] = _read_shared(shm, n)
+    finally:
+        if owns_pool:
+            pool.shutdown()
+        _release(shm)
@@ -0,0 +1,261 @@
+"""
+powermetrics.py
+---------------
+macOS `powermetrics` çıktısını (örn. powermetrics_log.txt) akışlı okuyan ayrıştırıcı.
+
+Kayıt şöyle alınır (benchmark ile aynı anda, ayrı bir terminalde):
+    sudo powermetrics --samplers cpu_power -i 100 > powermetrics_log.txt
+
+Çıktı:
+    - iter_samples(path)     : örnekleri tek tek üretir (sabit bellek)
+    - PowerSeries.from_log() : örnekleri sütunlu (columnar) zaman serisine
+                               toplar; her sütun array('d') olduğundan örnek
+                               başına yalnızca birkaç sayı kadar yer tutar
+    - integrate_windows()    : benchmark koşu pencerelerinde (başlangıç/bitiş
+                               duvar saati) gücü zamana göre integre eder ->
+                               pencere ve algoritma başına Joule tahmini
+
+Zaman damgaları: başlıktaki saat yalnızca saniye çözünürlüklüdür, bu yüzden
+örnek bitişleri başlıktaki "(... ms elapsed)" süreleri toplanarak bulunur;
+kayıtta boşluk olursa (başlık saati birikmiş zamanın 1 sn'den fazla ilerisinde)
+yeniden başlık saatine hizalanır. Her örneğin gücü kendi
+[bitiş - elapsed, bitiş] aralığında sabit kabul edilir.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Örnek başlığı: *** Sampled system activity (Thu Dec 18 15:26:10 2025 +0300) (109.17ms elapsed) ***
+_SAMPLE_RE = re.compile(r"\*\*\* Sampled system activity \((.+?)\) \(([\d.]+)ms elapsed\) \*\*\*")
+_CPU_FREQ_RE = re.compile(r"CPU (\d+) frequency: ([\d.]+) MHz")
+_CPU_ACTIVE_RE = re.compile(r"CPU (\d+) active residency:\s+([\d.]+)%")
+_CLUSTER_FREQ_RE = re.compile(r"(\S+)-Cluster HW active frequency: ([\d.]+) MHz")
+_CLUSTER_ACTIVE_RE = re.compile(r"(\S+)-Cluster HW active residency:\s+([\d.]+)%")
+_POWER_RE = re.compile(r"(CPU|GPU|ANE|Combined) Power.*?: ([\d.]+) mW")
+
+_TIME_FORMAT = "%a %b %d %H:%M:%S %Y %z"
+
+# Örnek başına güç alanları (Watt) ve PowerSeries sütun adları
+POWER_FIELDS = ("cpu_power", "gpu_power", "ane_power", "combined_power")
+
+# Başlık saati birikmiş zamandan bu kadar (sn) ilerideyse kayıtta boşluk var sayılır
+_RESYNC_SECONDS = 1.0
+
+
+@dataclass
+class PowerSample:
+    """Tek bir powermetrics örneği (güçler Watt, frekanslar MHz, residency %)."""
+    start: float                      # Unix zamanı (sn)
+    end: float
+    cpu_power: float = None
+    gpu_power: float = None
+    ane_power: float = None
+    combined_power: float = None
+    cpu_freq: dict = field(default_factory=dict)          # {cpu: MHz}
+    cpu_active: dict = field(default_factory=dict)        # {cpu: %}
+    cluster_freq: dict = field(default_factory=dict)      # {"E" / "P": MHz}
+    cluster_active: dict = field(default_factory=dict)    # {"E" / "P": %}
+
+
+def iter_samples(path):
+    """
+    powermetrics kaydındaki örnekleri sırayla üretir. Dosya satır satır
+    okunur; bellekte aynı anda yalnızca bir örnek bulunur.
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        sample = None
+        last_end = None
+        last_header = header_time = None
+        for line in f:
+            if line.startswith("***"):
+                match = _SAMPLE_RE.match(line)
+                if match is None:
+                    continue
+                if sample is not None:
+                    yield sample
+                elapsed = float(match.group(2)) / 1000.0
+                if match.group(1) != last_header:
+                    # Saniyede ~10 örnek aynı başlık saatini taşır; strptime'ı tekrar çağırma
+                    last_header = match.group(1)
+                    header_time = datetime.strptime(last_header, _TIME_FORMAT).timestamp()
+                if last_end is None or header_time > last_end + elapsed + _RESYNC_SECONDS:
+                    end = header_time
+                else:
+                    end = last_end + elapsed
+                sample = PowerSample(start=end - elapsed, end=end)
+                last_end = end
+                continue
+            if sample is not None:
+                _parse_line(sample, line)
+        if sample is not None:
+            yield sample
+
+
+def _parse_line(sample: PowerSample, line: str):
+    """Bir örneğin gövde satırını sample alanlarına işler; ilgisiz satırları atlar."""
+    if line.startswith("CPU "):
+        match = _CPU_FREQ_RE.match(line)
+        if match:
+            sample.cpu_freq[int(match.group(1))] = float(match.group(2))
+            return
+        match = _CPU_ACTIVE_RE.match(line)
+        if match:
+            sample.cpu_active[int(match.group(1))] = float(match.group(2))
+            return
+    elif "-Cluster HW active" in line:
+        match = _CLUSTER_FREQ_RE.match(line)
+        if match:
+            sample.cluster_freq[match.group(1)] = float(match.group(2))
+            return
+        match = _CLUSTER_ACTIVE_RE.match(line)
+        if match:
+            sample.cluster_active[match.group(1)] = float(match.group(2))
+            return
+
+    match = _POWER_RE.match(line)
+    if match:
+        setattr(sample, f"{match.group(1).lower()}_power", float(match.group(2)) / 1000.0)
+
+
+# --------------------------------------------------
+# Sütunlu zaman serisi
+# --------------------------------------------------
+@dataclass
+class PowerSeries:
+    """
+    powermetrics örneklerinin sütunlu gösterimi. Tüm sütunlar aynı uzunlukta
+    array('d')'dir; eksik değerler NaN olarak tutulur.
+    """
+    start: array = field(default_factory=lambda: array("d"))
+    end: array = field(default_factory=lambda: array("d"))
+    power: dict = field(default_factory=dict)            # {alan: array} (Watt)
+    cpu_freq: dict = field(default_factory=dict)         # {cpu: array} (MHz)
+    cpu_active: dict = field(default_factory=dict)       # {cpu: array} (%)
+    cluster_freq: dict = field(default_factory=dict)
+    cluster_active: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_log(cls, path, per_cpu: bool = True):
+        """
+        Kaydı akışlı okuyup seriyi kurar. per_cpu=False ise yalnızca zaman ve güç
+        sütunları tutulur (çok büyük kayıtlarda belleği en aza indirmek için).
+        """
+        series = cls()
+        for sample in iter_samples(path):
+            series.append(sample, per_cpu)
+        return series
+
+    def __len__(self):
+        return len(self.start)
+
+    def append(self, sample: PowerSample, per_cpu: bool = True):
+        """Bir örneği sütunların sonuna ekler."""
+        index = len(self.start)
+        self.start.append(sample.start)
+        self.end.append(sample.end)
+        for name in POWER_FIELDS:
+            value = getattr(sample, name)
+            _column(self.power, name, index).append(float("nan") if value is None else value)
+        if per_cpu:
+            for target, values in ((self.cpu_freq, sample.cpu_freq), (self.cpu_active, sample.cpu_active),
+                                   (self.cluster_freq, sample.cluster_freq),
+                                   (self.cluster_active, sample.cluster_active)):
+                for key, value in values.items():
+                    _column(target, key, index).append(value)
+                _pad_columns(target, index + 1)
+
+    def energy(self, column: str = "cpu_power") -> float:
+        """Tüm kayıt boyunca integre edilmiş enerji (J)."""
+        return sum(p * (e - s) for s, e, p in zip(self.start, self.end, self.power[column]) if p == p)
+
+
+def _column(columns: dict, key, length: int):
+    """key sütununu döner; yoksa önceki satırlar NaN olacak şekilde oluşturur."""
+    if key not in columns:
+        columns[key] = array("d", [float("nan")]) * length
+    return columns[key]
+
+
+def _pad_columns(columns: dict, length: int):
+    """Bu örnekte görünmeyen sütunları NaN ile length uzunluğuna tamamlar."""
+    for values in columns.values():
+        if len(values) < length:
+            values.append(float("nan"))
+
+
+# --------------------------------------------------
+# Koşu pencereleriyle hizalama ve integrasyon
+# --------------------------------------------------
+def integrate_windows(series: PowerSeries, windows, column: str = "cpu_power"):
+    """
+    Her pencere için [start, end] aralığında gücü zamana göre integre eder.
+
+    Parametreler:
+        series : PowerSeries
+        windows: "start" ve "end" (Unix zamanı, sn) anahtarlı sözlükler; örn.
+                 benchmark.run_single_experiment(..., run_windows=[...]) kayıtları
+        column : kullanılacak güç sütunu (POWER_FIELDS)
+
+    Dönüş:
+        Pencere sözlüklerinin kopyaları; "joule" (ölçüm yoksa None) ve
+        "coverage" (pencerenin örneklerle kaplanan oranı) alanları eklenmiş.
+    """
+    power = series.power.get(column, array("d"))
+    results = []
+    for window in windows:
+        lo, hi = window["start"], window["end"]
+        joules = 0.0
+        covered = 0.0
+        # Bitişi lo'dan büyük ilk örnekten başla (end sütunu artan sıralı)
+        i = bisect_right(series.end, lo)
+        while i < len(series.start) and series.start[i] < hi:
+            overlap = min(hi, series.end[i]) - max(lo, series.start[i])
+            if overlap > 0 and power[i] == power[i]:   # NaN değilse
+                joules += power[i] * overlap
+                covered += overlap
+            i += 1
+        duration = hi - lo
+        results.append({
+            **window,
+            "joule": joules if covered > 0 else None,
+            "coverage": covered / duration if duration > 0 else 0.0,
+        })
+    return results
+
+
+def energy_by_algorithm(series: PowerSeries, windows, column: str = "cpu_power"):
+    """
+    integrate_windows sonuçlarını (algo, n, mode) başına toplar.
+
+    Dönüş:
+        {(algo, n, mode): {"joule": toplam, "runs": pencere_sayısı, "avg_joule": ortalama}}
+    """
+    totals = {}
+    for res in integrate_windows(series, windows, column):
+        if res["joule"] is None:
+            continue
+        key = (res.get("algo"), res.get("n"), res.get("mode"))
+        acc = totals.setdefault(key, {"joule": 0.0, "runs": 0})
+        acc["joule"] += res["joule"]
+        acc["runs"] += 1
+    for acc in totals.values():
+        acc["avg_joule"] = acc["joule"] / acc["runs"]
+    return totals
+
+
+if __name__ == "__main__":
+    import sys
+
+    log_path = sys.argv[1] if len(sys.argv) > 1 else "powermetrics_log.txt"
+    series = PowerSeries.from_log(log_path)
+    if not len(series):
+        print(f"{log_path}: örnek bulunamadı")
+        sys.exit(1)
+    duration = series.end[-1] - series.start[0]
+    print(f"{log_path}: {len(series)} örnek, {duration:.2f} sn, CPU'lar: {sorted(series.cpu_freq)}")
+    for name in POWER_FIELDS:
+        energy = series.energy(name)
+        print(f"  {name:15s}: {energy:8.3f} J  (ortalama {energy / duration:.3f} W)")
@@ -0,0 +1,353 @@
+"""
+profiling.py
+------------
+Opsiyonel profil katmanı: toplam comparisons / assignments sayılarının
+ötesinde sürenin NEREDE geçtiğini gösterir.
+
+Bir profil koşusu şunları kaydeder:
+    - faz zamanlayıcıları : MergeSort'ta "split" (dilimleme), "merge" (birleştirme
+                            döngüsü), "copy" (eşsiz run kopyası), "runs" (natural
+                            run tespiti); QuickSort'ta "pivot" (pivot seçimi),
+                            "partition" (bölme taraması), "insertion", "heapsort".
+                            Kalan süre "overhead" fazına yazılır (özyineleme /
+                            yığın yönetimi / çağrı maliyeti).
+    - derinlik istatistikleri: özyineleme derinliği başına çağrı sayısı,
+                            comparisons, assignments ve o derinlikte geçen süre
+                            (bottom-up motorlarda derinlik = ağaçtaki birleştirme
+                            seviyesi; en son geçiş 0)
+    - bellek              : ayrı bir tracemalloc koşusunda tepe bellek (peak) ile
+                            koşu sonunda hâlâ ayrılmış bayt ve blok sayısı
+
+Profil ayrı fonksiyonlarla (algorithms.py'deki sayaçlı yardımcıları çağırarak)
+yapılır; normal ölçüm yolları hiç değişmez, yani profil kapalıyken ek maliyet
+yoktur. tracemalloc süreleri bozduğu için bellek ölçümü zamanlanan koşudan ayrı,
+aynı girdi ve aynı rastgele tohumla yapılan ikinci bir koşudur.
+
+Sonuçlar SortProfile.records() ile düz sözlük kayıtlarına çevrilir
+(benchmark.export_records ile CSV / JSONL olarak yazılır, gui_app.py grafikler).
+"""
+
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from algorithms import (
+    Counters,
+    QuickSortConfig,
+    PIVOT_STRATEGIES,
+    PARTITION_SCHEMES,
+    _find_ascending_runs,
+    _merge_into,
+    _choose_pivot,
+    _lomuto,
+    _hoare,
+    _three_way,
+    insertion_sort,
+    heapsort,
+    merge,
+)
+
+MERGESORT_PHASES = ("split", "merge", "copy", "runs", "overhead")
+QUICKSORT_PHASES = ("pivot", "partition", "insertion", "heapsort", "overhead")
+
+# Faz profili çıkarılabilen MergeSort motorları (kway / blocked profillenmez)
+PROFILED_MERGE_ENGINES = ("topdown", "bottomup", "natural")
+
+
+# --------------------------------------------------
+# Profil kayıt yapıları
+# --------------------------------------------------
+@dataclass
+class DepthStats:
+    """Bir özyineleme derinliğindeki toplamlar."""
+    calls: int = 0
+    comparisons: int = 0
+    assignments: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class SortProfile:
+    """Tek bir profil koşusunun sonucu."""
+    algo: str
+    n: int
+    mode: str
+    variant: str = None
+    total_s: float = 0.0
+    comparisons: int = 0
+    assignments: int = 0
+    phases: dict = field(default_factory=dict)     # {faz: sn}
+    depths: dict = field(default_factory=dict)     # {derinlik: DepthStats}
+    peak_bytes: int = None                         # tracemalloc tepe değeri (koşu başına göre)
+    net_bytes: int = None                          # koşu sonunda hâlâ ayrılmış bayt
+    net_blocks: int = None                         # koşu sonunda hâlâ ayrılmış blok (nesne) sayısı
+
+    def add_phase(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def depth(self, level: int) -> DepthStats:
+        stats = self.depths.get(level)
+        if stats is None:
+            stats = self.depths[level] = DepthStats()
+        return stats
+
+    def records(self):
+        """
+        Düz kayıtlar: bir "run" satırı, faz başına bir "phase" satırı ve
+        derinlik başına bir "depth" satırı. Her satırda algo, n, mode, variant bulunur.
+        """
+        base = {"algo": self.algo, "n": self.n, "mode": self.mode, "variant": self.variant}
+        rows = [{
+            **base, "kind": "run", "seconds": self.total_s,
+            "comparisons": self.comparisons, "assignments": self.assignments,
+            "peak_bytes": self.peak_bytes, "net_bytes": self.net_bytes, "net_blocks": self.net_blocks,
+        }]
+        for name, seconds in self.phases.items():
+            rows.append({**base, "kind": "phase", "phase": name, "seconds": seconds,
+                         "share": seconds / self.total_s if self.total_s else None})
+        for level in sorted(self.depths):
+            stats = self.depths[level]
+            rows.append({**base, "kind": "depth", "depth": level, "calls": stats.calls,
+                         "comparisons": stats.comparisons, "assignments": stats.assignments,
+                         "seconds": stats.seconds})
+        return rows
+
+
+def _finish(profile: SortProfile, counters: Counters, total: float, phases):
+    """Toplamları yazar; fazların kapsamadığı süreyi "overhead"e koyar, faz sırasını sabitler."""
+    profile.total_s = total
+    profile.comparisons = counters.comparisons
+    profile.assignments = counters.assignments
+    profile.phases["overhead"] = max(0.0, total - sum(profile.phases.values()))
+    profile.phases = {name: profile.phases[name] for name in phases if name in profile.phases}
+
+
+# --------------------------------------------------
+# MergeSort profili
+# --------------------------------------------------
+def _profile_topdown(arr, counters: Counters, profile: SortProfile, level: int = 0):
+    """mergesort (counted) ile aynı işi yapar; dilimleme ve merge sürelerini ayrı ölçer."""
+    stats = profile.depth(level)
+    stats.calls += 1
+    if len(arr) <= 1:
+        return arr
+
+    perf = time.perf_counter
+    t0 = perf()
+    mid = len(arr) // 2
+    left_part, right_part = arr[:mid], arr[mid:]
+    t1 = perf()
+    left = _profile_topdown(left_part, counters, profile, level + 1)
+    right = _profile_topdown(right_part, counters, profile, level + 1)
+    comps, assigns = counters.comparisons, counters.assignments
+    t2 = perf()
+    merged = merge(left, right, counters)
+    t3 = perf()
+
+    stats.comparisons += counters.comparisons - comps
+    stats.assignments += counters.assignments - assigns
+    stats.seconds += (t1 - t0) + (t3 - t2)
+    profile.add_phase("split", t1 - t0)
+    profile.add_phase("merge", t3 - t2)
+    return merged
+
+
+def _profile_step(src, dst, lo: int, mid: int, hi: int, counters: Counters, profile: SortProfile,
+                  stats: DepthStats):
+    """Bottom-up geçişinin tek adımı: src[lo:mid] + src[mid:hi] birleştirmesi ya da eşsiz parça kopyası."""
+    comps, assigns = counters.comparisons, counters.assignments
+    t0 = time.perf_counter()
+    if mid < hi:
+        _merge_into(src, dst, lo, mid, hi, counters)
+        phase = "merge"
+    else:
+        dst[lo:hi] = src[lo:hi]
+        counters.assignments += hi - lo
+        phase = "copy"
+    elapsed = time.perf_counter() - t0
+    profile.add_phase(phase, elapsed)
+    stats.calls += 1
+    stats.comparisons += counters.comparisons - comps
+    stats.assignments += counters.assignments - assigns
+    stats.seconds += elapsed
+
+
+def _profile_bottom_up(arr, counters: Counters, profile: SortProfile, natural_runs: bool):
+    """
+    mergesort_bottom_up (counted) ile aynı iş; geçiş (pass) başına istatistik tutar.
+    Natural run tespitinin karşılaştırmaları yalnızca toplama ve "runs" fazına girer.
+    """
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    src = list(arr)
+    dst = [0] * n
+    passes = []   # geçiş başına DepthStats (sonradan derinliğe çevrilir)
+
+    if natural_runs:
+        t0 = time.perf_counter()
+        bounds = _find_ascending_runs(src, counters)
+        profile.add_phase("runs", time.perf_counter() - t0)
+        while len(bounds) > 2:
+            stats = DepthStats()
+            passes.append(stats)
+            new_bounds = [0]
+            for k in range(0, len(bounds) - 1, 2):
+                lo, mid = bounds[k], bounds[k + 1]
+                hi = bounds[k + 2] if k + 2 < len(bounds) else mid
+                _profile_step(src, dst, lo, mid, hi, counters, profile, stats)
+                new_bounds.append(hi)
+            src, dst = dst, src
+            bounds = new_bounds
+    else:
+        width = 1
+        while width < n:
+            stats = DepthStats()
+            passes.append(stats)
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                _profile_step(src, dst, lo, mid, min(lo + 2 * width, n), counters, profile, stats)
+            src, dst = dst, src
+            width *= 2
+
+    # Son geçiş ağacın kökü (derinlik 0)
+    for index, stats in enumerate(passes):
+        profile.depths[len(passes) - 1 - index] = stats
+    return src
+
+
+def profile_mergesort(arr, mode: str = "", engine: str = "topdown") -> SortProfile:
+    """
+    arr'ın kopyasını profil altında MergeSort ile sıralar.
+    engine: PROFILED_MERGE_ENGINES'tan biri ("topdown", "bottomup" veya "natural").
+    """
+    if engine not in PROFILED_MERGE_ENGINES:
+        raise ValueError(f"Bilinmeyen merge_engine: {engine}")
+    profile = SortProfile("MergeSort", len(arr), mode, variant=engine)
+    counters = Counters()
+    data = list(arr)
+    start = time.perf_counter()
+    if engine == "topdown":
+        _profile_topdown(data, counters, profile)
+    else:
+        _profile_bottom_up(data, counters, profile, natural_runs=engine == "natural")
+    _finish(profile, counters, time.perf_counter() - start, MERGESORT_PHASES)
+    return profile
+
+
+# --------------------------------------------------
+# QuickSort profili
+# --------------------------------------------------
+def profile_quicksort(arr, mode: str = "", config: QuickSortConfig = None) -> SortProfile:
+    """
+    arr'ın kopyasını profil altında QuickSort ile sıralar (varsayılan ayar:
+    rastgele pivot + Lomuto, partition() ile aynı bölme ve aynı sayaçlar).
+    Pivot seçimi ve bölme taraması ayrı fazlara yazılır; derinlik, aralığın
+    özyineleme ağacındaki derinliğidir.
+    """
+    config = config or QuickSortConfig()
+    if config.pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"Bilinmeyen pivot stratejisi: {config.pivot}")
+    if config.scheme not in PARTITION_SCHEMES:
+        raise ValueError(f"Bilinmeyen partition şeması: {config.scheme}")
+
+    profile = SortProfile("QuickSort", len(arr), mode, variant=config.label())
+    counters = Counters()
+    data = list(arr)
+    perf = time.perf_counter
+    scheme_fn = {"lomuto": _lomuto, "hoare": _hoare, "3way": _three_way}[config.scheme]
+    cutoff = config.insertion_cutoff
+    depth_limit = 2 * max(1, len(data).bit_length()) if config.introsort else None
+
+    start = perf()
+    stack = [(0, len(data) - 1, 0)] if data else []
+    while stack:
+        l, h, level = stack.pop()
+        stats = profile.depth(level)
+        stats.calls += 1
+        comps, assigns = counters.comparisons, counters.assignments
+        t0 = perf()
+        if h - l + 1 <= cutoff:
+            insertion_sort(data, counters, l, h)
+            phase_seconds = perf() - t0
+            profile.add_phase("insertion", phase_seconds)
+        elif l < h and depth_limit is not None and level > depth_limit:
+            heapsort(data, counters, l, h)
+            phase_seconds = perf() - t0
+            profile.add_phase("heapsort", phase_seconds)
+        elif l < h:
+            pivot_index = _choose_pivot(data, counters, l, h, config.pivot)
+            t1 = perf()
+            left_hi, right_lo = scheme_fn(data, counters, l, h, pivot_index)
+            t2 = perf()
+            profile.add_phase("pivot", t1 - t0)
+            profile.add_phase("partition", t2 - t1)
+            phase_seconds = t2 - t0
+            # Küçük taraf önce işlensin diye büyük taraf yığına önce itilir
+            children = sorted(((l, left_hi), (right_lo, h)), key=lambda r: r[1] - r[0], reverse=True)
+            for lo, hi in children:
+                if lo < hi:
+                    stack.append((lo, hi, level + 1))
+        else:
+            phase_seconds = 0.0
+        stats.comparisons += counters.comparisons - comps
+        stats.assignments += counters.assignments - assigns
+        stats.seconds += phase_seconds
+
+    _finish(profile, counters, perf() - start, QUICKSORT_PHASES)
+    return profile
+
+
+# --------------------------------------------------
+# Bellek ölçümü
+# --------------------------------------------------
+def measure_memory(profile_fn, arr, *args, **kwargs):
+    """
+    profile_fn(arr, ...) çağrısını tracemalloc altında tekrar çalıştırır.
+
+    Dönüş:
+        (peak_bytes, net_bytes, net_blocks) — peak koşu başındaki seviyeye göre;
+        net değerler koşu sonunda hâlâ ayrılmış (profil nesnesi dahil) bellek.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        kept = profile_fn(arr, *args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    net_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return peak - base_current, current - base_current, net_blocks
+
+
+def profile_run(algo: str, arr, mode: str = "", seed: int = None, trace_memory: bool = True,
+                merge_engine: str = "topdown", config: QuickSortConfig = None) -> SortProfile:
+    """
+    Tek bir profil koşusu (algo: "MergeSort" veya "QuickSort").
+    seed verilirse QuickSort'un rastgele pivotları her iki koşuda (zaman ve bellek)
+    aynı tohumla üretilir. trace_memory=False ise bellek alanları None kalır.
+    """
+    if algo == "MergeSort":
+        fn, options = profile_mergesort, {"mode": mode, "engine": merge_engine}
+    elif algo == "QuickSort":
+        fn, options = profile_quicksort, {"mode": mode, "config": config}
+    else:
+        raise ValueError(f"Bilinmeyen algoritma: {algo}")
+
+    if seed is not None:
+        random.seed(seed)
+    profile = fn(arr, **options)
+    if trace_memory:
+        if seed is not None:
+            random.seed(seed)
+        profile.peak_bytes, profile.net_bytes, profile.net_blocks = measure_memory(fn, arr, **options)
+    return profile
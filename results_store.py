@@ -0,0 +1,232 @@
+"""
+results_store.py
+----------------
+Benchmark sonuçları için kalıcı SQLite deposu.
+
+Her satır şu anahtarla saklanır:
+    (variant, n, mode, seed, code_hash, machine)
+      - variant  : "MergeSort/topdown/counted/list" gibi algoritma + ayar etiketi
+      - code_hash: algoritma ve ölçüm kaynak dosyalarının (CODE_FILES) sha256 özeti
+      - machine  : makine parmak izi (işlemci, çekirdek sayısı, Python sürümü)
+
+Böylece:
+    - aynı kod sürümünde daha önce ölçülmüş hücreler tekrar koşulmaz
+      (benchmark.run_all_experiments(store=...)),
+    - iki kod sürümü karşılaştırılıp süre ve energy_proxy'deki istatistiksel
+      olarak anlamlı gerilemeler (regression) işaretlenir (compare()).
+
+Komut satırı:
+    python results_store.py list
+    python results_store.py compare <baseline_hash> [<candidate_hash>]
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import time
+
+from stats import welch_t_test
+
+DEFAULT_DB_PATH = "results.sqlite"
+
+# Hash'e giren kaynaklar: algoritma davranışını ya da ölçümü (measure_sort,
+# summarize_results / energy_proxy formülü, enerji ölçerler) değiştiren dosyalar
+CODE_FILES = ("algorithms.py", "numpy_backend.py", "parallel_sort.py", "workloads.py",
+              "benchmark.py", "energy_meters.py")
+
+# compare() varsayılanları: metrik -> tekrar başına örnek alanı
+COMPARE_METRICS = {
+    "avg_time_ms": "time_samples_ms",
+    "energy_proxy": "proxy_samples",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    variant    TEXT    NOT NULL,
+    n          INTEGER NOT NULL,
+    mode       TEXT    NOT NULL,
+    seed       INTEGER NOT NULL,
+    code_hash  TEXT    NOT NULL,
+    machine    TEXT    NOT NULL,
+    algo       TEXT    NOT NULL,
+    created_at REAL    NOT NULL,
+    result     TEXT    NOT NULL,
+    PRIMARY KEY (variant, n, mode, seed, code_hash, machine)
+)
+"""
+
+
+def code_hash(files=CODE_FILES, root: str = None) -> str:
+    """Kaynak dosyaların içeriğinden kısa (12 karakter) sha256 özeti."""
+    root = root or os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in files:
+        path = os.path.join(root, name)
+        if os.path.exists(path):
+            digest.update(name.encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def machine_fingerprint() -> str:
+    """İşlemci modeli, çekirdek sayısı ve Python sürümünden kısa makine kimliği."""
+    cpu_model = platform.processor()
+    if os.path.exists("/proc/cpuinfo"):
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    cpu_model = line.split(":", 1)[1].strip()
+                    break
+    text = "|".join((platform.system(), platform.machine(), cpu_model, str(os.cpu_count()),
+                     platform.python_implementation(), platform.python_version()))
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def variant_key(algo: str, impl: str, instrumentation: str = "counted", backend: str = "list") -> str:
+    """Algoritma ve ayarlarından depo anahtarındaki variant etiketini üretir."""
+    return f"{algo}/{impl}/{instrumentation}/{backend}"
+
+
+def result_variant(res: dict) -> str:
+    """Sonuç sözlüğünün variant etiketi (MergeSort -> engine, QuickSort / TimSort -> variant)."""
+    impl = res.get("engine") if res["algo"] == "MergeSort" else res.get("variant")
+    return variant_key(res["algo"], impl, res.get("instrumentation", "counted"), res.get("backend", "list"))
+
+
+class ResultStore:
+    """
+    SQLite sonuç deposu.
+
+    Kullanım:
+        with ResultStore() as store:
+            store.put(res, seed=0)
+            cached = store.get(variant, n, mode, seed=0)
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, code: str = None, machine: str = None):
+        self.path = path
+        self.code = code or code_hash()
+        self.machine = machine or machine_fingerprint()
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def put(self, res: dict, seed: int):
+        """Sonucu geçerli kod sürümü ve makine için kaydeder (varsa üzerine yazar)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (result_variant(res), res["n"], res["mode"], seed, self.code, self.machine,
+             res["algo"], time.time(), json.dumps(res)),
+        )
+        self._conn.commit()
+
+    def get(self, variant: str, n: int, mode: str, seed: int, code: str = None):
+        """Kayıtlı sonucu döner; yoksa None."""
+        row = self._conn.execute(
+            "SELECT result FROM results WHERE variant=? AND n=? AND mode=? AND seed=? "
+            "AND code_hash=? AND machine=?",
+            (variant, n, mode, seed, code or self.code, self.machine),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def rows(self, code: str = None):
+        """Bir kod sürümünün bu makinedeki tüm sonuçları: {(variant, n, mode, seed): sonuç}."""
+        cursor = self._conn.execute(
+            "SELECT variant, n, mode, seed, result FROM results WHERE code_hash=? AND machine=?",
+            (code or self.code, self.machine),
+        )
+        return {(v, n, m, s): json.loads(r) for v, n, m, s, r in cursor}
+
+    def code_versions(self):
+        """Bu makinedeki kod sürümleri: [(code_hash, ilk_kayıt_zamanı, satır_sayısı)], eskiden yeniye."""
+        return self._conn.execute(
+            "SELECT code_hash, MIN(created_at), COUNT(*) FROM results WHERE machine=? "
+            "GROUP BY code_hash ORDER BY MIN(created_at)",
+            (self.machine,),
+        ).fetchall()
+
+    def compare(self, baseline: str, candidate: str = None, metrics=COMPARE_METRICS,
+                confidence: float = 0.95, min_change: float = 0.02):
+        """
+        İki kod sürümünün ortak hücrelerini karşılaştırır.
+
+        Her metrik için tekrar başına örneklerle Welch t testi yapılır. Bir satır
+        "regression" sayılır: fark anlamlıysa, candidate daha kötüyse (büyükse)
+        ve göreli değişim min_change'den büyükse.
+
+        Dönüş:
+            [{"variant", "n", "mode", "seed", "metric", "baseline", "candidate",
+              "change", "t", "significant", "regression"}, ...]
+        """
+        base_rows = self.rows(baseline)
+        cand_rows = self.rows(candidate)
+        report = []
+        for key in sorted(set(base_rows) & set(cand_rows)):
+            base, cand = base_rows[key], cand_rows[key]
+            for metric, samples_key in metrics.items():
+                b_val, c_val = base.get(metric), cand.get(metric)
+                if b_val is None or c_val is None:
+                    continue
+                t, _, significant = welch_t_test(base.get(samples_key) or [], cand.get(samples_key) or [],
+                                                 confidence)
+                change = (c_val - b_val) / b_val if b_val else 0.0
+                report.append({
+                    "variant": key[0], "n": key[1], "mode": key[2], "seed": key[3],
+                    "metric": metric, "baseline": b_val, "candidate": c_val, "change": change,
+                    "t": t, "significant": significant,
+                    "regression": significant and change > min_change,
+                })
+        return report
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_comparison(report):
+    """compare() çıktısını tablo olarak yazar; gerilemeler "REGRESSION" ile işaretlenir."""
+    header = f"{'variant':<40} {'n':>8} {'mode':>10} {'metric':>13} {'baseline':>14} {'candidate':>14} {'change':>8}"
+    print(header)
+    print("-" * (len(header) + 12))
+    for row in report:
+        flag = "REGRESSION" if row["regression"] else ("anlamlı" if row["significant"] else "")
+        print(f"{row['variant']:<40} {row['n']:>8} {row['mode']:>10} {row['metric']:>13} "
+              f"{row['baseline']:>14.3f} {row['candidate']:>14.3f} {row['change']:>+8.1%} {flag}")
+    regressions = sum(row["regression"] for row in report)
+    print(f"\n{len(report)} karşılaştırma, {regressions} gerileme.")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Benchmark sonuç deposu")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite dosyası")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="bu makinedeki kod sürümlerini listele")
+    cmp_parser = sub.add_parser("compare", help="iki kod sürümünü karşılaştır")
+    cmp_parser.add_argument("baseline", help="temel kod özeti (code_hash)")
+    cmp_parser.add_argument("candidate", nargs="?", help="karşılaştırılan özet (varsayılan: mevcut kod)")
+    cmp_parser.add_argument("--confidence", type=float, default=0.95)
+    cmp_parser.add_argument("--min-change", type=float, default=0.02, help="gerileme için en küçük göreli artış")
+    args = parser.parse_args()
+
+    with ResultStore(args.db) as store:
+        if args.command == "list":
+            print(f"Mevcut kod: {store.code}  makine: {store.machine}")
+            for code, created_at, count in store.code_versions():
+                stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(created_at))
+                print(f"  {code}  {stamp}  {count} sonuç")
+        else:
+            report = store.compare(args.baseline, args.candidate, confidence=args.confidence,
+                                   min_change=args.min_change)
+            print_comparison(report)
+            sys.exit(1 if any(row["regression"] for row in report) else 0)
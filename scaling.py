@@ -0,0 +1,240 @@
+"""
+scaling.py
+----------
+Asimptotik ölçekleme taraması ve karmaşıklık eğrisi uydurma.
+
+- geometric_sizes   : 10^2 .. 10^8 arası geometrik boyutlar (on katta 'per_decade' adım)
+- run_scaling_sweep : her algoritmayı artan n'lerde koşar; bir hücrenin (tekrarların toplam)
+                      sıralama süresi cell_budget saniyeyi aşınca (tekrar başına kontrol)
+                      o algoritmanın serisi durur
+- fit_complexity    : süre / comparisons / assignments için
+                          nlogn: a·n·log2(n) + b·n + c
+                          n2   : a·n² + b·n + c      (dejenere durumlar, örn. sorted + Lomuto)
+                      modellerini uydurur; göreli hataya göre ağırlıklandırılır
+                      (küçük n'ler büyüklerin gölgesinde kalmasın diye)
+- find_crossovers   : iki algoritmanın (her algoritma çifti için) uydurulmuş eğrilerinin kesiştiği n değerleri
+                      (göreli toleransın altındaki farklar kesişme sayılmaz)
+
+Örnek:
+    python scaling.py            # random senaryo, varsayılan bütçeyle tarama + uydurma
+"""
+
+import math
+import random
+from itertools import combinations
+
+from algorithms import generate_array
+from benchmark import cell_seed, measure_sort, resolve_algorithms
+from stats import least_squares
+
+# Uydurulan modeller: ad -> (temel fonksiyonlar, formül metni)
+COMPLEXITY_MODELS = {
+    "nlogn": ((lambda n: n * math.log2(n), lambda n: n, lambda n: 1.0), "a·n·log2(n) + b·n + c"),
+    "n2": ((lambda n: n * n, lambda n: n, lambda n: 1.0), "a·n² + b·n + c"),
+}
+
+# Ölçülen metrikler: sonuç sözlüğü anahtarları
+SCALING_METRICS = ("avg_time_ms", "avg_comp", "avg_assign")
+
+# find_crossovers: bu göreli farkın altındaki eğriler o noktada eşit sayılır
+CROSSOVER_RTOL = 1e-9
+
+
+def geometric_sizes(start: int = 10 ** 2, stop: int = 10 ** 8, per_decade: int = 2):
+    """start'tan stop'a (dahil) on katta per_decade adımlı geometrik boyutlar."""
+    steps = round(math.log10(stop / start) * per_decade)
+    return sorted({round(start * 10 ** (i / per_decade)) for i in range(steps + 1)})
+
+
+def run_scaling_sweep(sizes=None, mode: str = "random", repetitions: int = 3, cell_budget: float = 5.0,
+                      merge_engine: str = "bottomup", instrumentation: str = "split", backend: str = "list",
+                      seed: int = 0):
+    """
+    ALGORITHMS'daki her algoritmayı artan boyutlarda ayrı ayrı koşar.
+
+    Parametreler:
+        sizes       : boyutlar (None -> geometric_sizes())
+        cell_budget : bir (algo, n) hücresinin sıralama süreleri toplamı bu süreyi (sn)
+                      aşarsa hücre o tekrarda kesilir (satır tamamlanan tekrarların
+                      ortalamasıdır) ve o algoritma daha büyük n'lerde koşulmaz.
+                      Yalnızca measure_sort'un ölçtüğü sıralama süresi sayılır;
+                      dizi üretimi ve split modundaki sayaçlı koşu dahil değildir
+        instrumentation: varsayılan "split" — süre sayaçsız koşudan, sayaçlar ayrı
+                      koşudan gelir; böylece süre eğrisi sayaç maliyetini içermez
+
+    Dönüş:
+        {algo: [sonuç sözlüğü, ...]} — her sözlükte n ve SCALING_METRICS alanları
+    """
+    sizes = sizes or geometric_sizes()
+    algos, _ = resolve_algorithms(merge_engine, backend)
+
+    series = {}
+    for algo, sort_fn in algos:
+        rows = series.setdefault(algo, [])
+        for n in sizes:
+            time_total, comp_total, assign_total = 0.0, 0, 0
+            done = 0
+            over_budget = False
+            for rep in range(repetitions):
+                base_arr = generate_array(n, mode, backend=backend, seed=cell_seed(seed, n, mode, rep))
+                random.seed(cell_seed(seed, n, mode, rep, algo))
+                elapsed, counters, _ = measure_sort(sort_fn, base_arr, instrumentation)
+                time_total += elapsed
+                comp_total += counters.comparisons
+                assign_total += counters.assignments
+                done += 1
+                del base_arr
+                if time_total > cell_budget:
+                    over_budget = True
+                    break
+            rows.append({
+                "algo": algo, "n": n, "mode": mode, "repetitions": done,
+                "avg_time_ms": time_total / done * 1000.0,
+                "avg_comp": comp_total / done,
+                "avg_assign": assign_total / done,
+            })
+            if over_budget:
+                break
+    return series
+
+
+def fit_complexity(rows, metric: str, models=COMPLEXITY_MODELS):
+    """
+    rows'taki (n, metric) noktalarına her modeli uydurur.
+
+    Dönüş:
+        {model: {"coef": [a, b, c], "rel_rmse": göreli hata kareler ortalamasının kökü}}
+        Nokta sayısı model parametre sayısından azsa ya da metrik hep 0 ise boş sözlük.
+    """
+    points = [(r["n"], r[metric]) for r in rows if r[metric] and r["n"] > 1]
+    fits = {}
+    for name, (basis, _) in models.items():
+        if len(points) < len(basis):
+            continue
+        X = [[f(n) for f in basis] for n, _ in points]
+        ys = [y for _, y in points]
+        try:
+            coef = least_squares(X, ys, [1.0 / (y * y) for y in ys])
+        except ValueError:
+            continue
+        rel_errors = [(sum(c * x for c, x in zip(coef, row)) - y) / y for row, y in zip(X, ys)]
+        fits[name] = {"coef": coef, "rel_rmse": math.sqrt(sum(e * e for e in rel_errors) / len(rel_errors))}
+    return fits
+
+
+def best_fit(fits):
+    """En düşük göreli hatalı modelin adı (fits boşsa None)."""
+    return min(fits, key=lambda name: fits[name]["rel_rmse"]) if fits else None
+
+
+def evaluate(model: str, coef, n: float) -> float:
+    """Uydurulmuş modelin n'deki değeri."""
+    basis, _ = COMPLEXITY_MODELS[model]
+    return sum(c * f(n) for c, f in zip(coef, basis))
+
+
+def find_crossovers(fit_a, fit_b, lo: float, hi: float, steps: int = 400, rtol: float = CROSSOVER_RTOL):
+    """
+    İki (model, coef) eğrisinin [lo, hi] aralığında kesiştiği n değerleri.
+    Aralık geometrik olarak taranır, işaret değişimleri ikiye bölmeyle daraltılır.
+    Farkı rtol * max(|a|, |b|)'yi aşmayan noktalar "eşit" sayılır ve işaret
+    değişimi sayılmaz; özdeş (yalnızca kayan nokta gürültüsüyle ayrışan)
+    eğriler kesişme üretmez.
+
+    Dönüş:
+        [(n, önce_düşük_olan_indeks), ...] — indeks 0: fit_a, 1: fit_b (kesişmeden önce ucuz olan)
+    """
+    def sign(n):
+        a, b = evaluate(*fit_a, n), evaluate(*fit_b, n)
+        d = a - b
+        if abs(d) <= rtol * max(abs(a), abs(b)):
+            return 0
+        return -1 if d < 0 else 1
+
+    crossings = []
+    prev_n, prev_s = lo, sign(lo)   # son "eşit değil" nokta
+    for i in range(1, steps + 1):
+        n = lo * (hi / lo) ** (i / steps)
+        s = sign(n)
+        if s == 0:
+            continue
+        if prev_s != 0 and s != prev_s:
+            a, b = prev_n, n
+            for _ in range(60):
+                mid = math.sqrt(a * b)
+                if sign(mid) == prev_s:
+                    a = mid
+                else:
+                    b = mid
+            crossings.append((math.sqrt(a * b), 0 if prev_s < 0 else 1))
+        prev_n, prev_s = n, s
+    return crossings
+
+
+def curves_equal(fit_a, fit_b, lo: float, hi: float, rtol: float = CROSSOVER_RTOL, steps: int = 16) -> bool:
+    """İki eğri [lo, hi] aralığında rtol göreli toleransla ayırt edilemiyorsa True."""
+    for i in range(steps + 1):
+        n = lo * (hi / lo) ** (i / steps)
+        a, b = evaluate(*fit_a, n), evaluate(*fit_b, n)
+        if abs(a - b) > rtol * max(abs(a), abs(b)):
+            return False
+    return True
+
+
+def print_scaling_sweep(mode: str = "random", sizes=None, **options):
+    """Taramayı çalıştırır; ölçümleri, uydurulan sabitleri ve kesişme noktalarını yazar."""
+    series = run_scaling_sweep(sizes, mode, **options)
+
+    header = f"{'Algo':<12} {'n':>10} {'avg_time_ms':>14} {'avg_comp':>16} {'avg_assign':>16}"
+    print(header)
+    print("-" * len(header))
+    for rows in series.values():
+        for r in rows:
+            print(f"{r['algo']:<12} {r['n']:>10d} {r['avg_time_ms']:>14.3f} "
+                  f"{r['avg_comp']:>16.1f} {r['avg_assign']:>16.1f}")
+        print("-" * len(header))
+
+    print("\nUydurulan modeller (en iyi model * ile işaretli):")
+    best = {}
+    for metric in SCALING_METRICS:
+        for algo, rows in series.items():
+            fits = fit_complexity(rows, metric)
+            chosen = best_fit(fits)
+            if chosen is not None:
+                best[(algo, metric)] = (chosen, fits[chosen]["coef"])
+            for name, fit in fits.items():
+                a, b, c = fit["coef"]
+                mark = "*" if name == chosen else " "
+                print(f" {mark} {algo:<12} {metric:<12} {COMPLEXITY_MODELS[name][1]:<22} "
+                      f"a={a:.4g} b={b:.4g} c={c:.4g}  göreli_rmse={fit['rel_rmse']:.3f}")
+
+    measured = {algo: [r["n"] for r in rows] for algo, rows in series.items() if rows}
+    for algo_a, algo_b in combinations(measured, 2):
+        print(f"\nKesişme noktaları ({algo_a} vs {algo_b}, uydurulan eğrilerden):")
+        # yalnızca iki serinin de ölçüldüğü aralık; dışına taşan tahmin yapılmaz
+        # (cell_budget serileri farklı n'lerde durdurabilir)
+        lo = max(min(measured[algo_a]), min(measured[algo_b]))
+        hi = min(max(measured[algo_a]), max(measured[algo_b]))
+        if lo >= hi:
+            print(f"  ortak ölçüm aralığı yok ({algo_a}: {min(measured[algo_a])}..{max(measured[algo_a])}, "
+                  f"{algo_b}: {min(measured[algo_b])}..{max(measured[algo_b])})")
+            continue
+        for metric in SCALING_METRICS:
+            if (algo_a, metric) not in best or (algo_b, metric) not in best:
+                continue
+            crossings = find_crossovers(best[(algo_a, metric)], best[(algo_b, metric)], lo, hi)
+            if not crossings and curves_equal(best[(algo_a, metric)], best[(algo_b, metric)], lo, hi):
+                print(f"  {metric:<12}: kesişme yok ({lo}..{hi} aralığında eğriler aynı)")
+            elif not crossings:
+                a_val = evaluate(*best[(algo_a, metric)], lo)
+                b_val = evaluate(*best[(algo_b, metric)], lo)
+                winner = algo_a if a_val < b_val else algo_b
+                print(f"  {metric:<12}: kesişme yok ({lo}..{hi} aralığında {winner} daha düşük)")
+            for n, cheaper_before in crossings:
+                before = (algo_a, algo_b)[cheaper_before]
+                after = (algo_b, algo_a)[cheaper_before]
+                print(f"  {metric:<12}: n ≈ {n:,.0f} — öncesinde {before}, sonrasında {after} daha düşük")
+
+
+if __name__ == "__main__":
+    print_scaling_sweep()
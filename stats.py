@@ -0,0 +1,142 @@
+"""
+stats.py
+--------
+Benchmark örnekleri için küçük istatistik yardımcıları (yalnızca standart kütüphane).
+
+- describe      : ortalama, medyan, p95, standart sapma ve ortalamanın güven aralığı
+- t_critical    : Student t dağılımının iki yönlü kritik değeri (SciPy gerektirmez)
+- relative_ci_width : güven aralığı yarı genişliğinin ortalamaya oranı
+- welch_t_test  : iki örneklemin ortalamaları arasındaki farkın anlamlılığı
+"""
+
+import math
+import statistics
+from statistics import NormalDist
+
+
+def t_critical(confidence: float, dof: int) -> float:
+    """
+    İki yönlü t kritik değeri (örn. confidence=0.95, dof=n-1).
+
+    Normal dağılım kantilinden Cornish-Fisher açılımıyla hesaplanır; dof >= 5
+    için göreli hata binde birin altındadır (dof 3-4'te %1'in altında).
+    dof 1-2 için kesin formüller kullanılır.
+    """
+    if dof <= 0:
+        return math.inf
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    if dof <= 2:
+        # Küçük serbestlik derecelerinde açılım yakınsamaz: kesin formüller
+        p = 1 - confidence
+        if dof == 1:
+            return math.tan(math.pi * (0.5 - p / 2))
+        return math.sqrt(2 / (p * (2 - p)) - 2)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / dof + g2 / dof ** 2 + g3 / dof ** 3 + g4 / dof ** 4
+
+
+def percentile(sorted_values, q: float) -> float:
+    """Sıralı değerlerin q (0-100) yüzdeliği (doğrusal ara değerleme)."""
+    if not sorted_values:
+        return None
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def describe(values, confidence: float = 0.95):
+    """
+    Örneklerin özetini döner.
+
+    Dönüş:
+        {"count", "mean", "median", "p95", "stddev", "ci_low", "ci_high"}
+        (boş girdide count=0, diğerleri None; tek örnekte stddev / CI None)
+    """
+    values = sorted(values)
+    count = len(values)
+    if not count:
+        return {"count": 0, "mean": None, "median": None, "p95": None,
+                "stddev": None, "ci_low": None, "ci_high": None}
+
+    mean = statistics.fmean(values)
+    stddev = statistics.stdev(values) if count > 1 else None
+    half = t_critical(confidence, count - 1) * stddev / math.sqrt(count) if stddev is not None else None
+    return {
+        "count": count,
+        "mean": mean,
+        "median": statistics.median(values),
+        "p95": percentile(values, 95),
+        "stddev": stddev,
+        "ci_low": mean - half if half is not None else None,
+        "ci_high": mean + half if half is not None else None,
+    }
+
+
+def relative_ci_width(summary) -> float:
+    """Güven aralığı yarı genişliği / ortalama (hesaplanamıyorsa sonsuz)."""
+    if summary["ci_high"] is None or not summary["mean"]:
+        return math.inf
+    return (summary["ci_high"] - summary["mean"]) / abs(summary["mean"])
+
+
+def welch_t_test(baseline, candidate, confidence: float = 0.95):
+    """
+    Eşit varyans varsaymayan (Welch) iki örneklem t testi.
+
+    Dönüş:
+        (t, serbestlik_derecesi, anlamlı_mı) — t > 0: candidate ortalaması büyük.
+        Her iki örneklem de sabitse (varyans 0) ortalamalar farklıysa anlamlı sayılır.
+    """
+    if len(baseline) < 2 or len(candidate) < 2:
+        return None, None, False
+    mean_b, mean_c = statistics.fmean(baseline), statistics.fmean(candidate)
+    se_b = statistics.variance(baseline) / len(baseline)
+    se_c = statistics.variance(candidate) / len(candidate)
+    if se_b + se_c == 0:
+        if mean_b == mean_c:
+            return 0.0, None, False
+        return math.copysign(math.inf, mean_c - mean_b), None, True
+
+    t = (mean_c - mean_b) / math.sqrt(se_b + se_c)
+    dof = (se_b + se_c) ** 2 / (
+        (se_b ** 2 / (len(baseline) - 1) if se_b else 0.0) + (se_c ** 2 / (len(candidate) - 1) if se_c else 0.0)
+    )
+    return t, dof, abs(t) > t_critical(confidence, max(1, round(dof)))
+
+
+def least_squares(rows, ys, weights=None):
+    """
+    Ağırlıklı en küçük kareler: sum(w * (row . coef - y)^2) en küçük olacak katsayılar.
+
+    rows   : her gözlem için temel fonksiyon değerleri listesi (örn. [n log n, n, 1])
+    weights: gözlem ağırlıkları (None -> hepsi 1)
+
+    Normal denklemler kısmi pivotlu Gauss eliminasyonu ile çözülür (küçük
+    modeller için; NumPy gerektirmez). Tekil sistemde ValueError verir.
+    """
+    k = len(rows[0])
+    weights = weights or [1.0] * len(rows)
+    # A = X^T W X, b = X^T W y (artırılmış matris)
+    aug = [[0.0] * (k + 1) for _ in range(k)]
+    for row, y, w in zip(rows, ys, weights):
+        for i in range(k):
+            wi = w * row[i]
+            for j in range(k):
+                aug[i][j] += wi * row[j]
+            aug[i][k] += wi * y
+
+    for col in range(k):
+        pivot = max(range(col, k), key=lambda r: abs(aug[r][col]))
+        if aug[pivot][col] == 0:
+            raise ValueError("Tekil sistem: gözlem sayısı model için yetersiz")
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        for r in range(k):
+            if r != col:
+                factor = aug[r][col] / aug[col][col]
+                for c in range(col, k + 1):
+                    aug[r][c] -= factor * aug[col][c]
+    return [aug[i][k] / aug[i][i] for i in range(k)]
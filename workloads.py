@@ -0,0 +1,177 @@
+"""
+workloads.py
+------------
+Deney senaryoları (mode) için eklenebilir (pluggable) iş yükü kaydı.
+
+Her iş yükü bir ada ve varsayılan parametrelere sahiptir; generate_array ve
+benchmark fonksiyonlarındaki mode değeri bu adlardan biridir. Parametreler
+mode metnine eklenerek değiştirilebilir:
+
+    "nearly_sorted"                 -> varsayılan parametreler (%5 swap)
+    "nearly_sorted:swap_pct=1"      -> %1 swap
+    "zipf:s=1.5,distinct=100"       -> birden çok parametre
+
+Mode metni olduğu gibi sonuç tablolarına ve veri seti önbelleği dosya adlarına
+geçtiği için farklı parametreler ayrı senaryolar olarak görünür.
+
+Yeni iş yükü eklemek için:
+
+    @register_workload("benim_senaryom", "Açıklama", param=varsayılan)
+    def _benim_senaryom(n, rng, param):
+        return [...]                # n uzunluklu int listesi
+
+Üreticiler eleman başına Python döngüsü yerine toplu işlemler (range, liste
+çarpımı, rng.choices, dilim ataması) kullanır; rng random.Random örneği
+(veya tohum verilmediğinde random modülü) olur.
+"""
+
+import random
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+
+@dataclass(frozen=True)
+class Workload:
+    """Kayıtlı bir iş yükü: üretici fonksiyon ve varsayılan parametreleri."""
+    name: str
+    generator: object
+    description: str = ""
+    defaults: dict = field(default_factory=dict)
+
+
+WORKLOADS = {}
+
+
+def register_workload(name: str, description: str = "", **defaults):
+    """Üretici fonksiyonu WORKLOADS kaydına ekleyen dekoratör."""
+    def decorator(fn):
+        if name in WORKLOADS:
+            raise ValueError(f"İş yükü zaten kayıtlı: {name}")
+        WORKLOADS[name] = Workload(name, fn, description, dict(defaults))
+        return fn
+    return decorator
+
+
+def parse_workload(mode: str):
+    """
+    "ad:anahtar=değer,..." biçimindeki mode metnini çözer.
+
+    Dönüş:
+        (Workload, parametreler) — parametreler varsayılanlarla birleştirilmiş
+        ve varsayılan değerin tipine (int / float) çevrilmiştir.
+    """
+    name, _, arg_text = mode.partition(":")
+    if name not in WORKLOADS:
+        raise ValueError(f"Bilinmeyen mode: {mode}")
+    workload = WORKLOADS[name]
+
+    params = dict(workload.defaults)
+    for item in filter(None, arg_text.split(",")):
+        key, sep, value = item.partition("=")
+        key = key.strip()
+        if not sep or key not in params:
+            raise ValueError(f"{name} için geçersiz parametre: {item}")
+        params[key] = type(params[key])(value.strip())
+    return workload, params
+
+
+def workload_mode(name: str, **params) -> str:
+    """parse_workload'un tersi: varsayılandan farklı parametrelerle mode metni üretir."""
+    defaults = WORKLOADS[name].defaults
+    changed = [f"{k}={v}" for k, v in params.items() if defaults.get(k) != v]
+    return f"{name}:{','.join(changed)}" if changed else name
+
+
+def generate_workload(n: int, mode: str = "random", seed: int = None):
+    """
+    mode senaryosu için n uzunluklu tamsayı listesi üretir.
+
+    seed verilirse üretim bu tohumla tekrarlanabilirdir (global random durumuna
+    dokunulmaz); verilmezse global random modülü kullanılır.
+    """
+    workload, params = parse_workload(mode)
+    rng = random.Random(seed) if seed is not None else random
+    return workload.generator(n, rng, **params)
+
+
+# --------------------------------------------------
+# Temel senaryolar
+# --------------------------------------------------
+@register_workload("random", "Rastgele tamsayılar (ortalama durum)", max_value=10_000_000)
+def _random(n, rng, max_value):
+    if max_value < 0:
+        raise ValueError(f"random için max_value negatif olamaz: {max_value}")
+    return rng.choices(range(max_value + 1), k=n)
+
+
+@register_workload("sorted", "Önceden sıralı: 0, 1, ..., n-1")
+def _sorted(n, rng):
+    return list(range(n))
+
+
+@register_workload("reversed", "Ters sıralı: n, n-1, ..., 1")
+def _reversed(n, rng):
+    return list(range(n, 0, -1))
+
+
+# --------------------------------------------------
+# Kısmen sıralı ve tekrar ağırlıklı senaryolar
+# --------------------------------------------------
+@register_workload("nearly_sorted", "Sıralı dizide n * swap_pct / 100 rastgele çift yer değiştirmiş",
+                   swap_pct=5.0)
+def _nearly_sorted(n, rng, swap_pct):
+    if swap_pct < 0:
+        raise ValueError(f"nearly_sorted için swap_pct negatif olamaz: {swap_pct}")
+    arr = list(range(n))
+    if n < 2:
+        return arr
+    swaps = int(n * swap_pct / 100)
+    left = rng.choices(range(n), k=swaps)
+    right = rng.choices(range(n), k=swaps)
+    for i, j in zip(left, right):
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+@register_workload("few_unique", "Yalnızca 'distinct' farklı değer, rastgele sırada", distinct=10)
+def _few_unique(n, rng, distinct):
+    return rng.choices(range(max(1, distinct)), k=n)
+
+
+@register_workload("sawtooth", "Testere dişi: 'runs' adet art arda artan run", runs=8)
+def _sawtooth(n, rng, runs):
+    run_len = max(1, -(-n // max(1, runs)))     # tavan bölme
+    return (list(range(run_len)) * (n // run_len + 1))[:n]
+
+
+@register_workload("organ_pipe", "Org borusu: ortaya kadar artan, sonra azalan")
+def _organ_pipe(n, rng):
+    half = (n + 1) // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+@register_workload("zipf", "Zipf dağılımlı değerler: k. değerin olasılığı 1 / k^s", s=1.2, distinct=1000)
+def _zipf(n, rng, s, distinct):
+    distinct = max(1, distinct)
+    cum_weights = list(accumulate(1.0 / (k ** s) for k in range(1, distinct + 1)))
+    return rng.choices(range(distinct), cum_weights=cum_weights, k=n)
+
+
+# --------------------------------------------------
+# Düşmanca (adversarial) senaryolar
+# --------------------------------------------------
+@register_workload("median3_killer", "Musser'in median-of-3 killer dizisi (ilk/orta/son pivotu için kötü durum)")
+def _median3_killer(n, rng):
+    """
+    Musser (1997) yapısı: 2k uzunluklu (k çift) önekte median-of-3 pivot her
+    adımda bölümün en küçük elemanlarından birini seçer, bölmeler O(n) adım
+    sürer. Yapıya sığmayan son birkaç eleman (n, 4'ün katı değilse) sıralı eklenir.
+    """
+    k = (n // 2) & ~1
+    arr = [0] * (2 * k)
+    # tek i (1, 3, ..., k-1) için arr[i-1] = i, arr[i] = k + i; her i için arr[k+i-1] = 2i
+    arr[0:k:2] = range(1, k, 2)
+    arr[1:k:2] = range(k + 1, 2 * k, 2)
+    arr[k:] = range(2, 2 * k + 1, 2)
+    arr.extend(range(2 * k + 1, n + 1))
+    return arr